@@ -0,0 +1,139 @@
+"""Memory held by worker processes loading model weights by copy vs shared mapping
+
+Run from the repository root with: python -m benchmarks.bench_assets
+Memory is each process's proportional set size, so pages shared between
+workers are split between them rather than counted once per worker.
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from mancala.app.core.assets import publish
+from mancala.learning.model import MLPEvaluator, SharedMLPEvaluator
+
+BOARDS = [[4] * 6 + [0] + [4] * 6 + [0]] * 64
+PLAYERS = [0] * 64
+
+
+def pss_mib() -> float:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+
+    raise RuntimeError("Pss missing from smaps_rollup")
+
+
+def worker(mode: str, path: str, barrier, results) -> None:
+    baseline = pss_mib()
+    if mode == "copy":
+        model = MLPEvaluator.load(path)
+    else:
+        model = SharedMLPEvaluator(path)
+
+    # Touch every weight, as serving requests would
+    model.evaluate_batch(BOARDS, PLAYERS)
+
+    # Measure only once every worker holds the weights
+    barrier.wait()
+    results.put(pss_mib() - baseline)
+    barrier.wait()
+
+
+def measure(mode: str, path: str, workers: int) -> list[float]:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(mode, path, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    sizes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    return sizes
+
+
+def hot_swap(root: str, staging: str, swaps: int) -> None:
+    """Publish new versions while a reader evaluates nonstop"""
+    model = SharedMLPEvaluator(root, check_interval=0.0)
+    versions = set()
+    calls = errors = 0
+    slowest = 0.0
+    done = threading.Event()
+
+    def read():
+        nonlocal calls, errors, slowest
+        while not done.is_set():
+            start = time.perf_counter()
+            try:
+                model.evaluate_batch(BOARDS, PLAYERS)
+                versions.add(model.shared.version)
+
+            # A version pruned or half-published under the reader
+            except (OSError, ValueError):
+                errors += 1
+
+            slowest = max(slowest, time.perf_counter() - start)
+            calls += 1
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for _ in range(swaps):
+        time.sleep(0.05)
+        publish(root, "evaluator", staging)
+
+    time.sleep(0.05)
+    done.set()
+    reader.join()
+
+    print(
+        f"hot swap: {swaps} publishes during {calls:,} evaluations, "
+        f"{len(versions)} versions served, {errors} errors, "
+        f"slowest call {slowest * 1000:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes")
+    parser.add_argument(
+        "--hidden", type=int, default=2048, help="Width of both hidden layers"
+    )
+    parser.add_argument("--swaps", type=int, default=10, help="Hot swaps to run")
+    args = parser.parse_args()
+
+    model = MLPEvaluator.initialise(hidden=(args.hidden, args.hidden))
+    size = sum(value.nbytes for value in model.params.values()) / 2**20
+    print(f"{args.workers} workers, {size:.1f} MiB of weights")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        npz = os.path.join(tmp, "weights.npz")
+        model.save(npz)
+
+        staging = os.path.join(tmp, "staging")
+        model.save_arrays(staging)
+        root = os.path.join(tmp, "assets")
+        publish(root, "evaluator", staging)
+        del model
+
+        for mode, path in (("copy", npz), ("mapped", root)):
+            sizes = measure(mode, path, args.workers)
+            print(
+                f"{mode:>7}: {sum(sizes):8.1f} MiB total, "
+                f"{sum(sizes) / len(sizes):7.1f} MiB per worker"
+            )
+
+        hot_swap(root, staging, args.swaps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Agent move latency under bursts of concurrent games, fixed depth vs budgeted
+
+Run from the repository root with: python -m benchmarks.bench_budget
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+from mancala.app.api.dependencies import AGENT_COSTS, AGENT_DEPTHS
+from mancala.app.core.cache import LRUCache
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+from mancala.app.services.agent_cache import CachedAgent
+from mancala.app.services.budget import BudgetScheduler
+from mancala.app.services.game import choose_move_async
+
+
+def positions(count: int, seed: int = 0) -> list[Game]:
+    """Midgame positions reached by random play"""
+    rng = random.Random(seed)
+    games = []
+    while len(games) < count:
+        game = Game()
+        for _ in range(rng.randint(4, 16)):
+            moves = list(game.board.legal_moves(game.current_player))
+            if game.game_over or not moves:
+                break
+
+            game.make_move(rng.choice(moves))
+
+        if not game.game_over:
+            games.append(game)
+
+    return games
+
+
+async def burst(agent: Any, games: list[Game]) -> list[float]:
+    """Ask for every move at once, returning each one's latency"""
+    start = time.perf_counter()
+
+    async def timed(game: Game) -> float:
+        await choose_move_async(agent, game)
+        return time.perf_counter() - start
+
+    return await asyncio.gather(*(timed(game) for game in games))
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"{label:<10} p50 {p50:8.1f} ms  p99 {p99:8.1f} ms")
+
+
+async def run(concurrency: int, bursts: int, target: float, repeats: float) -> None:
+    # Draw from a smaller pool so some positions recur, as openings do
+    rng = random.Random(1)
+    pool = positions(max(1, int(concurrency * bursts * (1 - repeats))))
+    games = [rng.choice(pool) for _ in range(concurrency * bursts)]
+    batches = [games[i::bursts] for i in range(bursts)]
+
+    latencies = []
+    fixed = CachedAgent(SearchAgent(depth=5))
+    for batch in batches:
+        latencies.extend(await burst(fixed, batch))
+    report("depth 5", latencies)
+
+    # The same tiers as the service's agent
+    cache: LRUCache = LRUCache(maxsize=500_000)
+    scheduler = BudgetScheduler(
+        tiers=[CachedAgent(SearchAgent(depth=depth), cache) for depth in AGENT_DEPTHS],
+        fallback=CachedAgent(Agent(), cache),
+        target_latency=target,
+        costs=list(AGENT_COSTS),
+    )
+    latencies = []
+    for batch in batches:
+        latencies.extend(await burst(scheduler, batch))
+        await asyncio.sleep(0)
+    report("budgeted", latencies)
+
+    mix = ", ".join(
+        f"depth {depth} {count}"
+        for depth, count in zip(AGENT_DEPTHS, scheduler.decisions)
+    )
+    print(
+        f"{'':<10} {mix}, cache hits {scheduler.hits}, fallback {scheduler.fallbacks}"
+    )
+    estimates = ", ".join(
+        f"depth {depth} {scheduler._estimate(i) * 1e3:.1f} ms"
+        for i, depth in enumerate(AGENT_DEPTHS)
+    )
+    print(f"{'':<10} estimates: {estimates}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Moves requested at once"
+    )
+    parser.add_argument("--bursts", type=int, default=5, help="Bursts to run")
+    parser.add_argument(
+        "--target", type=float, default=0.25, help="Latency target in seconds"
+    )
+    parser.add_argument(
+        "--repeats",
+        type=float,
+        default=0.3,
+        help="Share of requested positions that were already seen",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.concurrency, args.bursts, args.target, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
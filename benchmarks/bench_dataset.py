@@ -0,0 +1,58 @@
+"""Records per second for self-play dataset generation, writing and reading
+
+Run from the repository root with: python -m benchmarks.bench_dataset
+"""
+
+import argparse
+import tempfile
+import time
+
+from mancala.learning.dataset import Dataset, DatasetWriter, generate, produce_chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=2000, help="Self-play games")
+    parser.add_argument("--workers", type=int, default=None, help="Producers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # End to end: self-play producers, dedup and streaming writes
+        start = time.perf_counter()
+        writer = generate(f"{tmp}/selfplay", args.games, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        print(
+            f"generate: {writer.count:,} records "
+            f"({writer.duplicates:,} duplicates) "
+            f"in {elapsed:.2f}s = {writer.count / elapsed:,.0f} records/s"
+        )
+
+        # Writer alone, replaying one pre-built chunk without dedup
+        chunk = produce_chunk(seed=1, games=200, epsilon=0.2)
+        rows = len(chunk["players"])
+        raw = DatasetWriter(f"{tmp}/raw", width=chunk["boards"].shape[1], dedup=False)
+        repeats = 200
+        start = time.perf_counter()
+        for _ in range(repeats):
+            raw.append(chunk)
+        raw.close()
+        elapsed = time.perf_counter() - start
+        print(f"write:    {rows * repeats / elapsed:,.0f} records/s")
+
+        # Memory-mapped read-back with a full pass over every column
+        start = time.perf_counter()
+        dataset = Dataset(f"{tmp}/raw")
+        checksum = (
+            int(dataset.boards.sum())
+            + int(dataset.players.sum())
+            + int(dataset.moves.sum())
+            + int(dataset.outcomes.sum())
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"read:     {len(dataset) / elapsed:,.0f} records/s (checksum {checksum})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Evaluations per second for the position evaluators at several batch sizes
+
+Run from the repository root with: python -m benchmarks.bench_evaluation
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mancala.app.models.domain.evaluation import HeuristicEvaluator
+from mancala.learning.model import MLPEvaluator
+from mancala.learning.selfplay import generate_samples
+
+
+def measure(evaluate, boards, players, batch_size: int, min_seconds: float) -> float:
+    """Return evaluations per second for one evaluator and batch size"""
+    batches = [
+        (boards[i : i + batch_size], players[i : i + batch_size])
+        for i in range(0, len(boards) - batch_size + 1, batch_size)
+    ]
+    evaluated = 0
+    start = time.perf_counter()
+
+    while time.perf_counter() - start < min_seconds:
+        for batch_boards, batch_players in batches:
+            evaluate(batch_boards, batch_players)
+            evaluated += len(batch_boards)
+
+    return evaluated / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--weights", default=None, help="Trained .npz weights")
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 8, 64, 512, 4096]
+    )
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per case")
+    args = parser.parse_args()
+
+    boards, players, _ = generate_samples(200, seed=1)
+    order = np.random.default_rng(1).permutation(len(boards))
+    boards, players = boards[order], players[order]
+    board_lists, player_lists = boards.tolist(), players.tolist()
+
+    model = (
+        MLPEvaluator.load(args.weights) if args.weights else MLPEvaluator.initialise()
+    )
+    heuristic = HeuristicEvaluator()
+
+    print(f"{'batch':>6} {'mlp (ndarray)':>15} {'mlp (lists)':>13} {'heuristic':>11}")
+    for batch_size in args.batch_sizes:
+        mlp_array = measure(model.predict, boards, players, batch_size, args.seconds)
+        mlp_lists = measure(
+            model.evaluate_batch, board_lists, player_lists, batch_size, args.seconds
+        )
+        heuristic_rate = measure(
+            heuristic.evaluate_batch,
+            board_lists,
+            player_lists,
+            batch_size,
+            args.seconds,
+        )
+        print(
+            f"{batch_size:>6} {mlp_array:>15,.0f} {mlp_lists:>13,.0f} "
+            f"{heuristic_rate:>11,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Throughput and memory of streaming finished games out of the store
+
+Run from the repository root with: python -m benchmarks.bench_export
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from uuid import uuid4
+
+from mancala.app.models.domain.enum import (
+    ExportFormatEnum,
+    GameStatusEnum,
+    PlayerTypeEnum,
+)
+from mancala.app.models.domain.game import Game
+from mancala.app.services.export import export_stream
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.storage import GameRecord, PackedGameStore
+
+TYPES = (PlayerTypeEnum.HUMAN, PlayerTypeEnum.AGENT)
+
+
+def finished_game(rng: random.Random) -> tuple[Game, list[int]]:
+    """A game played to the end with random moves"""
+    game = Game()
+    moves = []
+    while not game.game_over:
+        move = rng.choice(list(game.board.legal_moves(game.current_player)))
+        game.make_move(move)
+        moves.append(move)
+
+    return game, moves
+
+
+async def populate(service: AsyncGameService, games: int) -> None:
+    rng = random.Random(0)
+    played = [finished_game(rng) for _ in range(1000)]
+    for i in range(games):
+        game, moves = played[i % len(played)]
+        record = GameRecord(game, TYPES, list(moves), (f"player{i % 997}", "bot"))
+
+        game_id = uuid4()
+        await service.store.put(game_id, record)
+        service.index.add(game_id, record.player_names, GameStatusEnum.ACTIVE)
+        service.index.update_status(game_id, GameStatusEnum.OVER)
+
+
+async def drain(service: AsyncGameService, fmt: ExportFormatEnum) -> int:
+    """Export everything, returning the bytes produced"""
+    written = 0
+    async for data in export_stream(service.finished_games(), fmt):
+        written += len(data)
+
+    return written
+
+
+async def run(games: int) -> None:
+    for label, store in (("memory", None), ("packed", PackedGameStore())):
+        service = AsyncGameService(store=store)
+        await populate(service, games)
+
+        for fmt in ExportFormatEnum:
+            start = time.perf_counter()
+            written = await drain(service, fmt)
+            elapsed = time.perf_counter() - start
+
+            # Peak memory measured separately, as tracing slows the export down
+            tracemalloc.start()
+            await drain(service, fmt)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{label:<7} {fmt.value:<7} {games / elapsed:>10,.0f} games/s  "
+                f"{written / games:6.1f} bytes/game  peak {peak / 1e6:5.1f} MB"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200_000, help="Finished games")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.games))
+
+
+if __name__ == "__main__":
+    main()
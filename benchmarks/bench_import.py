@@ -0,0 +1,56 @@
+"""Cold-start import time of the CLI, the engine and the API worker
+
+Run from the repository root with: python -m benchmarks.bench_import
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "engine": "mancala.app.models.domain.game",
+    "cli": "mancala.cli.main",
+    "worker": "mancala.app.main",
+}
+
+# Imports the target in a fresh interpreter and reports what it dragged in
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, "pydantic" in sys.modules, "fastapi" in sys.modules)
+"""
+
+
+def cold_start(module: str) -> tuple[float, bool, bool]:
+    """Import a module in a new interpreter and return (seconds, pydantic, fastapi)"""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+
+    return float(output[0]), output[1] == "True", output[2] == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per target")
+    args = parser.parse_args()
+
+    for name, module in TARGETS.items():
+        runs = [cold_start(module) for _ in range(args.runs)]
+        median = statistics.median(seconds for seconds, _, _ in runs)
+        _, pydantic, fastapi = runs[-1]
+        print(
+            f"{name:<7} {median * 1000:7.1f} ms  "
+            f"pydantic={'yes' if pydantic else 'no'} "
+            f"fastapi={'yes' if fastapi else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
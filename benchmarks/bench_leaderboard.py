@@ -0,0 +1,92 @@
+"""Leaderboard reads and updates kept incrementally vs recomputed from history
+
+Run from the repository root with: python -m benchmarks.bench_leaderboard
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.services.stats import StatsService
+from mancala.app.services.storage import GameRecord, InMemoryGameStore
+
+TYPES = (PlayerTypeEnum.HUMAN, PlayerTypeEnum.HUMAN)
+
+
+def finished_game(rng: random.Random) -> Game:
+    """A finished game with a random final score"""
+    game = Game()
+    board = game.board
+    first, second = board.topology.store_indices
+    total = sum(board.board)
+    cells = [0] * len(board.board)
+    cells[first] = rng.randint(0, total)
+    cells[second] = total - cells[first]
+    board.load(bytes(cells))
+    game.game_over = True
+    return game
+
+
+async def run(games: int, players: int, top: int, seed: int) -> None:
+    rng = random.Random(seed)
+    names = [f"player{i}" for i in range(players)]
+    service = StatsService(InMemoryGameStore())
+
+    results = []
+    start = time.perf_counter()
+    for _ in range(games):
+        pair = tuple(rng.sample(names, 2))
+        record = GameRecord(finished_game(rng), TYPES, player_names=pair)
+        await service.record(record)
+        results.append((pair, record.game.get_winner()))
+
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} games, {players:,} players")
+    print(f"  incremental updates: {games / elapsed:12,.0f} games/s")
+
+    reads = 1000
+    start = time.perf_counter()
+    for _ in range(reads):
+        service.top(top)
+
+    elapsed = time.perf_counter() - start
+    print(f"  incremental top {top}:  {elapsed / reads * 1e6:12,.1f} us/read")
+
+    # A page near the bottom of the ranking costs the same as the first
+    offset = max(0, len(service.leaderboard) - top)
+    start = time.perf_counter()
+    for _ in range(reads):
+        service.top(top, offset)
+
+    elapsed = time.perf_counter() - start
+    print(f"  incremental last page: {elapsed / reads * 1e6:10,.1f} us/read")
+
+    # What a read costs without the aggregates: count wins over every game
+    start = time.perf_counter()
+    wins = Counter(pair[winner] for pair, winner in results if winner in (0, 1))
+    rescanned = [name for name, _ in wins.most_common(top)]
+    elapsed = time.perf_counter() - start
+    print(f"  rescan top {top}:       {elapsed * 1e6:12,.1f} us/read")
+
+    leaders = [stats.name for stats in service.top(top)]
+    if [wins[name] for name in leaders] != [wins[name] for name in rescanned]:
+        raise AssertionError("Leaderboard disagrees with a full rescan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200_000, help="Finished games")
+    parser.add_argument("--players", type=int, default=20_000, help="Distinct names")
+    parser.add_argument("--top", type=int, default=20, help="Leaderboard page size")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.games, args.players, args.top, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Page latency of indexed game listing versus a full scan, at 1M games
+
+Run from the repository root with: python -m benchmarks.bench_listing
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from mancala.app.models.domain.enum import GameStatusEnum, PlayerTypeEnum
+from mancala.app.models.domain.player import Player
+from mancala.app.services.game import AsyncGameService
+
+
+async def run(games: int, size: int) -> None:
+    rng = random.Random(0)
+    service = AsyncGameService()
+    names = [f"player{i}" for i in range(1000)]
+
+    start = time.perf_counter()
+    ids = []
+    for _ in range(games):
+        player1 = Player(name=rng.choice(names), type=PlayerTypeEnum.HUMAN)
+        player2 = Player(name=rng.choice(names), type=PlayerTypeEnum.HUMAN)
+        ids.append(await service.create(player1, player2))
+
+    # Finish a tenth of them, as a move ending the game would
+    for game_id in rng.sample(ids, games // 10):
+        service.index.update_status(game_id, GameStatusEnum.OVER)
+
+    elapsed = time.perf_counter() - start
+    print(f"indexed {games:,} games in {elapsed:.1f}s")
+
+    queries = {
+        "all": {},
+        "over": {"status": GameStatusEnum.OVER},
+        "player": {"player": "player7"},
+        "player+active": {"player": "player7", "status": GameStatusEnum.ACTIVE},
+    }
+    for label, query in queries.items():
+        # First page, then ten pages deep by following cursors
+        start = time.perf_counter()
+        page = await service.list_games(**query, limit=size)
+        first = time.perf_counter() - start
+
+        for _ in range(10):
+            if page.next_cursor is None:
+                break
+
+            page = await service.list_games(
+                **query, cursor=page.next_cursor, limit=size
+            )
+
+        start = time.perf_counter()
+        if page.next_cursor is not None:
+            await service.list_games(**query, cursor=page.next_cursor, limit=size)
+
+        deep = time.perf_counter() - start
+        print(
+            f"{label:<14} total {page.total:>9,}  "
+            f"page 1 {first * 1000:6.2f} ms  page 12 {deep * 1000:6.2f} ms"
+        )
+
+    # What a listing cost without the indexes: filter every stored record
+    records = service.store.records
+    start = time.perf_counter()
+    matches = [
+        game_id
+        for game_id, record in records.items()
+        if "player7" in record.player_names
+    ]
+    elapsed = time.perf_counter() - start
+    print(f"full scan      {elapsed * 1000:6.2f} ms for one player ({len(matches):,})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1_000_000, help="Open games")
+    parser.add_argument("--size", type=int, default=50, help="Page size")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.games, args.size))
+
+
+if __name__ == "__main__":
+    main()
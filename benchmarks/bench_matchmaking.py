@@ -0,0 +1,72 @@
+"""Join and pairing throughput of the matchmaking queue with 100k players
+
+Run from the repository root with: python -m benchmarks.bench_matchmaking
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.matchmaking import Matchmaker
+
+
+async def timed_joins(
+    matchmaker: Matchmaker, ratings: list[int]
+) -> tuple[float, list[float]]:
+    """Join one player per rating, returning total seconds and per-join times"""
+    latencies = []
+    start = time.perf_counter()
+    for i, rating in enumerate(ratings):
+        joined = time.perf_counter()
+        await matchmaker.join(f"player{i}", rating)
+        latencies.append(time.perf_counter() - joined)
+
+    return time.perf_counter() - start, latencies
+
+
+def report(label: str, elapsed: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(
+        f"{label:<10} {len(latencies) / elapsed:>10,.0f} joins/s  "
+        f"p50 {p50:6.1f} us  p99 {p99:6.1f} us"
+    )
+
+
+async def run(players: int) -> None:
+    rng = random.Random(0)
+
+    # Worst case for the bucket index: every player waits in a bucket of their own,
+    # then a second wave pairs against that full queue
+    matchmaker = Matchmaker(AsyncGameService(), bucket_width=1, max_spread=0)
+    ratings = rng.sample(range(10 * players), players)
+    elapsed, latencies = await timed_joins(matchmaker, ratings)
+    report("queue", elapsed, latencies)
+    print(f"{'':<10} {matchmaker.queued():,} players waiting")
+
+    rng.shuffle(ratings)
+    elapsed, latencies = await timed_joins(matchmaker, ratings)
+    report("pair", elapsed, latencies)
+    print(f"{'':<10} {matchmaker.queued():,} players waiting")
+
+    # Typical traffic: normally distributed ratings in default-width buckets
+    matchmaker = Matchmaker(AsyncGameService())
+    ratings = [max(0, int(rng.gauss(1500, 350))) for _ in range(players)]
+    elapsed, latencies = await timed_joins(matchmaker, ratings)
+    report("steady", elapsed, latencies)
+    print(f"{'':<10} {matchmaker.queued():,} players waiting")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100_000, help="Players")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.players))
+
+
+if __name__ == "__main__":
+    main()
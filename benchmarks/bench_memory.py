@@ -0,0 +1,153 @@
+"""Bytes per open game, before and after slotting and packing game state
+
+Run from the repository root with: python -m benchmarks.bench_memory
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.topology import get_topology
+from mancala.app.services.storage import GameRecord, PackedGameStore
+
+
+class DictBoard:
+    """The board as it was before slotting: a __dict__ and a list of ints"""
+
+    def __init__(self, cells: list[int], pits: int = 6, stones: int = 6) -> None:
+        self.pits = pits
+        self.stones = stones
+        self.board = list(cells)
+        self.topology = get_topology(pits)
+        self.pit_totals = [sum(cells[:pits]), sum(cells[pits + 1 : 2 * pits + 1])]
+
+
+class DictGame:
+    """The game as it was before slotting"""
+
+    def __init__(self, game: Game) -> None:
+        self.board = DictBoard(list(game.board.board))
+        self.current_player = game.current_player
+        self.game_over = game.game_over
+
+
+@dataclass
+class DictRecord:
+    """The store record as it was before slotting"""
+
+    game: DictGame
+    player_types: tuple[PlayerTypeEnum, PlayerTypeEnum]
+    moves: list[int] = field(default_factory=list)
+
+
+def play_random(game: Game, moves: int, rng: random.Random) -> list[int]:
+    """Play up to `moves` random moves and return them"""
+    played = []
+    for _ in range(moves):
+        if game.game_over:
+            break
+
+        move = rng.choice(list(game.board.legal_moves(game.current_player)))
+        game.make_move(move)
+        played.append(move)
+
+    return played
+
+
+def measure(build, count: int) -> float:
+    """Average traced bytes kept alive per object returned by `build`"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding them is not part of the per-game cost
+    container = kept.__sizeof__()
+    return (after - before - container) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=100_000, help="Open games")
+    parser.add_argument("--moves", type=int, default=10, help="Moves into each game")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+
+    def midgame(_: int) -> Game:
+        game = Game()
+        play_random(game, args.moves, rng)
+        return game
+
+    def record(_: int) -> tuple:
+        game = Game()
+        moves = play_random(game, args.moves, rng)
+        player_types = (PlayerTypeEnum.HUMAN, PlayerTypeEnum.AGENT)
+        return uuid4(), GameRecord(game, player_types, moves)
+
+    # The same kind of positions in the unslotted layout, played untraced
+    played = []
+    for _ in range(args.games):
+        game = Game()
+        played.append((game, play_random(game, args.moves, rng)))
+
+    dict_games = measure(lambda i: DictGame(played[i][0]), args.games)
+    dict_records = measure(
+        lambda i: (
+            uuid4(),
+            DictRecord(
+                DictGame(played[i][0]),
+                (PlayerTypeEnum.HUMAN, PlayerTypeEnum.AGENT),
+                list(played[i][1]),
+            ),
+        ),
+        args.games,
+    )
+
+    print("before (unslotted, list cells):")
+    print(f"  mid-game:     {dict_games:,.0f} bytes")
+    print(f"  store record: {dict_records:,.0f} bytes (incl. id)")
+
+    store_record = measure(record, args.games)
+    print("after:")
+    print(f"  new game:     {measure(lambda _: Game(), args.games):,.0f} bytes")
+    print(f"  mid-game:     {measure(midgame, args.games):,.0f} bytes")
+    print(f"  store record: {store_record:,.0f} bytes (incl. id)")
+
+    # Packed rows: the records are rebuilt on demand, so only the store stays
+    records = [record(i) for i in range(args.games)]
+    store = PackedGameStore()
+
+    async def fill() -> None:
+        for _, game_record in records:
+            await store.put(uuid4(), game_record)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    asyncio.run(fill())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    packed = (after - before) / args.games
+    print(f"  packed store: {packed:,.0f} bytes (incl. id)")
+    print(f"packed store vs unslotted record: {dict_records / packed:.1f}x smaller")
+
+    # Compactness must not cost the search hot path
+    game = midgame(0)
+    repeats = 200_000
+    start = time.perf_counter()
+    for _ in range(repeats):
+        clone = game.copy()
+        clone.make_move(next(clone.board.legal_moves(clone.current_player)))
+    elapsed = time.perf_counter() - start
+    print(f"copy + move:    {repeats / elapsed:,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Speedup of root-split parallel search over a single process, per worker count
+
+Run from the repository root with: python -m benchmarks.bench_parallel_search
+"""
+
+import argparse
+import os
+import time
+
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+# Standard test positions: the opening and lines into the early and middle game,
+# as 1-based pits for whoever is to move
+LINES = {
+    "opening": [],
+    "extra turn": [1],
+    "early": [3, 4, 6, 2],
+    "capture": [6, 1, 5, 2, 4, 6],
+    "middle": [3, 4, 1, 6, 2, 5, 6, 1, 3, 2],
+}
+
+
+def position(line: list[int]) -> Game:
+    game = Game()
+    for pit in line:
+        offset = 0 if game.current_player == 0 else game.board.pits + 1
+        game.make_move(offset + pit - 1)
+
+    return game
+
+
+def time_search(agent: SearchAgent, game: Game, repeat: int) -> tuple[float, int]:
+    """Best time over `repeat` searches, and the chosen move"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        move = agent.choose_move(game)
+        best = min(best, time.perf_counter() - start)
+
+    return best, move
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=6, help="Search depth")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Worker counts to try (default: powers of two up to the core count)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs each")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers = args.workers or [2**i for i in range(cores.bit_length()) if 2**i > 1]
+    print(f"depth {args.depth}, {cores} cores")
+
+    games = {label: position(line) for label, line in LINES.items()}
+    baseline = {}
+    for label, game in games.items():
+        baseline[label] = time_search(SearchAgent(depth=args.depth), game, args.repeat)
+
+    total = sum(elapsed for elapsed, _ in baseline.values())
+    print(f"{'1 process':<12} {total * 1000 / len(games):8.1f} ms/move")
+
+    for count in workers:
+        agent = SearchAgent(depth=args.depth, workers=count)
+        agent.choose_move(Game())  # Start the pool outside the timings
+
+        elapsed = 0.0
+        for label, game in games.items():
+            seconds, move = time_search(agent, game, args.repeat)
+            if move != baseline[label][1]:
+                raise AssertionError(f"{label}: {move} != {baseline[label][1]}")
+
+            elapsed += seconds
+
+        print(
+            f"{f'{count} workers':<12} {elapsed * 1000 / len(games):8.1f} ms/move  "
+            f"speedup {total / elapsed:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-frame cost of the CLI move animation: full reprint vs differential render
+
+Run from the repository root with: python -m benchmarks.bench_render
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from mancala.cli.main import print_board, print_game_title, print_player_info
+from mancala.cli.render import (
+    Colors,
+    TerminalRenderer,
+    board_lines,
+    player_lines,
+    title_lines,
+)
+
+
+def animation_boards(pits: int = 6, stones: int = 6) -> list[list[int]]:
+    """Board states while sowing the third pit of the opening position"""
+    board = [stones] * pits + [0] + [stones] * pits + [0]
+    board[2] = 0
+    frames = []
+    for index in range(3, 3 + stones):
+        board[index] += 1
+        frames.append(list(board))
+
+    return frames
+
+
+def full_redraw(boards: list[list[int]]) -> tuple[float, int]:
+    """The previous approach: clear, then reprint the whole screen per stone"""
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        for board in boards:
+            print("\033[H\033[J", end="")
+            print_game_title()
+            print_player_info(1, "Player 1", Colors.CYAN)
+            print_player_info(2, "Player 2", Colors.YELLOW)
+            print_board(board, 6, 0, None)
+
+    return time.perf_counter() - start, len(out.getvalue())
+
+
+def differential(boards: list[list[int]]) -> tuple[float, int]:
+    out = io.StringIO()
+    renderer = TerminalRenderer(out)
+    start = time.perf_counter()
+
+    # As in the CLI, the unchanging header is laid out once per animation
+    header = title_lines() + player_lines(["Player 1", "Player 2"], 0)
+    for board in boards:
+        renderer.render(header + board_lines(board, 6, 0, None))
+
+    return time.perf_counter() - start, len(out.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=500, help="Animations to run")
+    args = parser.parse_args()
+
+    boards = animation_boards() * args.repeats
+    frames = len(boards)
+
+    print(f"{'renderer':<14} {'ms/frame':>9} {'bytes/frame':>12}")
+    for name, run in (("full redraw", full_redraw), ("differential", differential)):
+        elapsed, size = run(boards)
+        print(f"{name:<14} {elapsed / frames * 1000:>9.3f} {size / frames:>12.0f}")
+
+    print("(full redraw previously also spawned a 'clear' subprocess per frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Cost per schedule, reschedule and expiry on the timer wheel as it fills
+
+Run from the repository root with: python -m benchmarks.bench_timers
+"""
+
+import argparse
+import random
+import time
+
+from mancala.app.core.timers import TimerWheel
+
+
+def run(pending: int, rng: random.Random) -> None:
+    wheel = TimerWheel(resolution=0.1)
+    horizon = 3600.0  # Deadlines spread over an hour, like idle timeouts
+
+    start = time.perf_counter()
+    timers = [wheel.schedule(rng.uniform(0, horizon), i) for i in range(pending)]
+    schedule = (time.perf_counter() - start) / pending
+
+    # A move replaces a game's deadline: cancel plus schedule
+    moves = min(pending, 100_000)
+    start = time.perf_counter()
+    for i in rng.sample(range(pending), moves):
+        wheel.cancel(timers[i])
+        timers[i] = wheel.schedule(rng.uniform(0, horizon), i)
+    reschedule = (time.perf_counter() - start) / moves
+
+    # Walk the whole hour in one-tick steps, as the background task would
+    start = time.perf_counter()
+    expired = 0
+    for tick in range(1, int(horizon / wheel.resolution) + 2):
+        expired += len(wheel.advance(tick * wheel.resolution))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{pending:>10,} pending  schedule {schedule * 1e6:5.2f} us  "
+        f"reschedule {reschedule * 1e6:5.2f} us  "
+        f"expire {elapsed / expired * 1e6:5.2f} us/timer ({expired:,})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for size in args.sizes:
+        run(size, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,98 @@
-from typing import Generator
+import os
+from functools import lru_cache
 
-from mancala.app.services.game import GameService
+from mancala.app.core.assets import ASSETS_ENV, current_version
+from mancala.app.core.cache import LRUCache
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.evaluation import Evaluator, HeuristicEvaluator
+from mancala.app.models.domain.search import SearchAgent
+from mancala.app.services.agent_cache import CachedAgent, PositionKey, load_cache
+from mancala.app.services.analysis import AnalysisService
+from mancala.app.services.budget import BudgetScheduler
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.matchmaking import Matchmaker
+from mancala.app.services.storage import PackedGameStore
 
+# Optional file the agent move cache is warmed from and saved back to
+AGENT_CACHE_ENV = "MANCALA_AGENT_CACHE"
 
-def get_game_service() -> Generator[GameService, None, None]:
-    service = GameService()
-    yield service
+# Processes each analysis search is split across (searches run inline if 1)
+SEARCH_WORKERS_ENV = "MANCALA_SEARCH_WORKERS"
+
+# Seconds without a move before a game is forfeited, and then archived
+IDLE_TIMEOUT = 30 * 60
+
+# Archived games kept listed and exportable, oldest dropped first
+ARCHIVE_LIMIT = 1_000_000
+
+# Seconds an agent move may take, queueing included, and the search depths
+# tried within it, strongest first, with rough per-move costs to start from
+AGENT_TARGET_LATENCY = 0.25
+AGENT_DEPTHS = (5, 4, 2)
+AGENT_COSTS = (0.05, 0.01, 0.001)
+
+
+@lru_cache
+def get_evaluator() -> Evaluator:
+    # Published weights are mapped from the assets directory and shared by
+    # every worker; without them the searches fall back to the heuristic
+    root = os.environ.get(ASSETS_ENV)
+    if root and current_version(root, "evaluator") is not None:
+        from mancala.learning.model import SharedMLPEvaluator
+
+        return SharedMLPEvaluator(root)
+
+    return HeuristicEvaluator()
+
+
+@lru_cache
+def get_agent_cache() -> LRUCache[PositionKey, int]:
+    # Shared by every game in the worker, so common positions are decided once
+    cache: LRUCache[PositionKey, int] = LRUCache(maxsize=500_000)
+
+    path = os.environ.get(AGENT_CACHE_ENV)
+    if path:
+        load_cache(cache, path)
+
+    return cache
+
+
+@lru_cache
+def get_agent() -> BudgetScheduler:
+    # Deeper searches while the worker is quiet, shallower ones under load
+    cache = get_agent_cache()
+    evaluator = get_evaluator()
+    return BudgetScheduler(
+        tiers=[
+            CachedAgent(SearchAgent(evaluator, depth), cache) for depth in AGENT_DEPTHS
+        ],
+        fallback=CachedAgent(Agent(), cache),
+        target_latency=AGENT_TARGET_LATENCY,
+        costs=list(AGENT_COSTS),
+    )
+
+
+@lru_cache
+def get_game_service() -> AsyncGameService:
+    # One service per worker, so games outlive the request that created them.
+    # Open games are kept as packed rows, and finished games move to a packed
+    # archive once idle, where listings and exports still find them
+    return AsyncGameService(
+        store=PackedGameStore(),
+        agent=get_agent(),
+        idle_timeout=IDLE_TIMEOUT,
+        archive=PackedGameStore(),
+        archive_limit=ARCHIVE_LIMIT,
+    )
+
+
+@lru_cache
+def get_analysis_service() -> AnalysisService:
+    # Shared so the position cache is reused across games and requests
+    workers = int(os.environ.get(SEARCH_WORKERS_ENV, "1"))
+    return AnalysisService(agent=SearchAgent(get_evaluator(), depth=6, workers=workers))
+
+
+@lru_cache
+def get_matchmaker() -> Matchmaker:
+    return Matchmaker(get_game_service())
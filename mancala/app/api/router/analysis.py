@@ -0,0 +1,49 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+
+from mancala.app.api.dependencies import get_analysis_service, get_game_service
+from mancala.app.models.api import AnalysisJobResponse
+from mancala.app.services.analysis import AnalysisService
+from mancala.app.services.game import AsyncGameService
+
+router = APIRouter()
+
+
+@router.post("/{game_id}/analysis", response_model=AnalysisJobResponse, status_code=202)
+async def start_analysis(
+    game_id: UUID = Path(...),
+    games: AsyncGameService = Depends(get_game_service),
+    analysis: AnalysisService = Depends(get_analysis_service),
+) -> AnalysisJobResponse:
+    """Queue an analysis of every move played so far"""
+    try:
+        record = await games.get_record(game_id)
+
+    except ValueError:
+        raise HTTPException(status_code=404, detail=f"Game with ID {game_id} not found")
+
+    board = record.game.board
+    job = analysis.submit(game_id, record.moves, board.pits, board.stones)
+    return job.to_response()
+
+
+@router.get("/{game_id}/analysis/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis(
+    game_id: UUID = Path(...),
+    job_id: UUID = Path(...),
+    analysis: AnalysisService = Depends(get_analysis_service),
+) -> AnalysisJobResponse:
+    """Poll an analysis job for progress and per-move annotations"""
+    try:
+        job = analysis.get_job(job_id)
+
+    except ValueError as err:
+        raise HTTPException(status_code=404, detail=str(err))
+
+    if job.game_id != game_id:
+        raise HTTPException(
+            status_code=404, detail=f"Analysis job with ID {job_id} not found"
+        )
+
+    return job.to_response()
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.models.domain.enum import ExportFormatEnum
+from mancala.app.services.export import CURSOR_HEADER, MEDIA_TYPES, export_stream
+from mancala.app.services.game import AsyncGameService
+
+router = APIRouter()
+
+
+@router.get("/games")
+async def export_games(
+    since: int | None = Query(None, ge=0, description="Cursor of the last export"),
+    format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON),
+    games: AsyncGameService = Depends(get_game_service),
+) -> StreamingResponse:
+    """Stream every game finished since the cursor, oldest first"""
+    until = games.index.last_key
+    chunks = games.finished_games(since, until)
+    return StreamingResponse(
+        export_stream(chunks, format),
+        media_type=MEDIA_TYPES[format],
+        headers={CURSOR_HEADER: str(max(until, since or 0))},
+    )
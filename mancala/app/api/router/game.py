@@ -1,33 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
+from datetime import datetime
 from uuid import UUID
 
-from mancala.app.models.api import GameCreate, GameState, MoveRequest, MoveResponse
-from mancala.app.services.game import GameService
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+
 from mancala.app.api.dependencies import get_game_service
+from mancala.app.models.api import (
+    GameCreate,
+    GameState,
+    GameStatusResponse,
+    MoveRequest,
+    MoveResponse,
+    PaginatedResponse,
+)
+from mancala.app.models.domain.enum import GameStatusEnum, PlayerEnum, PlayerTypeEnum
+from mancala.app.models.domain.player import Player
+from mancala.app.services.clock import TimeControl
+from mancala.app.services.game import AsyncGameService
 
 router = APIRouter()
 
+PLAYERS = (PlayerEnum.PLAYER1, PlayerEnum.PLAYER2)
+
+
+def _status_response(state: GameState) -> GameStatusResponse:
+    pits = (len(state.board) - 2) // 2
+    return GameStatusResponse(
+        game_id=state.id,
+        status=state.status,
+        current_player=PLAYERS[state.current_player],
+        winner=PLAYERS[state.winner] if state.winner in (0, 1) else None,
+        player1_score=state.board[pits],
+        player2_score=state.board[2 * pits + 1],
+    )
+
+
+@router.get("/", response_model=PaginatedResponse[GameStatusResponse])
+async def list_games(
+    status: GameStatusEnum | None = None,
+    player: str | None = Query(None, description="Either player's name"),
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    size: int = Query(20, ge=1, le=100),
+    service: AsyncGameService = Depends(get_game_service),
+) -> PaginatedResponse[GameStatusResponse]:
+    """List games newest first, one page at a time"""
+    try:
+        page = await service.list_games(
+            player, status, created_after, created_before, cursor, size
+        )
+
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail=str(err))
+
+    return PaginatedResponse[GameStatusResponse](
+        items=[_status_response(state) for state in page.items],
+        total=page.total,
+        page=page.position // size + 1,
+        size=size,
+        pages=-(-page.total // size),
+        next_cursor=page.next_cursor,
+    )
+
 
 @router.post("/", response_model=GameState)
 async def create(
-    request: GameCreate, service: GameService = Depends(get_game_service)
+    request: GameCreate, service: AsyncGameService = Depends(get_game_service)
 ) -> GameState:
-    id_ = service.create_game(request.player1, request.player2)
+    player1 = Player(name=request.player1_name, type=PlayerTypeEnum.HUMAN)
+    player2 = Player(name=request.player2_name or "Player 2", type=request.player2_type)
+    time_control = None
+    if request.time_control is not None:
+        time_control = TimeControl(request.time_control, request.increment)
+
+    id_ = await service.create(player1, player2, time_control)
 
     # If player 2 is an agent and goes first, make its move
-    game_state = service.get_game_state(id_)
+    game_state = await service.get_state(id_)
     if game_state.current_player == 1:
-        service.execute_agent_moves(id_)
+        await service.execute_agent_moves(id_)
 
-    return service.get_game_state(id_)
+    return await service.get_state(id_)
 
 
 @router.get("/{game_id}", response_model=GameState)
 async def get_game(
-    game_id: UUID = Path(...), service: GameService = Depends(get_game_service)
+    game_id: UUID = Path(...), service: AsyncGameService = Depends(get_game_service)
 ) -> GameState:
     try:
-        return service.get_game_state(game_id)
+        return await service.get_state(game_id)
 
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Game with ID {game_id} not found")
@@ -37,22 +98,24 @@ async def get_game(
 async def make_move(
     move: MoveRequest,
     game_id: UUID = Path(...),
-    service: GameService = Depends(get_game_service),
+    service: AsyncGameService = Depends(get_game_service),
 ) -> MoveResponse:
     """Make a move in a game"""
     try:
         # Make the human player's move
-        result = service.make_move(game_id, move.pit_index)
+        result = await service.make_move(game_id, move.pit_index, trace=True)
+        traces = [result.trace] if result.trace else []
 
         # If move was successful and it's the agent's turn, make its move
         if result.success and not result.extra_turn and not result.is_game_over:
-            agent_results = service.execute_agent_moves(game_id)
+            agent_results = await service.execute_agent_moves(game_id, trace=True)
+            traces.extend(r.trace for r in agent_results if r.trace)
 
             # If the agent made any moves, use the last result for response
             if agent_results:
                 result = agent_results[-1]
 
-        game_state = service.get_game_state(game_id)
+        game_state = await service.get_state(game_id)
 
         return MoveResponse(
             success=result.success,
@@ -60,6 +123,7 @@ async def make_move(
             extra_turn=result.extra_turn,
             is_game_over=result.is_game_over,
             game_state=game_state,
+            traces=traces,
         )
 
     except ValueError as err:
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Query
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.api.router.stats import stats_response
+from mancala.app.models.api import PaginatedResponse, PlayerStatsResponse
+from mancala.app.services.game import AsyncGameService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=PaginatedResponse[PlayerStatsResponse])
+async def leaderboard(
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    service: AsyncGameService = Depends(get_game_service),
+) -> PaginatedResponse[PlayerStatsResponse]:
+    """Players ranked by wins, then total margin"""
+    offset = (page - 1) * size
+    total = len(service.stats.leaderboard)
+    return PaginatedResponse[PlayerStatsResponse](
+        items=[
+            stats_response(stats, rank)
+            for rank, stats in enumerate(service.stats.top(size, offset), offset + 1)
+        ],
+        total=total,
+        page=page,
+        size=size,
+        pages=-(-total // size),
+    )
@@ -0,0 +1,91 @@
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, WebSocket
+
+from mancala.app.api.dependencies import get_matchmaker
+from mancala.app.models.api import MatchRequest, MatchTicketResponse
+from mancala.app.services.matchmaking import Matchmaker, Ticket
+
+router = APIRouter()
+
+
+def _ticket_response(ticket: Ticket) -> MatchTicketResponse:
+    return MatchTicketResponse(
+        ticket_id=ticket.id,
+        status=ticket.status,
+        game_id=ticket.game_id,
+        player=ticket.player,
+        cancelled=ticket.cancelled,
+    )
+
+
+@router.post("/", response_model=MatchTicketResponse)
+async def join(
+    request: MatchRequest, matchmaker: Matchmaker = Depends(get_matchmaker)
+) -> MatchTicketResponse:
+    """Queue for a game; the response is already active if someone was waiting"""
+    ticket = await matchmaker.join(
+        request.name, request.rating, (request.pits, request.stones)
+    )
+    return _ticket_response(ticket)
+
+
+@router.get("/{ticket_id}", response_model=MatchTicketResponse)
+async def get_ticket(
+    ticket_id: UUID = Path(...), matchmaker: Matchmaker = Depends(get_matchmaker)
+) -> MatchTicketResponse:
+    try:
+        return _ticket_response(matchmaker.get_ticket(ticket_id))
+
+    except ValueError as err:
+        raise HTTPException(status_code=404, detail=str(err))
+
+
+@router.delete("/{ticket_id}", response_model=MatchTicketResponse)
+async def cancel(
+    ticket_id: UUID = Path(...), matchmaker: Matchmaker = Depends(get_matchmaker)
+) -> MatchTicketResponse:
+    """Leave the queue"""
+    try:
+        return _ticket_response(matchmaker.cancel(ticket_id))
+
+    except ValueError as err:
+        raise HTTPException(status_code=404, detail=str(err))
+
+
+@router.websocket("/{ticket_id}/ws")
+async def notify(
+    websocket: WebSocket,
+    ticket_id: UUID,
+    matchmaker: Matchmaker = Depends(get_matchmaker),
+) -> None:
+    """Push the ticket once it is matched or cancelled, then close"""
+    await websocket.accept()
+    try:
+        ticket = matchmaker.get_ticket(ticket_id)
+
+    except ValueError as err:
+        await websocket.close(code=4404, reason=str(err))
+        return
+
+    # A client that disconnects first gives up its place in the queue
+    done = asyncio.create_task(ticket.done.wait())
+    disconnected = asyncio.create_task(_disconnect(websocket))
+    await asyncio.wait((done, disconnected), return_when=asyncio.FIRST_COMPLETED)
+    if not done.done():
+        done.cancel()
+        if not ticket.done.is_set():
+            matchmaker.cancel(ticket_id)
+
+        return
+
+    disconnected.cancel()
+    await websocket.send_json(_ticket_response(ticket).model_dump(mode="json"))
+    await websocket.close()
+
+
+async def _disconnect(websocket: WebSocket) -> None:
+    """Return once the client goes away, ignoring anything it sends"""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from mancala.app.api.dependencies import (
+    get_agent,
+    get_agent_cache,
+    get_analysis_service,
+)
+from mancala.app.core.cache import LRUCache
+from mancala.app.services.analysis import AnalysisService
+from mancala.app.services.budget import BudgetScheduler
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_metrics(
+    agent: BudgetScheduler = Depends(get_agent),
+    agent_cache: LRUCache = Depends(get_agent_cache),
+    analysis: AnalysisService = Depends(get_analysis_service),
+) -> dict:
+    """Cache sizes and hit rates, and agent move budgets, for this worker"""
+    return {
+        "agent_cache": agent_cache.stats(),
+        "agent_budget": agent.stats(),
+        "analysis_cache": analysis.cache.stats(),
+    }
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Path
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.models.api import PlayerStatsResponse, RecordResponse
+from mancala.app.models.domain.stats import PlayerStats, Record
+from mancala.app.services.game import AsyncGameService
+
+router = APIRouter()
+
+
+def _record_response(record: Record) -> RecordResponse:
+    return RecordResponse(wins=record.wins, losses=record.losses, draws=record.draws)
+
+
+def stats_response(stats: PlayerStats, rank: int) -> PlayerStatsResponse:
+    return PlayerStatsResponse(
+        name=stats.name,
+        rank=rank,
+        games=stats.games,
+        wins=stats.wins,
+        losses=stats.losses,
+        draws=stats.draws,
+        average_margin=stats.average_margin,
+        vs_agent=_record_response(stats.vs_agent),
+        vs_human=_record_response(stats.vs_human),
+    )
+
+
+@router.get("/{name}", response_model=PlayerStatsResponse)
+async def get_stats(
+    name: str = Path(...), service: AsyncGameService = Depends(get_game_service)
+) -> PlayerStatsResponse:
+    try:
+        stats = service.stats.get(name)
+
+    except ValueError as err:
+        raise HTTPException(status_code=404, detail=str(err))
+
+    return stats_response(stats, service.stats.leaderboard.rank(name))
@@ -0,0 +1,160 @@
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from mancala.app.core.rate_limit import (
+    BucketStore,
+    Charge,
+    LocalBucketStore,
+    RateLimit,
+)
+
+# Set to "off" to disable rate limiting and admission control
+RATE_LIMIT_ENV = "MANCALA_RATE_LIMIT"
+
+# Set to host:port of a bucket server to share limits between workers
+RATE_LIMIT_SERVER_ENV = "MANCALA_RATE_LIMIT_SERVER"
+RATE_LIMIT_AUTHKEY_ENV = "MANCALA_RATE_LIMIT_AUTHKEY"
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """A bucket charged by requests matching a method and path
+
+    Buckets are per client, or per path `key` group (such as a game ID) when
+    the pattern captures one.
+    """
+
+    name: str
+    method: str
+    pattern: re.Pattern[str]
+    limit: RateLimit
+
+
+# Games created directly or through matchmaking share a bucket
+RULES = (
+    Rule("create", "POST", re.compile(r"/api/v1/games/?"), RateLimit(2, 20)),
+    Rule("create", "POST", re.compile(r"/api/v1/matchmaking/?"), RateLimit(2, 20)),
+    Rule(
+        "moves",
+        "POST",
+        re.compile(r"/api/v1/games/(?P<key>[^/]+)/moves"),
+        RateLimit(10, 20),
+    ),
+    Rule(
+        "analysis",
+        "POST",
+        re.compile(r"/api/v1/games/[^/]+/analysis"),
+        RateLimit(0.2, 5),
+    ),
+)
+
+# Every request from a client, on top of any rule above
+CLIENT_LIMIT = RateLimit(50, 100)
+
+
+class AdmissionControl:
+    """ASGI middleware that rate limits clients and sheds load when saturated
+
+    Requests over a client or game budget get 429. Requests arriving while
+    `max_in_flight` requests (or `max_writes` writes) are already running get
+    503, so excess load is turned away before it queues in the event loop or
+    in front of the agent.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        store: BucketStore | None = None,
+        rules: tuple[Rule, ...] = RULES,
+        client_limit: RateLimit | None = CLIENT_LIMIT,
+        max_in_flight: int = 512,
+        max_writes: int = 128,
+    ) -> None:
+        self.app = app
+        self.store = LocalBucketStore() if store is None else store
+        self.rules = rules
+        self.client_limit = client_limit
+        self.max_in_flight = max_in_flight
+        self.max_writes = max_writes
+
+        self.in_flight = 0
+        self.writes = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] in WRITE_METHODS
+        if self.in_flight >= self.max_in_flight or (
+            is_write and self.writes >= self.max_writes
+        ):
+            await _reject(send, 503, "Server is busy, try again shortly", 1.0)
+            return
+
+        wait = self.check(scope)
+        if wait:
+            await _reject(send, 429, "Too many requests", wait)
+            return
+
+        self.in_flight += 1
+        self.writes += is_write
+        try:
+            await self.app(scope, receive, send)
+
+        finally:
+            self.in_flight -= 1
+            self.writes -= is_write
+
+    def check(self, scope) -> float:
+        """Charge every bucket a request falls under, returning the longest wait
+
+        Buckets are charged together or not at all, so a request turned away
+        by one limit doesn't use up another.
+        """
+        client = _client_id(scope)
+        method = scope["method"]
+        path = scope["path"]
+
+        charges: list[Charge] = []
+        if self.client_limit is not None:
+            charges.append((f"client:{client}", self.client_limit))
+
+        for rule in self.rules:
+            if rule.method != method:
+                continue
+
+            match = rule.pattern.fullmatch(path)
+            if match is None:
+                continue
+
+            key = match.groupdict().get("key") or client
+            charges.append((f"{rule.name}:{key}", rule.limit))
+
+        return self.store.take(charges) if charges else 0.0
+
+
+def _client_id(scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+async def _reject(send, status: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
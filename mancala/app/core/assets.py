@@ -0,0 +1,117 @@
+import argparse
+import os
+import shutil
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Directory of published assets shared by every worker on the machine
+ASSETS_ENV = "MANCALA_ASSETS"
+
+# Each asset is a directory of versions plus a link naming the live one
+CURRENT = "current"
+
+
+def publish(root: str, name: str, source: str, keep: int = 3) -> str:
+    """Copy a directory in as a new version of an asset and make it live
+
+    The switch is a single rename of the `current` link, so readers see the
+    old version or the new one, never a mix. Versions beyond the newest
+    `keep` are deleted; workers still mapping them keep their pages until
+    they move on.
+    """
+    asset_dir = os.path.join(root, name)
+    os.makedirs(asset_dir, exist_ok=True)
+
+    version = str(time.time_ns())
+    shutil.copytree(source, os.path.join(asset_dir, version))
+
+    link = os.path.join(asset_dir, f".{CURRENT}.{version}")
+    os.symlink(version, link)
+    os.replace(link, os.path.join(asset_dir, CURRENT))
+
+    versions = sorted(
+        (entry for entry in os.listdir(asset_dir) if entry.isdigit()), key=int
+    )
+    for old in versions[:-keep]:
+        shutil.rmtree(os.path.join(asset_dir, old), ignore_errors=True)
+
+    return version
+
+
+def current_version(root: str, name: str) -> str | None:
+    """The live version of an asset, or None if it was never published"""
+    try:
+        return os.readlink(os.path.join(root, name, CURRENT))
+
+    except FileNotFoundError:
+        return None
+
+
+class SharedAsset(Generic[T]):
+    """A read-only asset, rebuilt whenever a new version goes live
+
+    `build` gets the version's directory and should map its files rather than
+    read them, so every worker shares the page cache's single copy. Callers
+    holding the previous value keep using it undisturbed; it is released once
+    the last of them lets go.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        name: str,
+        build: Callable[[str], T],
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = root
+        self.name = name
+        self.build = build
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self.version: str | None = None
+        self.value: T | None = None
+        self.checked = 0.0
+
+    def get(self) -> T:
+        # Look for a new version at most once per interval, not on every call
+        now = self.clock()
+        if self.value is None or now - self.checked >= self.check_interval:
+            self.checked = now
+            version = current_version(self.root, self.name)
+            if version is None:
+                raise ValueError(f"No {self.name!r} asset published in {self.root}")
+
+            if version != self.version:
+                self.value = self.build(os.path.join(self.root, self.name, version))
+                self.version = version
+
+        return self.value
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(
+        description="Publish a new version of a shared asset to running workers"
+    )
+    parser.add_argument("name", help="Asset name, e.g. evaluator")
+    parser.add_argument("source", help="Directory holding the new version")
+    parser.add_argument(
+        "--root",
+        default=os.environ.get(ASSETS_ENV),
+        required=ASSETS_ENV not in os.environ,
+        help=f"Assets directory (default: ${ASSETS_ENV})",
+    )
+    parser.add_argument("--keep", type=int, default=3, help="Versions to keep")
+    args = parser.parse_args()
+
+    version = publish(args.root, args.name, args.source, args.keep)
+    print(f"Published {args.name} version {version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,34 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from mancala.app.core.admission import (
+    RATE_LIMIT_AUTHKEY_ENV,
+    RATE_LIMIT_ENV,
+    RATE_LIMIT_SERVER_ENV,
+    AdmissionControl,
+)
+from mancala.app.core.rate_limit import BucketStore, LocalBucketStore, SharedBucketStore
+from mancala.app.core.recording import RECORD_TRAFFIC_ENV, TrafficRecorder
+
+
+def bucket_store() -> BucketStore:
+    """Buckets shared through a bucket server if one is configured"""
+    server = os.environ.get(RATE_LIMIT_SERVER_ENV)
+    if not server:
+        return LocalBucketStore()
+
+    host, port = server.rsplit(":", 1)
+    authkey = os.environ.get(RATE_LIMIT_AUTHKEY_ENV, "mancala").encode()
+    return SharedBucketStore((host, int(port)), authkey)
+
 
 def configure_middleware(app: FastAPI) -> None:
+    # Innermost of these, so rejections still carry CORS headers
+    if os.environ.get(RATE_LIMIT_ENV) != "off":
+        app.add_middleware(AdmissionControl, store=bucket_store())
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -10,3 +36,8 @@ def configure_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+
+    # Outermost, so recorded latencies include every other middleware
+    record_path = os.environ.get(RECORD_TRAFFIC_ENV)
+    if record_path:
+        app.add_middleware(TrafficRecorder, path=record_path)
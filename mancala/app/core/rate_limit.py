@@ -0,0 +1,172 @@
+import argparse
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.managers import BaseManager
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """A token bucket refilling `rate` tokens a second, holding up to `burst`"""
+
+    rate: float
+    burst: int
+
+    @property
+    def interval(self) -> float:
+        return 1 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        # How far ahead of now a full bucket lets the next allowed time run
+        return (self.burst - 1) * self.interval
+
+
+# (bucket key, its limit); one request may be charged to several buckets
+Charge = tuple[str, RateLimit]
+
+
+def take(state: dict[str, float], charges: list[Charge], now: float) -> float:
+    """Spend one token from every bucket, returning 0 or the longest wait
+
+    Each bucket is stored as a single float, the time it will next be full
+    (the generic cell rate algorithm), so a refilled bucket and a missing one
+    mean the same thing and can be dropped. Every bucket is checked before
+    any is charged, so a rejected request costs no bucket a token.
+    """
+    wait = 0.0
+    for key, limit in charges:
+        due = max(state.get(key, now), now)
+        wait = max(wait, due - now - limit.tolerance)
+
+    if wait > 0:
+        return wait
+
+    for key, limit in charges:
+        state[key] = max(state.get(key, now), now) + limit.interval
+
+    return 0.0
+
+
+class BucketStore:
+    """Where rate limit buckets live, shared by whoever shares the store"""
+
+    def take(self, charges: list[Charge]) -> float:
+        """Charge every bucket or none, returning 0 or the seconds to wait"""
+        raise NotImplementedError
+
+
+class LocalBucketStore(BucketStore):
+    """Buckets for a single worker, one float per active key"""
+
+    def __init__(self, max_keys: int = 100_000, clock=time.monotonic) -> None:
+        self.max_keys = max_keys
+        self.clock = clock
+        self.state: dict[str, float] = {}
+
+    def take(self, charges: list[Charge]) -> float:
+        state = self.state
+        if len(state) + len(charges) > self.max_keys:
+            self.prune()
+
+        return take(state, charges, self.clock())
+
+    def prune(self) -> int:
+        """Drop refilled buckets, then the oldest if still full, returning the count
+
+        Evicting a bucket that is still draining hands its key a fresh burst,
+        which only happens when more keys are active than `max_keys`.
+        """
+        state = self.state
+        before = len(state)
+        now = self.clock()
+        for key in [key for key, due in state.items() if due <= now]:
+            del state[key]
+
+        excess = len(state) - self.max_keys // 2
+        if excess > 0:
+            for key in list(state)[:excess]:
+                del state[key]
+
+        return before - len(state)
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+
+class _BucketServer:
+    """Buckets served to every worker, updated under one lock per request"""
+
+    def __init__(self) -> None:
+        self.store = LocalBucketStore(max_keys=1_000_000)
+        self.lock = threading.Lock()
+
+    def take(self, charges: list[tuple[str, float, int]]) -> float:
+        with self.lock:
+            return self.store.take(
+                [(key, RateLimit(rate, burst)) for key, rate, burst in charges]
+            )
+
+
+_server: _BucketServer | None = None
+
+
+def _get_server() -> _BucketServer:
+    global _server
+    if _server is None:
+        _server = _BucketServer()
+
+    return _server
+
+
+class BucketManager(BaseManager):
+    pass
+
+
+BucketManager.register("buckets", callable=_get_server)
+
+
+class SharedBucketStore(BucketStore):
+    """Buckets held by a bucket server, so every worker shares the same limits
+
+    A stand-in for a networked store such as Redis, for trying limits across
+    several workers. Each check is a blocking round trip to the server.
+    """
+
+    def __init__(self, address: tuple[str, int], authkey: bytes) -> None:
+        self.address = address
+        self.authkey = authkey
+        self.proxy = None
+
+    def take(self, charges: list[Charge]) -> float:
+        if self.proxy is None:
+            manager = BucketManager(address=self.address, authkey=self.authkey)
+            manager.connect()
+            self.proxy = manager.buckets()
+
+        return self.proxy.take(
+            [(key, limit.rate, limit.burst) for key, limit in charges]
+        )
+
+
+def serve(address: tuple[str, int], authkey: bytes) -> None:
+    """Run a bucket server in this process until interrupted"""
+    manager = BucketManager(address=address, authkey=authkey)
+    manager.get_server().serve_forever()
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(
+        description="Serve rate limit buckets shared by several API workers"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=50_505, help="Port to listen on")
+    parser.add_argument("--authkey", default="mancala", help="Shared secret")
+    args = parser.parse_args()
+
+    serve((args.host, args.port), args.authkey.encode())
+
+
+if __name__ == "__main__":
+    main()
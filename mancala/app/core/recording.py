@@ -0,0 +1,135 @@
+import gzip
+import json
+import time
+from contextlib import ExitStack
+from typing import Any
+
+# Set to a file path to record every API request for later replay
+RECORD_TRAFFIC_ENV = "MANCALA_RECORD_TRAFFIC"
+
+ID_FIELDS = ("id", "game_id", "job_id", "ticket_id")
+
+
+class TrafficWriter:
+    """Appends request events to a gzipped JSON-lines recording"""
+
+    def __init__(self, path: str, flush_every: int = 100) -> None:
+        self.flush_every = flush_every
+        self.pending = 0
+        self.origin = time.monotonic()
+
+        # The file is closed again if the header can't be written
+        with ExitStack() as stack:
+            self.file = stack.enter_context(gzip.open(path, "at", encoding="utf-8"))
+
+            # Header with the wall-clock start, so recordings can be lined up
+            self.write({"version": 1, "started": time.time()})
+            self.resources = stack.pop_all()
+
+    def offset(self) -> float:
+        return time.monotonic() - self.origin
+
+    def write(self, event: dict[str, Any]) -> None:
+        self.file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self.pending += 1
+
+        if self.pending >= self.flush_every:
+            self.file.flush()
+            self.pending = 0
+
+    def close(self) -> None:
+        self.resources.close()
+
+
+class TrafficRecorder:
+    """ASGI middleware recording each request's timing, body and status
+
+    Response bodies are only kept as the IDs a successful POST returned,
+    which is what a replay needs to map recorded games and jobs onto new ones.
+    """
+
+    def __init__(self, app: Any, path: str) -> None:
+        self.app = app
+        self.writer = TrafficWriter(path)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, self._lifespan_send(send))
+            return
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        offset = self.writer.offset()
+        start = time.perf_counter()
+        request_body = bytearray()
+        response_body = bytearray()
+        status = 0
+
+        method = scope["method"]
+        path = scope["path"]
+        is_post = method == "POST"
+
+        async def recording_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.extend(message.get("body", b""))
+
+            return message
+
+        async def recording_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            elif message["type"] == "http.response.body" and is_post:
+                response_body.extend(message.get("body", b""))
+
+            await send(message)
+
+        try:
+            await self.app(scope, recording_receive, recording_send)
+
+        finally:
+            event: dict[str, Any] = {
+                "t": round(offset, 6),
+                "m": method,
+                "p": path,
+                "s": status or 500,
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+            if request_body:
+                event["b"] = _decode(request_body)
+
+            if is_post and 200 <= status < 300:
+                ids = response_ids(_decode(response_body))
+                if ids:
+                    event["ids"] = ids
+
+            self.writer.write(event)
+
+    def _lifespan_send(self, send):
+        # Close the recording once the server has finished shutting down
+        async def lifespan_send(message):
+            await send(message)
+            if message["type"] == "lifespan.shutdown.complete":
+                self.writer.close()
+
+        return lifespan_send
+
+
+def response_ids(body: Any) -> list[str]:
+    """IDs a response introduced, in a fixed field order"""
+    if not isinstance(body, dict):
+        return []
+
+    return [str(body[field]) for field in ID_FIELDS if body.get(field)]
+
+
+def _decode(body: bytes | bytearray) -> Any:
+    try:
+        return json.loads(body)
+
+    except ValueError:
+        return body.decode("utf-8", "replace")
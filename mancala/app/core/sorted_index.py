@@ -0,0 +1,205 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+
+
+class SortedIndex:
+    """Sorted set of int keys stored as a list of bounded sorted chunks
+
+    Inserts and removals shift one chunk rather than the whole index, and
+    range scans seek with a bisect, so reading a page of k keys costs
+    O(log n + k) however large the index grows. A Fenwick tree over the chunk
+    lengths answers rank queries in O(log n) too; it is rebuilt only when a
+    chunk is split or emptied.
+    """
+
+    def __init__(self, chunk_size: int = 1000) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: list[list[int]] = []
+        self.maxes: list[int] = []  # Last key of each chunk
+        self.tree: list[int] = [0]  # 1-based Fenwick tree of chunk lengths
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        i = bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            return False
+
+        chunk = self.chunks[i]
+        j = bisect_left(chunk, key)
+        return j < len(chunk) and chunk[j] == key
+
+    def add(self, key: int) -> None:
+        if not self.chunks:
+            self.chunks.append([key])
+            self.maxes.append(key)
+            self.size = 1
+            self._rebuild()
+            return
+
+        # Keys past the end go on the last chunk, the common append case
+        i = min(bisect_left(self.maxes, key), len(self.chunks) - 1)
+        chunk = self.chunks[i]
+        j = bisect_left(chunk, key)
+        if j < len(chunk) and chunk[j] == key:
+            return
+
+        insort(chunk, key)
+        self.maxes[i] = chunk[-1]
+        self.size += 1
+        self._update(i, 1)
+
+        # Split full chunks in half to keep shifts short
+        if len(chunk) > 2 * self.chunk_size:
+            half = len(chunk) // 2
+            self.chunks[i : i + 1] = [chunk[:half], chunk[half:]]
+            self.maxes[i : i + 1] = [chunk[half - 1], chunk[-1]]
+            self._rebuild()
+
+    def remove(self, key: int) -> None:
+        i = bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            raise KeyError(key)
+
+        chunk = self.chunks[i]
+        j = bisect_left(chunk, key)
+        if j == len(chunk) or chunk[j] != key:
+            raise KeyError(key)
+
+        del chunk[j]
+        self.size -= 1
+
+        if chunk:
+            self.maxes[i] = chunk[-1]
+            self._update(i, -1)
+
+        else:
+            del self.chunks[i]
+            del self.maxes[i]
+            self._rebuild()
+
+    def discard(self, key: int) -> None:
+        try:
+            self.remove(key)
+
+        except KeyError:
+            pass
+
+    def count(self, lo: int | None = None, hi: int | None = None) -> int:
+        """Number of keys with lo <= key < hi"""
+        below_hi = self.size if hi is None else self._rank(hi)
+        return max(0, below_hi - self._rank(lo))
+
+    def irange(
+        self, lo: int | None = None, hi: int | None = None, reverse: bool = False
+    ) -> Iterator[int]:
+        """Yield keys with lo <= key < hi, ascending unless `reverse`"""
+        if not self.chunks:
+            return
+
+        if reverse:
+            i = len(self.chunks) - 1 if hi is None else bisect_left(self.maxes, hi)
+            i = min(i, len(self.chunks) - 1)
+            for chunk in map(self.chunks.__getitem__, range(i, -1, -1)):
+                end = len(chunk) if hi is None else bisect_left(chunk, hi)
+                for j in range(end - 1, -1, -1):
+                    if lo is not None and chunk[j] < lo:
+                        return
+
+                    yield chunk[j]
+
+        else:
+            i = 0 if lo is None else bisect_left(self.maxes, lo)
+            for chunk in map(self.chunks.__getitem__, range(i, len(self.chunks))):
+                start = 0 if lo is None else bisect_left(chunk, lo)
+                for key in chunk[start:]:
+                    if hi is not None and key >= hi:
+                        return
+
+                    yield key
+
+    def islice(
+        self, start: int, stop: int | None = None, reverse: bool = False
+    ) -> Iterator[int]:
+        """Yield keys by rank from `start` up to `stop`, seeking in O(log n)
+
+        Ranks count from the smallest key, or from the largest if `reverse`.
+        """
+        start = max(start, 0)
+        stop = self.size if stop is None else min(stop, self.size)
+        if start >= stop:
+            return
+
+        remaining = stop - start
+        if not reverse:
+            i, j = self._locate(start)
+            while remaining > 0:
+                keys = self.chunks[i][j : j + remaining]
+                yield from keys
+                remaining -= len(keys)
+                i, j = i + 1, 0
+
+        else:
+            i, j = self._locate(self.size - 1 - start)
+            while remaining > 0:
+                keys = self.chunks[i][max(j + 1 - remaining, 0) : j + 1]
+                yield from reversed(keys)
+                remaining -= len(keys)
+                i -= 1
+                j = len(self.chunks[i]) - 1 if i >= 0 else 0
+
+    def _locate(self, position: int) -> tuple[int, int]:
+        """Chunk index and offset within it of the key at a 0-based rank"""
+        tree = self.tree
+        i = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if i + step < len(tree) and tree[i + step] <= position:
+                i += step
+                position -= tree[i]
+
+            step >>= 1
+
+        return i, position
+
+    def _rank(self, key: int | None) -> int:
+        """Number of keys below `key` (0 for None)"""
+        if key is None:
+            return 0
+
+        i = bisect_left(self.maxes, key)
+        below = self._prefix(i)
+        if i < len(self.chunks):
+            below += bisect_left(self.chunks[i], key)
+
+        return below
+
+    def _prefix(self, i: int) -> int:
+        """Number of keys in the first `i` chunks"""
+        tree = self.tree
+        total = 0
+        while i:
+            total += tree[i]
+            i &= i - 1
+
+        return total
+
+    def _update(self, i: int, delta: int) -> None:
+        tree = self.tree
+        i += 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _rebuild(self) -> None:
+        """Recompute the Fenwick tree after chunks are added or dropped"""
+        tree = [0] * (len(self.chunks) + 1)
+        for i, chunk in enumerate(self.chunks, start=1):
+            tree[i] += len(chunk)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+
+        self.tree = tree
@@ -0,0 +1,111 @@
+import math
+from typing import Any
+
+
+class Timer:
+    """Handle for a scheduled deadline, used to cancel it"""
+
+    __slots__ = ("deadline", "payload", "slot")
+
+    def __init__(self, deadline: int, payload: Any) -> None:
+        self.deadline = deadline  # In ticks
+        self.payload = payload
+        self.slot: set["Timer"] | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.slot is not None
+
+
+class TimerWheel:
+    """Hierarchical timing wheel
+
+    Level L holds deadlines between slots**L and slots**(L+1) ticks away, one
+    slot per slots**L ticks. When a level's slot comes due its timers are
+    redistributed to the levels below, so each timer moves at most `levels`
+    times. Scheduling, cancelling and expiring are O(1) however many timers
+    are pending, and advancing never scans timers that are not yet due.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.1,
+        slots: int = 256,
+        levels: int = 4,
+        now: float = 0.0,
+    ) -> None:
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.tick = int(now / resolution)
+        self.wheels: list[list[set[Timer]]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+        self.pending = 0
+
+    def __len__(self) -> int:
+        return self.pending
+
+    def schedule(self, at: float, payload: Any) -> Timer:
+        """Fire `payload` from the first advance at or after time `at`"""
+        deadline = max(math.ceil(at / self.resolution), self.tick + 1)
+        if deadline - self.tick >= self.slots**self.levels:
+            raise ValueError("Deadline is beyond the wheel's range")
+
+        timer = Timer(deadline, payload)
+        self._place(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        if timer.slot is not None:
+            timer.slot.discard(timer)
+            timer.slot = None
+            self.pending -= 1
+
+    def advance(self, now: float) -> list[Any]:
+        """Move the wheel up to time `now`, returning the expired payloads"""
+        target = int(now / self.resolution)
+        expired = []
+
+        while self.tick < target:
+            self.tick += 1
+
+            # Bring timers from coarser levels down as their slot comes due
+            span = 1
+            for level in range(1, self.levels):
+                span *= self.slots
+                if self.tick % span:
+                    break
+
+                wheel = self.wheels[level]
+                index = (self.tick // span) % self.slots
+                due, wheel[index] = wheel[index], set()
+                for timer in due:
+                    self._place(timer)
+
+            wheel = self.wheels[0]
+            index = self.tick % self.slots
+            if wheel[index]:
+                due, wheel[index] = wheel[index], set()
+                for timer in due:
+                    timer.slot = None
+                    expired.append(timer.payload)
+
+                self.pending -= len(due)
+
+        return expired
+
+    def _place(self, timer: Timer) -> None:
+        delta = timer.deadline - self.tick
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots:
+                slot = self.wheels[level][(timer.deadline // span) % self.slots]
+                slot.add(timer)
+                timer.slot = slot
+                return
+
+            span *= self.slots
+
+        raise ValueError("Deadline is beyond the wheel's range")
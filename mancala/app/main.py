@@ -1,15 +1,58 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from mancala.app.api.dependencies import (
+    AGENT_CACHE_ENV,
+    get_agent_cache,
+    get_game_service,
+)
+from mancala.app.api.router import (
+    analysis,
+    export,
+    game,
+    leaderboard,
+    matchmaking,
+    metrics,
+    stats,
+)
 from mancala.app.core.middleware import configure_middleware
-from mancala.app.api.router import game
+from mancala.app.services.agent_cache import save_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Player stats persisted by the store seed the leaderboard
+    await get_game_service().stats.load()
+
+    # Game clocks and idle timeouts expire from one background task
+    timers = asyncio.create_task(get_game_service().run_timers())
+    yield
+    timers.cancel()
+
+    # Persist the agent move cache so the next worker starts warm
+    path = os.environ.get(AGENT_CACHE_ENV)
+    if path:
+        save_cache(get_agent_cache(), path)
 
 
 app = FastAPI(
     title="Mancala Game API",
     description="A REST API for playing the Mancala game",
     version="0.1.0",
+    lifespan=lifespan,
 )
 app.include_router(game.router, prefix="/api/v1/games", tags=["games"])
+app.include_router(analysis.router, prefix="/api/v1/games", tags=["analysis"])
+app.include_router(
+    matchmaking.router, prefix="/api/v1/matchmaking", tags=["matchmaking"]
+)
+app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
+app.include_router(stats.router, prefix="/api/v1/players", tags=["players"])
+app.include_router(leaderboard.router, prefix="/api/v1/leaderboard", tags=["players"])
+app.include_router(metrics.router, prefix="/api/v1/metrics", tags=["metrics"])
 
 configure_middleware(app)
 
@@ -1,18 +1,30 @@
+# Service results are plain dataclasses so the engine needs no pydantic
+from mancala.app.models.domain.state import GameState, MoveResult
+
+from .analysis import AnalysisJobResponse, MoveAnalysis
 from .base import ApiResponse, PaginatedResponse
-from .game import GameCreate, GameState, GameStatusResponse, GameResponse
-from .move import MoveRequest, MoveResult, MoveResponse
+from .game import GameCreate, GameResponse, GameStatusResponse
+from .matchmaking import MatchRequest, MatchTicketResponse
+from .move import MoveRequest, MoveResponse
 from .player import PlayerCreate, PlayerInfo
+from .stats import PlayerStatsResponse, RecordResponse
 
 __all__ = [
+    "AnalysisJobResponse",
+    "MoveAnalysis",
     "ApiResponse",
     "PaginatedResponse",
     "GameCreate",
     "GameState",
     "GameStatusResponse",
     "GameResponse",
+    "MatchRequest",
+    "MatchTicketResponse",
     "MoveRequest",
     "MoveResult",
     "MoveResponse",
     "PlayerCreate",
     "PlayerInfo",
+    "PlayerStatsResponse",
+    "RecordResponse",
 ]
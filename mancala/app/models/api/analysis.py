@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from mancala.app.models.domain.enum import AnalysisStatusEnum
+
+
+class MoveAnalysis(BaseModel):
+    ply: int
+    player: int
+    pit: int
+    best_pit: int | None
+    value: float
+    best_value: float
+    loss: float
+    cached: bool = False
+
+
+class AnalysisJobResponse(BaseModel):
+    job_id: UUID
+    game_id: UUID
+    status: AnalysisStatusEnum
+    progress: int
+    total: int
+    moves: list[MoveAnalysis] = []
+    error: str | None = None
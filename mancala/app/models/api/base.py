@@ -1,6 +1,7 @@
-from pydantic import BaseModel
 from typing import Generic, TypeVar
 
+from pydantic import BaseModel
+
 T = TypeVar("T")
 
 
@@ -16,3 +17,4 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     size: int
     pages: int
+    next_cursor: str | None = None
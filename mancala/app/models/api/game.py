@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from uuid import UUID
 from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
 
 from mancala.app.models.domain.enum import GameStatusEnum, PlayerEnum, PlayerTypeEnum
 from mancala.app.models.domain.move import Move
@@ -10,6 +11,8 @@ class GameCreate(BaseModel):
     player1_name: str = "Player 1"
     player2_name: str | None = None
     player2_type: PlayerTypeEnum = PlayerTypeEnum.AGENT
+    time_control: float | None = Field(None, gt=0, description="Seconds per player")
+    increment: float = Field(0.0, ge=0, description="Seconds added per move")
 
     class Config:
         json_schema_extra = {
@@ -21,14 +24,6 @@ class GameCreate(BaseModel):
         }
 
 
-class GameState(BaseModel):
-    id: UUID
-    board: list[int]
-    current_player: int
-    status: GameStatusEnum
-    winner: int | None = None
-
-
 class GameStatusResponse(BaseModel):
     game_id: UUID
     status: GameStatusEnum
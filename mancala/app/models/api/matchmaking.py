@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from mancala.app.models.domain.enum import GameStatusEnum
+
+
+class MatchRequest(BaseModel):
+    name: str = "Player"
+    rating: int = Field(1500, ge=0, le=5000)
+    pits: int = Field(6, ge=1, le=12, description="Pits per side")
+    stones: int = Field(6, ge=1, le=24, description="Starting stones per pit")
+
+
+class MatchTicketResponse(BaseModel):
+    ticket_id: UUID
+    status: GameStatusEnum
+    game_id: UUID | None = None
+    player: int | None = None  # 0 moves first
+    cancelled: bool = False
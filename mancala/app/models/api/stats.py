@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class RecordResponse(BaseModel):
+    wins: int
+    losses: int
+    draws: int
+
+
+class PlayerStatsResponse(BaseModel):
+    name: str
+    rank: int
+    games: int
+    wins: int
+    losses: int
+    draws: int
+    average_margin: float
+    vs_agent: RecordResponse
+    vs_human: RecordResponse
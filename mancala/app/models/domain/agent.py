@@ -1,32 +1,45 @@
+import random
+
 from mancala.app.models.domain.game import Game
 
 
 class Agent:
+    @property
+    def config_key(self) -> tuple:
+        """Identifies the strategy, for caching its choices per position"""
+        return ("baseline",)
+
     def choose_move(self, game: Game) -> int | None:
         """Choose a move based on strategic evaluation"""
-        player_pits = game.board.get_player_pits(game.current_player)
-        valid_moves = [pit for pit in player_pits if game.board.get_stones(pit) > 0]
-
-        if not valid_moves:
-            return None
+        board = game.board
+        player_id = game.current_player
 
         # Strategy 1: Try to get another turn by ending in store
-        for pit in valid_moves:
-            stones = game.board.get_stones(pit)
-            if (pit + stones) % len(game.board.board) == game.board.get_store_index(
-                game.current_player
-            ):
+        for pit in board.legal_moves(player_id):
+            if board.lands_in_store(pit):
                 return pit
 
         # Strategy 2: Try to capture opponent's stones
-        for pit in valid_moves:
-            stones = game.board.get_stones(pit)
-            last_pit = (pit + stones) % len(game.board.board)
-            player_pits = game.board.get_player_pits(game.current_player)
-            if last_pit in player_pits and game.board.get_stones(last_pit) == 0:
-                opposite_pit = game.board.get_opposite_pit_index(last_pit)
-                if opposite_pit is not None and game.board.get_stones(opposite_pit) > 0:
-                    return pit
+        for pit in board.legal_moves(player_id):
+            if board.captures(pit):
+                return pit
 
         # Strategy 3: Prefer pits with more stones
-        return max(valid_moves, key=lambda pit: game.board.get_stones(pit))
+        return max(board.legal_moves(player_id), key=board.get_stones, default=None)
+
+
+class RandomAgent:
+    # Choices are not a function of the position, so never cache them
+    config_key = None
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.rng = random.Random(seed)
+
+    def choose_move(self, game: Game) -> int | None:
+        """Choose a uniformly random legal move"""
+        valid_moves = list(game.board.legal_moves(game.current_player))
+
+        if not valid_moves:
+            return None
+
+        return self.rng.choice(valid_moves)
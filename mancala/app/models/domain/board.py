@@ -1,84 +1,255 @@
+from array import array
+from collections.abc import Iterable, Iterator
+
+from mancala.app.models.domain.topology import get_topology
+
+
 class Board:
+    # No per-instance __dict__: many thousands of boards stay open at once
+    __slots__ = ("pits", "stones", "board", "topology", "pit_totals")
+
     def __init__(self, pits: int = 6, stones: int = 6) -> None:
         self.pits = pits
         self.stones = stones
-        self.board = [stones] * pits + [0] + [stones] * pits + [0]
+
+        # One byte per slot whenever every stone fits in a byte-sized counter
+        typecode = "B" if 2 * pits * stones <= 0xFF else "L"
+        self.board = array(typecode, [stones] * pits + [0] + [stones] * pits + [0])
+
+        # Layout lookup tables shared by every board with this pit count
+        self.topology = get_topology(pits)
+
+        # Running stone totals on each side, kept in step with every mutation
+        self.pit_totals = [pits * stones, pits * stones]
+
+    def copy(self) -> "Board":
+        """Get an independent copy sharing the precomputed layout"""
+        clone = Board.__new__(Board)
+        clone.pits = self.pits
+        clone.stones = self.stones
+        clone.topology = self.topology
+        clone.board = self.board[:]
+        clone.pit_totals = self.pit_totals[:]
+        return clone
 
     def get_player_pits(self, player_id: int) -> list[int]:
         """Get the indices of pits belonging to a player (excluding store)"""
-        # First player
-        if player_id == 0:
-            return list(range(0, self.pits))
-
-        # Second player
-        else:
-            return list(range(self.pits + 1, 2 * self.pits + 1))
+        return list(self.topology.pit_ranges[player_id])
 
     def get_store_index(self, player_id: int) -> int:
         """Get the index of a player's store"""
-        if player_id == 0:
-            return self.pits
+        return self.topology.store_indices[player_id]
 
-        else:
-            return 2 * self.pits + 1
+    def get_pit_owner(self, pit_index: int) -> int | None:
+        """Get the player owning a pit (None for stores)"""
+        owners = self.topology.owners
+        return owners[pit_index] if 0 <= pit_index < len(owners) else None
 
     def get_opposite_pit_index(self, pit_index: int) -> int | None:
         """Get the index of the pit opposite to the given pit"""
-        if pit_index in self.get_player_pits(0):
-            return 2 * self.pits - pit_index
-
-        elif pit_index in self.get_player_pits(1):
-            return 2 * self.pits - pit_index
-
-        else:
+        if self.get_pit_owner(pit_index) is None:
             return None  # Stores don't have opposite pits
 
+        return self.topology.opposite[pit_index]
+
     def get_stones(self, pit_index: int) -> int:
         """Get the number of stones in a pit"""
         return self.board[pit_index]
 
+    def load(self, cells: Iterable[int]) -> None:
+        """Replace every slot's count at once, recomputing the side totals"""
+        board = array(self.board.typecode, cells)
+        if len(board) != self.topology.size:
+            raise ValueError(f"Expected {self.topology.size} slots, got {len(board)}")
+
+        self.board = board
+        self.pit_totals = [
+            sum(board[pit_range.start : pit_range.stop])
+            for pit_range in self.topology.pit_ranges
+        ]
+
     def set_stones(self, pit_index: int, count: int) -> None:
         """Set the number of stones in a pit"""
+        player_id = self.topology.owners[pit_index]
+        if player_id is not None:
+            self.pit_totals[player_id] += count - self.board[pit_index]
+
         self.board[pit_index] = count
 
-    def is_game_over(self) -> bool:
-        """Check if the game is over (one side has no stones)"""
-        player1_pits = self.get_player_pits(0)
-        player2_pits = self.get_player_pits(1)
+    def sow(self, pit_index: int, path: list[int] | None = None) -> int:
+        """Sow the stones of a pit counterclockwise and return the last pit
+
+        If `path` is given, every index that receives a stone is appended to it.
+        """
+        player_id = self.get_pit_owner(pit_index)
+        if player_id is None:
+            raise ValueError("Cannot sow from a store")
+
+        topology = self.topology
+        board = self.board
+        totals = self.pit_totals
+        owners = topology.owners
+        next_slot = topology.next_slot[player_id]
+        cycle = topology.sowing_cycles[player_id]
+        cycle_length = len(cycle)
+        start = topology.sowing_positions[player_id][pit_index]
+
+        stones = board[pit_index]
+        board[pit_index] = 0
+        totals[player_id] -= stones
+
+        # Full laps drop one stone in every slot except the opponent's store
+        laps, remainder = divmod(stones, cycle_length)
+        if laps:
+            for index in cycle:
+                board[index] += laps
+
+            totals[0] += laps * self.pits
+            totals[1] += laps * self.pits
+
+            if path is not None:
+                for _ in range(laps):
+                    path.extend(cycle[start + 1 :])
+                    path.extend(cycle[: start + 1])
+
+        last_pit = cycle[(start + stones) % cycle_length]
+        index = pit_index
+        for _ in range(remainder):
+            index = next_slot[index]
+            board[index] += 1
+
+            owner = owners[index]
+            if owner is not None:
+                totals[owner] += 1
+
+            if path is not None:
+                path.append(index)
 
-        player1_empty = all(self.board[i] == 0 for i in player1_pits)
-        player2_empty = all(self.board[i] == 0 for i in player2_pits)
+        return last_pit
 
-        return player1_empty or player2_empty
+    def capture(self, pit_index: int, player_id: int) -> int:
+        """Move a pit and its opposite pit into a player's store"""
+        opposite_pit = self.topology.opposite[pit_index]
+        captured = self.board[pit_index] + self.board[opposite_pit]
 
-    def _collect_remaining_stones(self) -> None:
+        self.set_stones(pit_index, 0)
+        self.set_stones(opposite_pit, 0)
+        self.board[self.topology.store_indices[player_id]] += captured
+
+        return captured
+
+    def get_score(self, player_id: int) -> int:
+        """Get a player's score, counting stones left on their side once over"""
+        score = self.board[self.topology.store_indices[player_id]]
+        if self.is_game_over():
+            score += self.pit_totals[player_id]
+
+        return score
+
+    def occupancy(self, player_id: int) -> int:
+        """Get a bitmask of a player's non-empty pits (bit 0 = first pit)"""
+        board = self.board
+        first = self.topology.pit_ranges[player_id].start
+        mask = 0
+
+        for bit in range(self.pits):
+            if board[first + bit]:
+                mask |= 1 << bit
+
+        return mask
+
+    def legal_moves(self, player_id: int) -> Iterator[int]:
+        """Yield the pit indices a player may legally sow from"""
+        first = self.topology.pit_ranges[player_id].start
+        mask = self.occupancy(player_id)
+
+        while mask:
+            lowest = mask & -mask
+            yield first + lowest.bit_length() - 1
+            mask ^= lowest
+
+    def get_landing_pit(self, pit_index: int) -> int:
+        """Get the index where the last stone sown from a pit would land"""
+        player_id = self.get_pit_owner(pit_index)
+        if player_id is None:
+            raise ValueError("Cannot sow from a store")
+
+        cycle = self.topology.sowing_cycles[player_id]
+        start = self.topology.sowing_positions[player_id][pit_index]
+        return cycle[(start + self.board[pit_index]) % len(cycle)]
+
+    def lands_in_store(self, pit_index: int) -> bool:
+        """Check if sowing from a pit would end in its owner's store"""
+        if self.board[pit_index] == 0:
+            return False
+
+        player_id = self.get_pit_owner(pit_index)
+        if player_id is None:
+            return False
+
+        return self.get_landing_pit(pit_index) == self.topology.store_indices[player_id]
+
+    def captures(self, pit_index: int) -> int:
+        """Get the number of stones sowing from a pit would capture (0 if none)"""
+        topology = self.topology
+        stones = self.board[pit_index]
+        player_id = self.get_pit_owner(pit_index)
+        if stones == 0 or player_id is None:
+            return 0
+
+        positions = topology.sowing_positions[player_id]
+        cycle_length = len(topology.sowing_cycles[player_id])
+        laps, remainder = divmod(stones, cycle_length)
+        start = positions[pit_index]
+
+        last_pit = topology.sowing_cycles[player_id][(start + stones) % cycle_length]
+        if last_pit not in topology.pit_ranges[player_id]:
+            return 0
+
+        # Every slot receives one stone per full lap, and the first `remainder`
+        # slots after the starting pit receive one more
+        base = 0 if last_pit == pit_index else self.board[last_pit]
+        if base + laps + (1 if remainder else 0) != 1:
+            return 0
+
+        opposite_pit = topology.opposite[last_pit]
+        offset = (positions[opposite_pit] - start) % cycle_length
+        opposite_stones = self.board[opposite_pit] + laps
+        if 1 <= offset <= remainder:
+            opposite_stones += 1
+
+        return opposite_stones + 1 if opposite_stones > 0 else 0
+
+    def is_game_over(self) -> bool:
+        """Check if the game is over (one side has no stones)"""
+        return self.pit_totals[0] == 0 or self.pit_totals[1] == 0
+
+    def collect_remaining_stones(self) -> None:
         """Collect remaining stones into stores at game end"""
         if not self.is_game_over():
             return
 
         for player_id in [0, 1]:
-            store_index = self.get_store_index(player_id)
-            player_pits = self.get_player_pits(player_id)
+            store_index = self.topology.store_indices[player_id]
 
-            for pit in player_pits:
+            for pit in self.topology.pit_ranges[player_id]:
                 self.board[store_index] += self.board[pit]
                 self.board[pit] = 0
 
+            self.pit_totals[player_id] = 0
+
     def get_winner(self) -> int | None:
         """Get the winner of the game (returns None if game not over)"""
         if not self.is_game_over():
             return None
 
-        # Move remaining stones to respective stores
-        self._collect_remaining_stones()
-
-        player1_store = self.get_store_index(0)
-        player2_store = self.get_store_index(1)
+        player1_score = self.get_score(0)
+        player2_score = self.get_score(1)
 
-        if self.board[player1_store] > self.board[player2_store]:
+        if player1_score > player2_score:
             return 0
 
-        elif self.board[player2_store] > self.board[player1_store]:
+        elif player2_score > player1_score:
             return 1
 
         else:
@@ -15,3 +15,15 @@ class GameStatusEnum(str, Enum):
     WAITING = "waiting"
     ACTIVE = "active"
     OVER = "over"
+
+
+class AnalysisStatusEnum(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    BINARY = "binary"
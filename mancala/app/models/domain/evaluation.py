@@ -0,0 +1,48 @@
+from collections.abc import Sequence
+
+from mancala.app.models.domain.board import Board
+
+
+class Evaluator:
+    """Scores positions in [-1, 1] from the point of view of a given player"""
+
+    name = "base"
+
+    def snapshot(self) -> "Evaluator":
+        """An evaluator fixed at the current weights, for one whole search"""
+        return self
+
+    def evaluate(self, board: Board, player_id: int) -> float:
+        """Evaluate a single position"""
+        return self.evaluate_batch([board.board], [player_id])[0]
+
+    def evaluate_batch(
+        self, boards: Sequence[Sequence[int]], players: Sequence[int]
+    ) -> list[float]:
+        """Evaluate many raw board arrays in one call"""
+        raise NotImplementedError
+
+
+class HeuristicEvaluator(Evaluator):
+    """Store difference, with a smaller weight on stones still on each side"""
+
+    name = "heuristic"
+
+    def __init__(self, side_weight: float = 0.25) -> None:
+        self.side_weight = side_weight
+
+    def evaluate_batch(
+        self, boards: Sequence[Sequence[int]], players: Sequence[int]
+    ) -> list[float]:
+        values = []
+        for board, player_id in zip(boards, players):
+            pits = (len(board) - 2) // 2
+            total = sum(board) or 1
+
+            store_diff = board[pits] - board[2 * pits + 1]
+            side_diff = sum(board[:pits]) - sum(board[pits + 1 : 2 * pits + 1])
+            value = (store_diff + self.side_weight * side_diff) / total
+
+            values.append(value if player_id == 0 else -value)
+
+        return values
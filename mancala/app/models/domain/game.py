@@ -1,68 +1,129 @@
+from typing import Literal, overload
+
 from mancala.app.models.domain.board import Board
+from mancala.app.models.domain.trace import MoveTrace
 
 
 class Game:
-    def __init__(self):
-        self.board = Board()
+    __slots__ = ("board", "current_player", "game_over", "forfeited_by")
+
+    def __init__(self, pits: int = 6, stones: int = 6):
+        self.board = Board(pits, stones)
         self.current_player = 0  # Player 1 starts
         self.game_over = False
+        self.forfeited_by: int | None = None
+
+    def copy(self) -> "Game":
+        """Get an independent copy for look-ahead search"""
+        clone = Game.__new__(Game)
+        clone.board = self.board.copy()
+        clone.current_player = self.current_player
+        clone.game_over = self.game_over
+        clone.forfeited_by = self.forfeited_by
+        return clone
+
+    def forfeit(self, player_id: int) -> None:
+        """End the game as a loss for a player, e.g. on time or abandonment"""
+        if self.game_over:
+            return
+
+        self.forfeited_by = player_id
+        self.game_over = True
+
+    def get_winner(self) -> int | None:
+        """Get the winner, counting forfeits (None if not over, -1 for a draw)"""
+        if self.forfeited_by is not None:
+            return 1 - self.forfeited_by
+
+        return self.board.get_winner() if self.game_over else None
+
+    @overload
+    def make_move(self, pit_index: int) -> tuple[bool, str]: ...
+
+    @overload
+    def make_move(self, pit_index: int, trace: Literal[False]) -> tuple[bool, str]: ...
 
-    def make_move(self, pit_index: int) -> tuple[bool, str]:
-        """Make a move from the selected pit"""
+    @overload
+    def make_move(
+        self, pit_index: int, trace: Literal[True]
+    ) -> tuple[bool, str, MoveTrace | None]: ...
+
+    def make_move(self, pit_index: int, trace: bool = False):
+        """Make a move from the selected pit, optionally returning its trace"""
+        success, message, move_trace = self._make_move(pit_index, trace)
+        if trace:
+            return success, message, move_trace
+
+        return success, message
+
+    def _make_move(
+        self, pit_index: int, trace: bool
+    ) -> tuple[bool, str, MoveTrace | None]:
         # Validate move
         if self.game_over:
-            return False, "Game is already over."
+            return False, "Game is already over.", None
 
-        player_pits = self.board.get_player_pits(self.current_player)
+        topology = self.board.topology
+        player_pits = topology.pit_ranges[self.current_player]
 
         if pit_index not in player_pits:
-            return False, "Invalid pit selected."
+            return False, "Invalid pit selected.", None
 
         if self.board.get_stones(pit_index) == 0:
-            return False, "Selected pit is empty."
+            return False, "Selected pit is empty.", None
 
         # Execute move
-        stones = self.board.get_stones(pit_index)
-        self.board.set_stones(pit_index, 0)
+        player_id = self.current_player
+        path: list[int] | None = [] if trace else None
+        last_pit = self.board.sow(pit_index, path)
+        capture_pit = None
+        captured_stones = 0
+
+        # Check if game is over
+        if self._check_game_over():
+            message = "Game over!"
 
-        current_index = pit_index
-        opponent_store = self.board.get_store_index(1 - self.current_player)
+        # Check if last stone was in player's store (get another turn)
+        elif last_pit == topology.store_indices[player_id]:
+            message = "You get another turn!"
 
-        # Distribute stones
-        while stones > 0:
-            current_index = (current_index + 1) % len(self.board.board)
-            # Skip opponent's store
-            if current_index == opponent_store:
-                continue
+        else:
+            # Check if last stone was in an empty pit on player's side
+            if last_pit in player_pits and self.board.get_stones(last_pit) == 1:
+                opposite_pit = topology.opposite[last_pit]
+                if self.board.get_stones(opposite_pit) > 0:
+                    # Capture stones
+                    capture_pit = opposite_pit
+                    captured_stones = self.board.capture(last_pit, player_id)
 
-            self.board.board[current_index] += 1
-            stones -= 1
+            # A capture can empty the opponent's side
+            if self._check_game_over():
+                message = "Game over!"
 
-        # Handle last stone special cases
-        last_pit = current_index
+            else:
+                # Switch player
+                self.current_player = 1 - player_id
+                message = "Move completed."
 
-        # Check if game is over
-        if self.board.is_game_over():
-            self.game_over = True
-            return True, "Game over!"
+        move_trace = None
+        if path is not None:
+            move_trace = MoveTrace(
+                player_id=player_id,
+                pit_index=pit_index,
+                path=tuple(path),
+                capture_pit=capture_pit,
+                captured_stones=captured_stones,
+                extra_turn=message == "You get another turn!",
+                game_over=self.game_over,
+            )
 
-        # Check if last stone was in player's store (get another turn)
-        if last_pit == self.board.get_store_index(self.current_player):
-            return True, "You get another turn!"
-
-        # Check if last stone was in an empty pit on player's side
-        player_pits = self.board.get_player_pits(self.current_player)
-        if last_pit in player_pits and self.board.get_stones(last_pit) == 1:
-            opposite_pit = self.board.get_opposite_pit_index(last_pit)
-            if opposite_pit is not None and self.board.get_stones(opposite_pit) > 0:
-                # Capture stones
-                player_store = self.board.get_store_index(self.current_player)
-                self.board.board[player_store] += (
-                    self.board.get_stones(opposite_pit) + 1
-                )
-                self.board.set_stones(opposite_pit, 0)
-                self.board.set_stones(last_pit, 0)
-
-        # Switch player
-        self.current_player = 1 - self.current_player
-        return True, "Move completed."
+        return True, message, move_trace
+
+    def _check_game_over(self) -> bool:
+        """Finish the game, sweeping leftover stones, if one side is empty"""
+        if not self.board.is_game_over():
+            return False
+
+        self.board.collect_remaining_stones()
+        self.game_over = True
+        return True
@@ -1,5 +1,4 @@
-from pydantic.dataclasses import dataclass
-
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
@@ -11,4 +10,4 @@ class Move:
     captured: bool = False
     captured_stones: int = 0
     extra_turn: bool = False
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
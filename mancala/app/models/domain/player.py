@@ -1,4 +1,4 @@
-from pydantic.dataclasses import dataclass
+from dataclasses import dataclass
 
 from mancala.app.models.domain.enum import PlayerTypeEnum
 
@@ -0,0 +1,261 @@
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from mancala.app.models.domain.board import Board
+from mancala.app.models.domain.evaluation import Evaluator, HeuristicEvaluator
+from mancala.app.models.domain.game import Game
+
+# Plies expanded before handing subtrees to the pool: up to 36 tasks on the
+# standard board, enough to keep several workers busy despite uneven subtrees
+SPLIT_DEPTH = 2
+
+# (pits, stones, board cells, side to move), small enough to send to a worker
+Position = tuple[int, int, list[int], int]
+
+
+@dataclass(slots=True)
+class SearchNode:
+    player_id: int
+    value: float | None = None  # Set for terminal positions and after backup
+    leaf: int | None = None  # Index into the pending evaluation batch
+    children: list[tuple[int, "SearchNode"]] = field(default_factory=list)
+
+
+class SearchAgent:
+    """Fixed-depth minimax that evaluates all frontier positions in one batch
+
+    With `workers` above one, the tree is expanded a couple of plies deep and
+    the subtrees below are searched by a process pool. Each subtree's value is
+    exactly what a single process would compute, so the chosen move is too.
+    """
+
+    def __init__(
+        self, evaluator: Evaluator | None = None, depth: int = 4, workers: int = 1
+    ) -> None:
+        self.evaluator = evaluator or HeuristicEvaluator()
+        self.depth = depth
+        self.workers = workers
+
+    @property
+    def config_key(self) -> tuple:
+        """Identifies the search settings, for caching results per config"""
+        return ("search", self.depth, self.evaluator.name)
+
+    def pinned(self) -> "SearchAgent":
+        """This agent with its evaluator fixed at the current weights"""
+        evaluator = self.evaluator.snapshot()
+        if evaluator is self.evaluator:
+            return self
+
+        return SearchAgent(evaluator, self.depth, self.workers)
+
+    def choose_move(self, game: Game) -> int | None:
+        """Choose the move with the best minimax value"""
+        move, _ = self.search(game)
+        return move
+
+    def search(self, game: Game) -> tuple[int | None, float]:
+        """Search to the configured depth and return (best move, value)"""
+        move, value, _ = self.analyse(game)
+        return move, value
+
+    def analyse(self, game: Game) -> tuple[int | None, float, dict[int, float]]:
+        """Search and also return the value of every root move"""
+        if self._splits(game):
+            root, frontier = self._split(game)
+            futures = self._submit(frontier, game.current_player)
+            return self._finish_split(root, game, [f.result() for f in futures])
+
+        root_player = game.current_player
+        leaves: list[list[int]] = []
+        root = self._expand(game, self.depth, root_player, leaves)
+        move, value = self._backup(
+            root, root_player, self._evaluate(leaves, root_player)
+        )
+        return move, value, self._root_values(root)
+
+    async def choose_move_async(self, game: Game) -> int | None:
+        """Choose a move, yielding to the event loop while searching"""
+        move, _ = await self.search_async(game)
+        return move
+
+    async def search_async(self, game: Game) -> tuple[int | None, float]:
+        """Same result as search(), but yields after expanding each root move"""
+        move, value, _ = await self.analyse_async(game)
+        return move, value
+
+    async def analyse_async(
+        self, game: Game
+    ) -> tuple[int | None, float, dict[int, float]]:
+        """Same result as analyse(), but yields after expanding each root move"""
+        if game.game_over or self.depth == 0:
+            return self.analyse(game)
+
+        if self._splits(game):
+            root, frontier = self._split(game)
+            futures = self._submit(frontier, game.current_player)
+            results = await asyncio.gather(*map(asyncio.wrap_future, futures))
+            return self._finish_split(root, game, results)
+
+        root_player = game.current_player
+        leaves: list[list[int]] = []
+        root = SearchNode(player_id=root_player)
+
+        for pit in game.board.legal_moves(root_player):
+            child = game.copy()
+            child.make_move(pit)
+            root.children.append(
+                (pit, self._expand(child, self.depth - 1, root_player, leaves))
+            )
+            await asyncio.sleep(0)
+
+        move, value = self._backup(
+            root, root_player, self._evaluate(leaves, root_player)
+        )
+        return move, value, self._root_values(root)
+
+    def _splits(self, game: Game) -> bool:
+        return self.workers > 1 and self.depth > SPLIT_DEPTH and not game.game_over
+
+    def _split(self, game: Game) -> tuple[SearchNode, list[Position]]:
+        """Expand the top of the tree, collecting the positions below it"""
+        frontier: list[Position] = []
+        root = self._expand(game, SPLIT_DEPTH, game.current_player, [], frontier)
+        return root, frontier
+
+    def _submit(self, frontier: list[Position], root_player: int) -> list[Future]:
+        # Interleaved batches, so neighbouring (similar sized) subtrees spread out
+        pool = _get_pool(self.workers)
+        batches = min(len(frontier), 4 * self.workers)
+        return [
+            pool.submit(
+                _search_subtrees,
+                self.evaluator,
+                self.depth - SPLIT_DEPTH,
+                root_player,
+                frontier[i::batches],
+            )
+            for i in range(batches)
+        ]
+
+    def _finish_split(
+        self, root: SearchNode, game: Game, results: list[list[float]]
+    ) -> tuple[int | None, float, dict[int, float]]:
+        # Undo the interleaving so each value lines up with its frontier position
+        values = [0.0] * sum(map(len, results))
+        for i, batch in enumerate(results):
+            values[i :: len(results)] = batch
+
+        move, value = self._backup(root, game.current_player, values)
+        return move, value, self._root_values(root)
+
+    @staticmethod
+    def _root_values(root: SearchNode) -> dict[int, float]:
+        return {
+            move: child.value
+            for move, child in root.children
+            if child.value is not None
+        }
+
+    def _evaluate(self, leaves: list[list[int]], root_player: int) -> list[float]:
+        if not leaves:
+            return []
+
+        return self.evaluator.evaluate_batch(leaves, [root_player] * len(leaves))
+
+    def _expand(
+        self,
+        game: Game,
+        depth: int,
+        root_player: int,
+        leaves: list[list[int]],
+        frontier: list[Position] | None = None,
+    ) -> SearchNode:
+        node = SearchNode(player_id=game.current_player)
+
+        if game.game_over:
+            winner = game.board.get_winner()
+            node.value = (
+                0.0 if winner == -1 else (1.0 if winner == root_player else -1.0)
+            )
+            return node
+
+        if depth == 0:
+            board = game.board
+            if frontier is not None:
+                # Searched further elsewhere; the value arrives with the rest
+                node.leaf = len(frontier)
+                frontier.append(
+                    (board.pits, board.stones, list(board.board), game.current_player)
+                )
+                return node
+
+            node.leaf = len(leaves)
+            leaves.append(list(board.board))
+            return node
+
+        for pit in game.board.legal_moves(game.current_player):
+            child = game.copy()
+            child.make_move(pit)
+            node.children.append(
+                (pit, self._expand(child, depth - 1, root_player, leaves, frontier))
+            )
+
+        return node
+
+    def _backup(
+        self, node: SearchNode, root_player: int, values: list[float]
+    ) -> tuple[int | None, float]:
+        if node.value is not None:
+            return None, node.value
+
+        if node.leaf is not None:
+            node.value = values[node.leaf]
+            return None, node.value
+
+        # Extra turns keep the same player to move, so maximise by owner
+        maximising = node.player_id == root_player
+        best_move, best_value = None, 0.0
+        for move, child in node.children:
+            _, value = self._backup(child, root_player, values)
+            if (
+                best_move is None
+                or (maximising and value > best_value)
+                or (not maximising and value < best_value)
+            ):
+                best_move, best_value = move, value
+
+        node.value = best_value
+        return best_move, best_value
+
+
+@lru_cache
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    # One pool per size, shared by every agent in the process
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _search_subtrees(
+    evaluator: Evaluator, depth: int, root_player: int, positions: list[Position]
+) -> list[float]:
+    """Search positions in a pool worker, valued for the player at the root"""
+    agent = SearchAgent(evaluator, depth)
+    values = []
+    for pits, stones, cells, current_player in positions:
+        game = Game()
+        if pits != game.board.pits or stones != game.board.stones:
+            game.board = Board(pits, stones)
+
+        game.board.load(cells)
+        game.current_player = current_player
+
+        leaves: list[list[int]] = []
+        node = agent._expand(game, depth, root_player, leaves)
+        _, value = agent._backup(
+            node, root_player, agent._evaluate(leaves, root_player)
+        )
+        values.append(value)
+
+    return values
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from mancala.app.models.domain.enum import GameStatusEnum
+from mancala.app.models.domain.trace import MoveTrace
+
+
+@dataclass
+class GameState:
+    """Snapshot of a game as reported by the services and the API"""
+
+    id: UUID
+    board: list[int]
+    current_player: int
+    status: GameStatusEnum
+    winner: int | None = None
+    clocks: list[float] | None = None  # Seconds left per player, if timed
+
+
+@dataclass
+class MoveResult:
+    """Outcome of applying one move through a service"""
+
+    success: bool
+    message: str
+    extra_turn: bool = False
+    is_game_over: bool = False
+    trace: MoveTrace | None = None
+
+
+@dataclass
+class GamePage:
+    """One page of a game listing, newest first"""
+
+    items: list[GameState]
+    total: int  # Games matching the filters, across all pages
+    position: int  # Matching games listed on earlier pages
+    next_cursor: str | None = None
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+
+from mancala.app.models.domain.enum import PlayerTypeEnum
+
+
+@dataclass(slots=True)
+class Record:
+    """Wins, losses and draws against one kind of opponent"""
+
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+
+@dataclass(slots=True)
+class PlayerStats:
+    """Running totals over every finished game a player (by name) took part in"""
+
+    name: str
+    games: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    margin: int = 0  # Own store minus the opponent's, summed over games
+    vs_agent: Record = field(default_factory=Record)
+    vs_human: Record = field(default_factory=Record)
+
+    @property
+    def average_margin(self) -> float:
+        return self.margin / self.games if self.games else 0.0
+
+    def add(self, result: int, margin: int, opponent: PlayerTypeEnum) -> None:
+        """Count one game: result is 1 for a win, -1 for a loss, 0 for a draw"""
+        record = self.vs_agent if opponent == PlayerTypeEnum.AGENT else self.vs_human
+        self.games += 1
+        self.margin += margin
+        if result > 0:
+            self.wins += 1
+            record.wins += 1
+
+        elif result < 0:
+            self.losses += 1
+            record.losses += 1
+
+        else:
+            self.draws += 1
+            record.draws += 1
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True, slots=True)
+class BoardTopology:
+    """Lookup tables describing the layout of a board with a given pit count"""
+
+    pits: int
+    size: int
+    pit_ranges: tuple[range, range]
+    store_indices: tuple[int, int]
+
+    # Per board index: owning player and opposite pit (None for stores)
+    owners: tuple[int | None, ...]
+    opposite: tuple[int | None, ...]
+
+    # Per player: the slot after each index, skipping the opponent's store
+    next_slot: tuple[tuple[int, ...], tuple[int, ...]]
+
+    # Per player: sowing order from their first pit, and each index's position
+    # in it (-1 for the skipped store)
+    sowing_cycles: tuple[tuple[int, ...], tuple[int, ...]]
+    sowing_positions: tuple[tuple[int, ...], tuple[int, ...]]
+
+
+@lru_cache(maxsize=None)
+def get_topology(pits: int) -> BoardTopology:
+    """Get the shared topology for boards with `pits` pits per side"""
+    if pits < 1:
+        raise ValueError("A board needs at least one pit per side")
+
+    size = 2 * pits + 2
+    pit_ranges = (range(0, pits), range(pits + 1, 2 * pits + 1))
+    store_indices = (pits, 2 * pits + 1)
+
+    owners = tuple(
+        0 if i in pit_ranges[0] else 1 if i in pit_ranges[1] else None
+        for i in range(size)
+    )
+    opposite = tuple(
+        None if owner is None else 2 * pits - i for i, owner in enumerate(owners)
+    )
+
+    sowing_cycles = (
+        tuple(i for i in range(size) if i != store_indices[1]),
+        tuple((pits + 1 + i) % size for i in range(size - 1)),
+    )
+    sowing_positions = tuple(
+        tuple(cycle.index(i) if i in cycle else -1 for i in range(size))
+        for cycle in sowing_cycles
+    )
+
+    next_slot = tuple(
+        tuple(
+            (i + 2) % size
+            if (i + 1) % size == store_indices[1 - player]
+            else (i + 1) % size
+            for i in range(size)
+        )
+        for player in (0, 1)
+    )
+
+    return BoardTopology(
+        pits=pits,
+        size=size,
+        pit_ranges=pit_ranges,
+        store_indices=store_indices,
+        owners=owners,
+        opposite=opposite,
+        next_slot=next_slot,
+        sowing_cycles=sowing_cycles,
+        sowing_positions=sowing_positions,
+    )
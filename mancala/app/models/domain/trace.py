@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class MoveTrace:
+    """What a single sowing move did, in the order it happened"""
+
+    player_id: int
+    pit_index: int
+    path: tuple[int, ...]  # Board indices that received a stone, in order
+    capture_pit: int | None = None  # Opposite pit emptied by a capture
+    captured_stones: int = 0
+    extra_turn: bool = False
+    game_over: bool = False
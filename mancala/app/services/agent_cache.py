@@ -0,0 +1,128 @@
+import json
+import os
+from typing import Any
+
+from mancala.app.core.cache import LRUCache
+from mancala.app.models.domain.game import Game
+
+# (pits, stones, board bytes, side to move, agent config)
+PositionKey = tuple[int, int, bytes, int, tuple]
+
+
+def position_key(game: Game, config_key: tuple) -> PositionKey:
+    """Key a position by ruleset, board, side to move and agent settings"""
+    board = game.board
+    return (
+        board.pits,
+        board.stones,
+        board.board.tobytes(),
+        game.current_player,
+        config_key,
+    )
+
+
+class CachedAgent:
+    """Wraps an agent so each position is only ever decided once per worker
+
+    Agents without a `config_key` (or with None) are passed straight through,
+    since their choices may not depend on the position alone.
+    """
+
+    def __init__(
+        self, agent: Any, cache: LRUCache[PositionKey, int] | None = None
+    ) -> None:
+        self.agent = agent
+        self.cache = LRUCache(maxsize=500_000) if cache is None else cache
+
+    @property
+    def config_key(self) -> tuple | None:
+        return getattr(self.agent, "config_key", None)
+
+    def lookup(self, game: Game) -> int | None:
+        """The cached move for a position, without ever searching
+
+        Only hits are counted; a miss is counted by the search that follows.
+        """
+        config_key = getattr(self._pinned(), "config_key", None)
+        if config_key is None:
+            return None
+
+        key = position_key(game, config_key)
+        if self.cache.peek(key) is None:
+            return None
+
+        return self.cache.get(key)
+
+    def choose_move(self, game: Game) -> int | None:
+        agent = self._pinned()
+        config_key = getattr(agent, "config_key", None)
+        if config_key is None:
+            return agent.choose_move(game)
+
+        key = position_key(game, config_key)
+        move = self.cache.get(key)
+        if move is None:
+            move = agent.choose_move(game)
+            if move is not None:
+                self.cache.put(key, move)
+
+        return move
+
+    async def choose_move_async(self, game: Game) -> int | None:
+        agent = self._pinned()
+        config_key = getattr(agent, "config_key", None)
+        key = position_key(game, config_key) if config_key is not None else None
+        if key is not None:
+            move = self.cache.get(key)
+            if move is not None:
+                return move
+
+        if hasattr(agent, "choose_move_async"):
+            move = await agent.choose_move_async(game)
+        else:
+            move = agent.choose_move(game)
+
+        if key is not None and move is not None:
+            self.cache.put(key, move)
+
+        return move
+
+    def _pinned(self) -> Any:
+        # One snapshot of swappable weights serves both the key and the search
+        pinned = getattr(self.agent, "pinned", None)
+        return self.agent if pinned is None else pinned()
+
+
+def save_cache(cache: LRUCache[PositionKey, int], path: str) -> int:
+    """Write every cached choice to disk, returning the count"""
+    entries = [
+        [pits, stones, cells.hex(), side, list(config), move]
+        for (pits, stones, cells, side, config), move in cache.entries.items()
+    ]
+
+    # Write atomically so a crash never leaves a truncated warm-start file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"entries": entries}, f)
+
+    os.replace(tmp, path)
+    return len(entries)
+
+
+def load_cache(cache: LRUCache[PositionKey, int], path: str) -> int:
+    """Warm a cache from a file written by `save_cache`, returning the count
+
+    Entries keep the agent settings they were decided with, so choices made
+    under settings no longer in use are simply never looked up.
+    """
+    if not os.path.exists(path):
+        return 0
+
+    with open(path) as f:
+        data = json.load(f)
+
+    for pits, stones, cells, side, config, move in data["entries"]:
+        key = (pits, stones, bytes.fromhex(cells), side, tuple(config))
+        cache.put(key, move)
+
+    return len(data["entries"])
@@ -0,0 +1,157 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from mancala.app.core.cache import LRUCache
+from mancala.app.models.api import AnalysisJobResponse, MoveAnalysis
+from mancala.app.models.domain.enum import AnalysisStatusEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+# (best move, best value, value of every legal move) for one position
+PositionAnalysis = tuple[int | None, float, dict[int, float]]
+
+
+@dataclass
+class AnalysisJob:
+    id: UUID
+    game_id: UUID
+    total: int
+    status: AnalysisStatusEnum = AnalysisStatusEnum.PENDING
+    moves: list[MoveAnalysis] = field(default_factory=list)
+    error: str | None = None
+
+    def to_response(self) -> AnalysisJobResponse:
+        return AnalysisJobResponse(
+            job_id=self.id,
+            game_id=self.game_id,
+            status=self.status,
+            progress=len(self.moves),
+            total=self.total,
+            moves=self.moves,
+            error=self.error,
+        )
+
+
+class AnalysisService:
+    """Annotates game histories with a search agent, caching every position"""
+
+    def __init__(
+        self,
+        agent: SearchAgent | None = None,
+        cache: LRUCache[tuple, PositionAnalysis] | None = None,
+        max_jobs: int = 1000,
+    ) -> None:
+        self.agent = agent or SearchAgent(depth=6)
+        self.cache = LRUCache(maxsize=200_000) if cache is None else cache
+        self.max_jobs = max_jobs
+        self.jobs: OrderedDict[UUID, AnalysisJob] = OrderedDict()
+        self.tasks: set[asyncio.Task] = set()
+
+    async def analyse_position(self, game: Game) -> tuple[PositionAnalysis, bool]:
+        """Search one position, or return the cached result and True"""
+        # Keyed and searched with one snapshot of the evaluator's weights
+        agent = self.agent.pinned()
+        board = game.board
+        key = (
+            board.pits,
+            board.stones,
+            tuple(board.board),
+            game.current_player,
+            agent.config_key,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        analysis = await agent.analyse_async(game)
+        self.cache.put(key, analysis)
+        return analysis, False
+
+    async def analyse_moves(
+        self,
+        moves: list[int],
+        job: AnalysisJob | None = None,
+        pits: int = 6,
+        stones: int = 6,
+    ) -> list[MoveAnalysis]:
+        """Replay a move list from the start, annotating every ply"""
+        game = Game(pits, stones)
+        annotations = job.moves if job else []
+
+        for ply, move in enumerate(moves):
+            player = game.current_player
+            (best_move, best_value, move_values), cached = await self.analyse_position(
+                game
+            )
+            if move not in move_values:
+                raise ValueError(f"Illegal move {move} at ply {ply}")
+
+            value = move_values[move]
+            annotations.append(
+                MoveAnalysis(
+                    ply=ply,
+                    player=player,
+                    pit=_pit_number(move, pits),
+                    best_pit=None
+                    if best_move is None
+                    else _pit_number(best_move, pits),
+                    value=value,
+                    best_value=best_value,
+                    loss=best_value - value,
+                    cached=cached,
+                )
+            )
+            game.make_move(move)
+
+            # Let other requests run between positions
+            await asyncio.sleep(0)
+
+        return annotations
+
+    def submit(
+        self, game_id: UUID, moves: list[int], pits: int = 6, stones: int = 6
+    ) -> AnalysisJob:
+        """Start a background analysis job and return it for polling"""
+        job = AnalysisJob(id=uuid4(), game_id=game_id, total=len(moves))
+        self.jobs[job.id] = job
+        self._evict_jobs()
+
+        task = asyncio.create_task(self._run(job, list(moves), pits, stones))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return job
+
+    def get_job(self, job_id: UUID) -> AnalysisJob:
+        if job_id not in self.jobs:
+            raise ValueError(f"Analysis job with ID {job_id} not found")
+
+        return self.jobs[job_id]
+
+    async def _run(
+        self, job: AnalysisJob, moves: list[int], pits: int, stones: int
+    ) -> None:
+        job.status = AnalysisStatusEnum.RUNNING
+        try:
+            await self.analyse_moves(moves, job, pits, stones)
+            job.status = AnalysisStatusEnum.DONE
+
+        except ValueError as err:
+            job.status = AnalysisStatusEnum.FAILED
+            job.error = str(err)
+
+    def _evict_jobs(self) -> None:
+        # Drop the oldest finished jobs once over the limit
+        finished = (AnalysisStatusEnum.DONE, AnalysisStatusEnum.FAILED)
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= self.max_jobs:
+                break
+
+            if self.jobs[job_id].status in finished:
+                del self.jobs[job_id]
+
+
+def _pit_number(pit_index: int, pits: int) -> int:
+    """Convert a board index to the 1-based pit number on its owner's side"""
+    return pit_index + 1 if pit_index < pits else pit_index - pits
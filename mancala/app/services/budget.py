@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from mancala.app.models.domain.game import Game
+from mancala.app.services.game import choose_move_async
+
+
+class BudgetScheduler:
+    """Shares one latency budget between every pending agent decision
+
+    Moves any tier already has cached are answered before admission, without
+    waiting or counting toward the budget. Searches run one at a time, through
+    the tier's async search where it has one so other requests are served
+    between root moves, and a new search will take the estimated cost of
+    everything admitted ahead of it plus its own. Each search gets the
+    strongest tier whose estimate fits `target_latency`; when none fits, the
+    cheap fallback answers at once. Estimates are running averages of
+    measured decisions plus their running deviation, as for TCP round-trip
+    times, so search depth drops under load and recovers as the queue drains.
+    """
+
+    def __init__(
+        self,
+        tiers: list[Any],
+        fallback: Any,
+        target_latency: float = 0.25,
+        costs: list[float] | None = None,
+        smoothing: float = 0.2,
+        window: int = 1000,
+    ) -> None:
+        if not tiers:
+            raise ValueError("At least one tier is required")
+
+        self.tiers = tiers  # Strongest first
+        self.fallback = fallback
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+
+        # Seconds per decision; a cautious guess until real ones are measured
+        self.costs = list(costs) if costs else [target_latency / 2] * len(tiers)
+        self.deviations = [0.0] * len(tiers)
+        self.backlog = 0.0  # Estimated seconds of admitted, unfinished work
+        self.pending = 0
+        self.slot = asyncio.Lock()
+
+        self.decisions = [0] * len(tiers)
+        self.hits = 0
+        self.fallbacks = 0
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def config_key(self) -> None:
+        # The answer depends on load, so never cache the scheduler as a whole
+        return None
+
+    def choose_move(self, game: Game) -> int | None:
+        """Synchronous callers get the strongest tier that fits the target"""
+        tier = self._pick(0.0)
+        agent = self.fallback if tier is None else self.tiers[tier]
+        return agent.choose_move(game)
+
+    async def choose_move_async(self, game: Game) -> int | None:
+        start = time.perf_counter()
+        move = self._cached(game, self.tiers)
+        if move is not None:
+            self.hits += 1
+            self.latencies.append(time.perf_counter() - start)
+            return move
+
+        tier = self._pick(self.backlog)
+        if tier is None:
+            self.fallbacks += 1
+            move = self.fallback.choose_move(game)
+            self.latencies.append(time.perf_counter() - start)
+            return move
+
+        estimate = self._estimate(tier)
+        self.backlog += estimate
+        self.pending += 1
+        self.decisions[tier] += 1
+        try:
+            async with self.slot:
+                # An identical search queued ahead of this one may have
+                # answered it; only real searches update the estimates
+                move = self._cached(game, self.tiers[tier : tier + 1])
+                if move is None:
+                    began = time.perf_counter()
+                    move = await choose_move_async(self.tiers[tier], game)
+                    self._measured(tier, time.perf_counter() - began)
+
+        finally:
+            self.backlog -= estimate
+            self.pending -= 1
+
+        self.latencies.append(time.perf_counter() - start)
+        return move
+
+    def stats(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(pct: float) -> float:
+            if not latencies:
+                return 0.0
+
+            return latencies[min(len(latencies) - 1, int(pct / 100 * len(latencies)))]
+
+        return {
+            "pending": self.pending,
+            "backlog_seconds": self.backlog,
+            "target_latency": self.target_latency,
+            "tiers": [
+                {
+                    "agent": repr(getattr(tier, "config_key", None)),
+                    "decisions": decisions,
+                    "cost_seconds": self.costs[i],
+                    "estimate_seconds": self._estimate(i),
+                }
+                for i, (tier, decisions) in enumerate(zip(self.tiers, self.decisions))
+            ],
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "latency_p50": percentile(50),
+            "latency_p99": percentile(99),
+        }
+
+    def _cached(self, game: Game, tiers: list[Any]) -> int | None:
+        """A move one of these tiers has already decided for this position
+
+        Probing counts no misses, so each cold decision adds one miss to the
+        cache stats, from its search, and each answer found adds one hit.
+        """
+        for tier in tiers:
+            lookup = getattr(tier, "lookup", None)
+            move = None if lookup is None else lookup(game)
+            if move is not None:
+                return move
+
+        return None
+
+    def _measured(self, tier: int, cost: float) -> None:
+        error = cost - self.costs[tier]
+        self.costs[tier] += self.smoothing * error
+        self.deviations[tier] += self.smoothing * (abs(error) - self.deviations[tier])
+
+    def _pick(self, backlog: float) -> int | None:
+        """Strongest tier expected to finish within the target, if any"""
+        for tier in range(len(self.tiers)):
+            if backlog + self._estimate(tier) <= self.target_latency:
+                return tier
+
+        return None
+
+    def _estimate(self, tier: int) -> float:
+        return self.costs[tier] + self.deviations[tier]
@@ -0,0 +1,148 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+from mancala.app.core.timers import Timer, TimerWheel
+from mancala.app.models.domain.game import Game
+
+
+@dataclass(frozen=True)
+class TimeControl:
+    initial: float  # Seconds on each player's clock
+    increment: float = 0.0  # Seconds added after each of a player's moves
+
+
+@dataclass
+class GameClock:
+    control: TimeControl
+    remaining: list[float]
+    running_since: float  # When the player to move's clock started
+
+    def left(self, player_id: int, to_move: int, now: float) -> float:
+        """Seconds a player has left, counting the running clock"""
+        remaining = self.remaining[player_id]
+        if player_id == to_move:
+            remaining -= now - self.running_since
+
+        return remaining
+
+    def press(self, mover: int, now: float) -> None:
+        """Charge the mover for their move and restart the clock"""
+        self.remaining[mover] -= now - self.running_since
+        self.remaining[mover] += self.control.increment
+        self.running_since = now
+
+
+class GameTimers:
+    """Chess clocks and idle deadlines for many games on one timing wheel
+
+    Each game holds at most one clock deadline (the player to move's flag)
+    and one idle deadline, both replaced in O(1) after every move. Expired
+    deadlines come back from `expired` as (kind, game ID) pairs.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float | None = None,
+        resolution: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.wheel = TimerWheel(resolution, now=clock())
+        self.clocks: dict[UUID, GameClock] = {}
+        self.handles: dict[UUID, dict[str, Timer]] = {}
+        self.activity: dict[UUID, float] = {}
+
+    def start(self, game_id: UUID, control: TimeControl | None = None) -> None:
+        """Start tracking a new game, with player 1 on the clock"""
+        now = self.clock()
+        if control is not None:
+            self.clocks[game_id] = GameClock(
+                control, [control.initial, control.initial], now
+            )
+            self._schedule(game_id, "clock", now + control.initial)
+
+        self.touch(game_id)
+
+    def touch(self, game_id: UUID) -> None:
+        """Record activity, pushing the idle deadline back"""
+        now = self.clock()
+        self.activity[game_id] = now
+        if self.idle_timeout is not None:
+            self._schedule(game_id, "idle", now + self.idle_timeout)
+
+    def moved(self, game_id: UUID, mover: int, game: Game) -> None:
+        """Charge a completed move and hand the clock to the player to move"""
+        clock = self.clocks.get(game_id)
+        if clock is not None:
+            now = self.clock()
+            clock.press(mover, now)
+            if game.game_over:
+                self._cancel(game_id, "clock")
+
+            else:
+                remaining = clock.remaining[game.current_player]
+                self._schedule(game_id, "clock", now + remaining)
+
+        self.touch(game_id)
+
+    def flagged(self, game_id: UUID, player_id: int) -> bool:
+        """Check if the player to move has run out of time"""
+        clock = self.clocks.get(game_id)
+        if clock is None:
+            return False
+
+        return clock.left(player_id, player_id, self.clock()) <= 0
+
+    def flag(self, game_id: UUID, player_id: int) -> None:
+        """Stop a timed game's clock with a player out of time"""
+        clock = self.clocks.get(game_id)
+        if clock is not None:
+            clock.remaining[player_id] = 0.0
+            self._cancel(game_id, "clock")
+
+    def is_idle(self, game_id: UUID) -> bool:
+        if self.idle_timeout is None or game_id not in self.activity:
+            return False
+
+        return self.clock() - self.activity[game_id] >= self.idle_timeout
+
+    def remaining(self, game_id: UUID, game: Game) -> list[float] | None:
+        """Both players' time left, or None for untimed games"""
+        clock = self.clocks.get(game_id)
+        if clock is None:
+            return None
+
+        to_move = -1 if game.game_over else game.current_player
+        now = self.clock()
+        return [max(0.0, clock.left(player, to_move, now)) for player in (0, 1)]
+
+    def stop(self, game_id: UUID) -> None:
+        """Forget a game and cancel its deadlines"""
+        for timer in self.handles.pop(game_id, {}).values():
+            self.wheel.cancel(timer)
+
+        self.clocks.pop(game_id, None)
+        self.activity.pop(game_id, None)
+
+    def expired(self) -> list[tuple[str, UUID]]:
+        """Advance to the current time and return the deadlines that passed"""
+        expired = self.wheel.advance(self.clock())
+        for kind, game_id in expired:
+            handles = self.handles.get(game_id)
+            if handles is not None:
+                handles.pop(kind, None)
+
+        return expired
+
+    def _schedule(self, game_id: UUID, kind: str, at: float) -> None:
+        self._cancel(game_id, kind)
+        timer = self.wheel.schedule(at, (kind, game_id))
+        self.handles.setdefault(game_id, {})[kind] = timer
+
+    def _cancel(self, game_id: UUID, kind: str) -> None:
+        timer = self.handles.get(game_id, {}).pop(kind, None)
+        if timer is not None:
+            self.wheel.cancel(timer)
@@ -0,0 +1,174 @@
+import struct
+from collections.abc import AsyncIterator, Iterator
+from json.encoder import encode_basestring_ascii as _quote
+from typing import Any, BinaryIO
+from uuid import UUID
+
+from mancala.app.models.domain.enum import ExportFormatEnum, PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.services.storage import GameRecord
+
+# Response header carrying the `since` value for the next incremental export
+CURSOR_HEADER = "X-Export-Cursor"
+
+MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.BINARY: "application/octet-stream",
+}
+
+# Binary exports open with this, then hold one record after another
+BINARY_MAGIC = b"MNCX\x01"
+
+# Game ID, finish key, pits, stones, result flags, agent flags, both scores,
+# then the lengths of each name and of the move list
+RECORD_HEADER = struct.Struct("<16sQBBBBHHHHH")
+
+WINNER_DRAW = 2
+FORFEIT = 4
+
+
+# Board indices are bytes, so their text is looked up rather than formatted
+_NUMBERS = [str(i) for i in range(256)]
+
+
+def _json(value: int | None) -> str:
+    return "null" if value is None else str(value)
+
+
+def _result(game: Game) -> tuple[int, int, int | None]:
+    """Both scores and the winner (None for a draw) of a finished game"""
+    cells = game.board.board
+    store1, store2 = game.board.topology.store_indices
+    score1, score2 = cells[store1], cells[store2]
+
+    if game.forfeited_by is not None:
+        return score1, score2, 1 - game.forfeited_by
+
+    if score1 == score2:
+        return score1, score2, None
+
+    return score1, score2, 0 if score1 > score2 else 1
+
+
+def encode_ndjson(chunk: list[tuple[int, UUID, GameRecord]]) -> bytes:
+    """One JSON object per game; moves are board indices in order"""
+    # Formatted by hand, as only the names need escaping and json.dumps
+    # would cost more than the rest of the export put together
+    lines = []
+    for key, game_id, record in chunk:
+        game = record.game
+        board = game.board
+        score1, score2, winner = _result(game)
+        first, second = record.player_names
+        agents = ",".join(
+            "true" if t == PlayerTypeEnum.AGENT else "false"
+            for t in record.player_types
+        )
+        lines.append(
+            f'{{"id":"{game_id}","finished":{key},"pits":{board.pits},'
+            f'"stones":{board.stones},"players":[{_quote(first)},'
+            f'{_quote(second)}],"agents":[{agents}],'
+            f'"moves":[{",".join(map(_NUMBERS.__getitem__, record.moves))}],'
+            f'"scores":[{score1},{score2}],"winner":{_json(winner)},'
+            f'"forfeited_by":{_json(game.forfeited_by)}}}\n'
+        )
+
+    return "".join(lines).encode()
+
+
+def encode_binary(chunk: list[tuple[int, UUID, GameRecord]]) -> bytes:
+    """A fixed header per game, followed by its names and moves"""
+    out = bytearray()
+    pack = RECORD_HEADER.pack
+    for key, game_id, record in chunk:
+        game = record.game
+        board = game.board
+        score1, score2, winner = _result(game)
+
+        flags = WINNER_DRAW if winner is None else winner
+        if game.forfeited_by is not None:
+            flags |= FORFEIT | game.forfeited_by << 3
+
+        agents = sum(
+            1 << i
+            for i, player_type in enumerate(record.player_types)
+            if player_type == PlayerTypeEnum.AGENT
+        )
+        first, second = (name.encode() for name in record.player_names)
+        out += pack(
+            game_id.bytes,
+            key,
+            board.pits,
+            board.stones,
+            flags,
+            agents,
+            score1,
+            score2,
+            len(first),
+            len(second),
+            len(record.moves),
+        )
+        out += first
+        out += second
+        out += bytes(record.moves)
+
+    return bytes(out)
+
+
+async def export_stream(
+    chunks: AsyncIterator[list[tuple[int, UUID, GameRecord]]],
+    fmt: ExportFormatEnum = ExportFormatEnum.NDJSON,
+) -> AsyncIterator[bytes]:
+    """Encode chunks of finished games as they arrive"""
+    if fmt == ExportFormatEnum.BINARY:
+        yield BINARY_MAGIC
+        encode = encode_binary
+
+    else:
+        encode = encode_ndjson
+
+    async for chunk in chunks:
+        if chunk:
+            yield encode(chunk)
+
+
+def read_binary(stream: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Decode a binary export back into game summaries"""
+    if stream.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("Not a binary game export")
+
+    size = RECORD_HEADER.size
+    while header := stream.read(size):
+        if len(header) < size:
+            raise ValueError("Truncated game export")
+
+        (
+            game_id,
+            key,
+            pits,
+            stones,
+            flags,
+            agents,
+            score1,
+            score2,
+            first_len,
+            second_len,
+            moves_len,
+        ) = RECORD_HEADER.unpack(header)
+        first = stream.read(first_len).decode()
+        second = stream.read(second_len).decode()
+        moves = stream.read(moves_len)
+
+        winner = flags & 3
+        yield {
+            "id": str(UUID(bytes=game_id)),
+            "finished": key,
+            "pits": pits,
+            "stones": stones,
+            "players": [first, second],
+            "agents": [bool(agents & 1), bool(agents & 2)],
+            "moves": list(moves),
+            "scores": [score1, score2],
+            "winner": None if winner == WINNER_DRAW else winner,
+            "forfeited_by": flags >> 3 & 1 if flags & FORFEIT else None,
+        }
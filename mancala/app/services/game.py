@@ -1,20 +1,103 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID, uuid4
 
 from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.enum import GameStatusEnum, PlayerTypeEnum
 from mancala.app.models.domain.game import Game
-from mancala.app.models.domain.enum import PlayerTypeEnum, GameStatusEnum
-from mancala.app.models.api import GameState, MoveResult, PlayerCreate
+from mancala.app.models.domain.player import Player
+from mancala.app.models.domain.state import GamePage, GameState, MoveResult
+from mancala.app.services.agent_cache import CachedAgent
+from mancala.app.services.clock import GameTimers, TimeControl
+from mancala.app.services.index import GameIndex
+from mancala.app.services.stats import StatsService
+from mancala.app.services.storage import GameRecord, GameStore, InMemoryGameStore
+
+logger = logging.getLogger(__name__)
+
+
+def _board_index(game: Game, pit_index: int) -> int | None:
+    """Convert a 1-based pit number on the mover's side to a board index
+
+    Returns None if the game's ruleset has no such pit.
+    """
+    if not 1 <= pit_index <= game.board.pits:
+        return None
+
+    # Convert from 1-based to 0-based index for player 1
+    if game.current_player == 0:
+        return pit_index - 1
+
+    # For player 2, adjust the index
+    return game.board.pits + pit_index
+
+
+def _no_such_pit(game: Game) -> MoveResult:
+    return MoveResult(False, f"Pit must be between 1 and {game.board.pits}.")
+
+
+def _play(game: Game, pit_index: int, trace: bool) -> MoveResult:
+    """Apply a board-index move and describe the outcome"""
+    move_trace = None
+    if trace:
+        success, message, move_trace = game.make_move(pit_index, trace=True)
+    else:
+        success, message = game.make_move(pit_index)
+
+    return MoveResult(
+        success=success,
+        message=message,
+        extra_turn=message == "You get another turn!",
+        is_game_over=game.game_over,
+        trace=move_trace,
+    )
+
+
+def _build_state(
+    game_id: UUID, game: Game, clocks: list[float] | None = None
+) -> GameState:
+    winner = game.get_winner()
+
+    return GameState(
+        id=game_id,
+        board=list(game.board.board),
+        current_player=game.current_player,
+        status=GameStatusEnum.OVER if game.game_over else GameStatusEnum.ACTIVE,
+        winner=winner,
+        clocks=clocks,
+    )
+
+
+def _to_key(moment: datetime | None) -> int | None:
+    """Convert a time to the index's nanosecond creation keys"""
+    if moment is None:
+        return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+
+    return int(moment.timestamp() * 1_000_000_000)
+
+
+async def choose_move_async(agent: Any, game: Game) -> int | None:
+    """Ask an agent for a move, letting long searches yield to the event loop"""
+    if hasattr(agent, "choose_move_async"):
+        return await agent.choose_move_async(game)
+
+    return agent.choose_move(game)
 
 
 class GameService:
     def __init__(self):
         self.games: dict[UUID, Game] = {}
         self.game_types: dict[UUID, tuple[PlayerTypeEnum, PlayerTypeEnum]] = {}
-        self.agent = Agent()
+        self.agent = CachedAgent(Agent())
 
-    def create(
-        self, player1: PlayerCreate, player2: PlayerCreate | None = None
-    ) -> UUID:
+    def create(self, player1: Player, player2: Player | None = None) -> UUID:
         game = Game()
         game_id = uuid4()
         self.games[game_id] = game
@@ -31,37 +114,23 @@ class GameService:
 
         return self.games[game_id]
 
+    def delete(self, game_id: UUID) -> None:
+        self.get(game_id)
+        del self.games[game_id]
+        self.game_types.pop(game_id, None)
+
     def get_state(self, game_id: UUID) -> GameState:
-        game = self.get(game_id)
-        winner = game.board.get_winner() if game.game_over else None
-
-        return GameState(
-            id=game_id,
-            board=game.board.board,
-            current_player=game.current_player,
-            status=GameStatusEnum.OVER if game.game_over else GameStatusEnum.ACTIVE,
-            winner=winner,
-        )
+        return _build_state(game_id, self.get(game_id))
 
-    def make_move(self, game_id: UUID, pit_index: int) -> MoveResult:
+    def make_move(
+        self, game_id: UUID, pit_index: int, trace: bool = False
+    ) -> MoveResult:
         game = self.get(game_id)
+        board_index = _board_index(game, pit_index)
+        if board_index is None:
+            return _no_such_pit(game)
 
-        # Convert from 1-based to 0-based index for player 1
-        if game.current_player == 0:
-            pit_index -= 1
-
-        # For player 2, adjust the index
-        else:
-            pit_index = game.board.pits + pit_index
-
-        success, message = game.make_move(pit_index)
-
-        return MoveResult(
-            success=success,
-            message=message,
-            extra_turn=message == "You get another turn!",
-            is_game_over=game.game_over,
-        )
+        return _play(game, board_index, trace)
 
     def get_agent_move(self, game_id: UUID) -> int | None:
         game = self.get(game_id)
@@ -75,7 +144,9 @@ class GameService:
 
         return self.agent.choose_move(game)
 
-    def execute_agent_moves(self, game_id: UUID) -> list[MoveResult]:
+    def execute_agent_moves(
+        self, game_id: UUID, trace: bool = False
+    ) -> list[MoveResult]:
         results = []
         game = self.get(game_id)
         player_types = self.game_types.get(game_id)
@@ -92,13 +163,7 @@ class GameService:
             if agent_move is None:
                 break
 
-            success, message = game.make_move(agent_move)
-            result = MoveResult(
-                success=success,
-                message=message,
-                extra_turn=message == "You get another turn!",
-                is_game_over=game.game_over,
-            )
+            result = _play(game, agent_move, trace)
             results.append(result)
 
             # If game ended or agent doesn't get another turn, stop
@@ -106,3 +171,327 @@ class GameService:
                 break
 
         return results
+
+
+class AsyncGameService:
+    """Awaitable counterpart of GameService backed by an async GameStore"""
+
+    def __init__(
+        self,
+        store: GameStore | None = None,
+        agent: Any = None,
+        idle_timeout: float | None = None,
+        archive: GameStore | None = None,
+        archive_limit: int | None = None,
+    ):
+        self.store = store or InMemoryGameStore()
+        self.agent = agent or CachedAgent(Agent())
+        self.locks: dict[UUID, asyncio.Lock] = {}
+        self.index = GameIndex()
+        self.stats = StatsService(self.store)
+
+        # Idle games are forfeited, then archived (or dropped without an archive)
+        # until the archive holds `archive_limit` games, oldest dropped first
+        self.timers = GameTimers(idle_timeout)
+        self.archive = archive
+        self.archive_limit = archive_limit
+        self.archived: deque[UUID] = deque()
+
+    async def expire(self) -> int:
+        """Act on every clock and idle deadline that has passed"""
+        expired = self.timers.expired()
+        for kind, game_id in expired:
+            # One game's failure must not stop the others' deadlines firing
+            try:
+                await self._expire(kind, game_id)
+
+            except Exception:
+                logger.exception("Failed to act on %s deadline of %s", kind, game_id)
+
+                # Try again after another idle period rather than never
+                if kind == "idle":
+                    self.timers.touch(game_id)
+
+        return len(expired)
+
+    async def _expire(self, kind: str, game_id: UUID) -> None:
+        async with self._lock(game_id):
+            record = await self.store.get(game_id)
+            if record is None:
+                self.timers.stop(game_id)
+                self.locks.pop(game_id, None)
+                return
+
+            if kind == "clock":
+                await self._on_flag(game_id, record)
+
+            elif kind == "idle":
+                await self._on_idle(game_id, record)
+
+    async def run_timers(self) -> None:
+        """Expire deadlines forever, once per timer tick"""
+        while True:
+            await asyncio.sleep(self.timers.wheel.resolution)
+            await self.expire()
+
+    async def _on_flag(self, game_id: UUID, record: GameRecord) -> None:
+        game = record.game
+        if not game.game_over and self.timers.flagged(game_id, game.current_player):
+            self.timers.flag(game_id, game.current_player)
+            game.forfeit(game.current_player)
+            await self._save(game_id, record)
+
+    async def _on_idle(self, game_id: UUID, record: GameRecord) -> None:
+        # A move since the deadline was set will have scheduled a later one
+        if not self.timers.is_idle(game_id):
+            return
+
+        game = record.game
+        if not game.game_over:
+            # Abandoned: the player who stopped moving loses, and the finished
+            # game gets another idle period before it is archived
+            game.forfeit(game.current_player)
+            await self._save(game_id, record)
+            self.timers.touch(game_id)
+            return
+
+        # Archived games stay listed and exportable, read from the archive.
+        # Archive first, so readers find the game in one store or the other
+        if self.archive is not None:
+            await self.archive.put(game_id, record)
+            self.archived.append(game_id)
+
+        else:
+            self.index.remove(game_id)
+
+        await self.store.delete(game_id)
+        self.locks.pop(game_id, None)
+        self.timers.stop(game_id)
+
+        if self.archive_limit is not None:
+            while len(self.archived) > self.archive_limit:
+                oldest = self.archived.popleft()
+                await self.archive.delete(oldest)
+                self.index.remove(oldest)
+
+    async def _save(self, game_id: UUID, record: GameRecord) -> None:
+        """Store a record and keep the status index and player stats in step"""
+        await self.store.put(game_id, record)
+        status = GameStatusEnum.OVER if record.game.game_over else GameStatusEnum.ACTIVE
+
+        # Only the save that finishes a game gets a finish key, so it counts once
+        finishing = game_id not in self.index.finish_keys
+        self.index.update_status(game_id, status)
+        if finishing and game_id in self.index.finish_keys:
+            await self.stats.record(record)
+
+    def _lock(self, game_id: UUID) -> asyncio.Lock:
+        # Moves on one game are serialised; different games run concurrently
+        if game_id not in self.locks:
+            self.locks[game_id] = asyncio.Lock()
+
+        return self.locks[game_id]
+
+    async def create(
+        self,
+        player1: Player,
+        player2: Player | None = None,
+        time_control: TimeControl | None = None,
+        pits: int = 6,
+        stones: int = 6,
+    ) -> UUID:
+        game_id = uuid4()
+
+        # Store player types
+        player2_type = player2.type if player2 else PlayerTypeEnum.AGENT
+        player2_name = player2.name if player2 else "Player 2"
+        record = GameRecord(
+            game=Game(pits, stones),
+            player_types=(player1.type, player2_type),
+            player_names=(player1.name, player2_name),
+        )
+        await self.store.put(game_id, record)
+        self.index.add(game_id, record.player_names, GameStatusEnum.ACTIVE)
+        self.timers.start(game_id, time_control)
+
+        return game_id
+
+    async def _find(self, game_id: UUID) -> GameRecord | None:
+        """A live game's record, or an archived one's"""
+        record = await self.store.get(game_id)
+        if record is None and self.archive is not None:
+            record = await self.archive.get(game_id)
+
+        return record
+
+    async def get_record(self, game_id: UUID) -> GameRecord:
+        record = await self.store.get(game_id)
+        if record is None:
+            raise ValueError(f"Game with ID {game_id} not found")
+
+        return record
+
+    async def get(self, game_id: UUID) -> Game:
+        return (await self.get_record(game_id)).game
+
+    async def delete(self, game_id: UUID) -> None:
+        await self.get_record(game_id)
+        await self.store.delete(game_id)
+        self.locks.pop(game_id, None)
+        self.index.remove(game_id)
+        self.timers.stop(game_id)
+
+    async def get_state(self, game_id: UUID) -> GameState:
+        # Archived games can still be looked up, though not played or deleted
+        record = await self._find(game_id)
+        if record is None:
+            raise ValueError(f"Game with ID {game_id} not found")
+
+        game = record.game
+        return _build_state(game_id, game, self.timers.remaining(game_id, game))
+
+    async def make_move(
+        self, game_id: UUID, pit_index: int, trace: bool = False
+    ) -> MoveResult:
+        async with self._lock(game_id):
+            record = await self.get_record(game_id)
+            game = record.game
+            mover = game.current_player
+
+            # A move after the flag fell loses on time, even if the tick
+            # that would have noticed hasn't run yet
+            if not game.game_over and self.timers.flagged(game_id, mover):
+                game.forfeit(mover)
+                self.timers.flag(game_id, mover)
+                await self._save(game_id, record)
+                return MoveResult(False, "Time expired.", is_game_over=True)
+
+            board_index = _board_index(game, pit_index)
+            if board_index is None:
+                return _no_such_pit(game)
+
+            result = _play(game, board_index, trace)
+            if result.success:
+                record.moves.append(board_index)
+                self.timers.moved(game_id, mover, game)
+
+            await self._save(game_id, record)
+
+        return result
+
+    async def list_games(
+        self,
+        player: str | None = None,
+        status: GameStatusEnum | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> GamePage:
+        """List games newest first, reading only the requested page"""
+        created_from = _to_key(created_after)
+        created_until = _to_key(created_before)
+        before = None
+        if cursor is not None:
+            if not cursor.isdigit():
+                raise ValueError(f"Invalid cursor {cursor!r}")
+
+            before = int(cursor)
+
+        matches, total = self.index.query(
+            player, status, created_from, created_until, before
+        )
+        position = 0
+        if before is not None:
+            position = self.index.position(player, status, created_until, before)
+
+        items: list[GameState] = []
+        next_cursor = None
+        last_key = None
+        for key, game_id in matches:
+            if len(items) == limit:
+                # A further match exists, so hand out a cursor for it
+                next_cursor = str(last_key)
+                break
+
+            record = await self._find(game_id)
+            if record is not None:
+                items.append(_build_state(game_id, record.game))
+                last_key = key
+
+        return GamePage(
+            items=items, total=total, position=position, next_cursor=next_cursor
+        )
+
+    async def finished_games(
+        self,
+        since: int | None = None,
+        until: int | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[tuple[int, UUID, GameRecord]]]:
+        """Games with since < finish key <= until, oldest first, in chunks
+
+        `until` defaults to the newest key handed out so far, so games finishing
+        during the export are left for the next one and `until` is a complete
+        cursor for it.
+        """
+        if until is None:
+            until = self.index.last_key
+
+        after = since
+        while True:
+            matches = self.index.finished_after(after, until, chunk_size)
+            if not matches:
+                return
+
+            chunk = []
+            for key, game_id in matches:
+                record = await self._find(game_id)
+
+                if record is not None:
+                    chunk.append((key, game_id, record))
+
+            after = matches[-1][0]
+            yield chunk
+
+    async def get_agent_move(self, game_id: UUID) -> int | None:
+        record = await self.get_record(game_id)
+        game = record.game
+
+        if record.player_types[game.current_player] != PlayerTypeEnum.AGENT:
+            return None
+
+        return await choose_move_async(self.agent, game)
+
+    async def execute_agent_moves(
+        self, game_id: UUID, trace: bool = False
+    ) -> list[MoveResult]:
+        results: list[MoveResult] = []
+
+        async with self._lock(game_id):
+            record = await self.get_record(game_id)
+            game = record.game
+
+            # Keep making agent moves as long as it's the agent's turn
+            while (
+                not game.game_over
+                and record.player_types[game.current_player] == PlayerTypeEnum.AGENT
+            ):
+                agent_move = await choose_move_async(self.agent, game)
+                if agent_move is None:
+                    break
+
+                mover = game.current_player
+                result = _play(game, agent_move, trace)
+                results.append(result)
+                if result.success:
+                    record.moves.append(agent_move)
+                    self.timers.moved(game_id, mover, game)
+
+                # If game ended or agent doesn't get another turn, stop
+                if game.game_over or not result.extra_turn:
+                    break
+
+            await self._save(game_id, record)
+
+        return results
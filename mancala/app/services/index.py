@@ -0,0 +1,148 @@
+import time
+from collections.abc import Iterator
+from uuid import UUID
+
+from mancala.app.core.sorted_index import SortedIndex
+from mancala.app.models.domain.enum import GameStatusEnum
+
+# (player name or None, status or None); None matches any value
+IndexKey = tuple[str | None, GameStatusEnum | None]
+
+
+class GameIndex:
+    """Secondary indexes over the games of one worker
+
+    Every game gets a unique creation key (nanoseconds since the epoch,
+    bumped on ties) and sits in one sorted index per combination of
+    {any player, each of its players} x {any status, its status}. Any
+    filter on player, status and creation time is then a range of one index.
+
+    Finished games also get a finish key, in the order they finished, which
+    incremental exports use as their cursor.
+    """
+
+    def __init__(self) -> None:
+        self.indexes: dict[IndexKey, SortedIndex] = {}
+        self.keys: dict[UUID, int] = {}
+        self.ids: dict[int, UUID] = {}
+        self.status: dict[UUID, GameStatusEnum] = {}
+        self.players: dict[UUID, tuple[str, ...]] = {}
+        self.last_key = 0
+
+        self.finished = SortedIndex()
+        self.finish_keys: dict[UUID, int] = {}
+        self.finished_ids: dict[int, UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(
+        self, game_id: UUID, players: tuple[str, ...], status: GameStatusEnum
+    ) -> int:
+        """Index a new game and return its creation key"""
+        key = self._next_key()
+        self.keys[game_id] = key
+        self.ids[key] = game_id
+        self.players[game_id] = tuple(dict.fromkeys(players))  # Unique, in order
+        self.status[game_id] = status
+        for index_key in self._index_keys(game_id):
+            self.indexes.setdefault(index_key, SortedIndex()).add(key)
+
+        return key
+
+    def update_status(self, game_id: UUID, status: GameStatusEnum) -> None:
+        """Move a game between status indexes (no-op if unchanged)"""
+        if self.status.get(game_id, status) == status:
+            return
+
+        key = self.keys[game_id]
+        for player in (None, *self.players[game_id]):
+            self.indexes[(player, self.status[game_id])].remove(key)
+            self.indexes.setdefault((player, status), SortedIndex()).add(key)
+
+        self.status[game_id] = status
+        if status == GameStatusEnum.OVER and game_id not in self.finish_keys:
+            finish_key = self._next_key()
+            self.finished.add(finish_key)
+            self.finish_keys[game_id] = finish_key
+            self.finished_ids[finish_key] = game_id
+
+    def remove(self, game_id: UUID) -> None:
+        """Unindex a deleted game"""
+        finish_key = self.finish_keys.pop(game_id, None)
+        if finish_key is not None:
+            self.finished.remove(finish_key)
+            del self.finished_ids[finish_key]
+
+        key = self.keys.get(game_id)
+        if key is None:
+            return
+
+        for index_key in self._index_keys(game_id):
+            self.indexes[index_key].discard(key)
+
+        del self.keys[game_id], self.ids[key]
+        del self.players[game_id], self.status[game_id]
+
+    def query(
+        self,
+        player: str | None = None,
+        status: GameStatusEnum | None = None,
+        created_from: int | None = None,
+        created_until: int | None = None,
+        before: int | None = None,
+    ) -> tuple[Iterator[tuple[int, UUID]], int]:
+        """Matching (key, game ID) pairs newest first, and their total count
+
+        Keys fall in [created_from, created_until); `before` is a pagination
+        cursor, the key of the last game already returned.
+        """
+        index = self.indexes.get((player, status))
+        if index is None:
+            return iter(()), 0
+
+        total = index.count(created_from, created_until)
+
+        hi = created_until
+        if before is not None:
+            hi = before if hi is None else min(hi, before)
+
+        keys = index.irange(created_from, hi, reverse=True)
+        return ((key, self.ids[key]) for key in keys), total
+
+    def position(
+        self,
+        player: str | None,
+        status: GameStatusEnum | None,
+        created_until: int | None,
+        before: int,
+    ) -> int:
+        """Number of matching games newer than the cursor"""
+        index = self.indexes.get((player, status))
+        if index is None:
+            return 0
+
+        return index.count(before, created_until)
+
+    def finished_after(
+        self, after: int | None, until: int | None, limit: int
+    ) -> list[tuple[int, UUID]]:
+        """Up to `limit` (finish key, game ID) pairs with after < key <= until"""
+        lo = None if after is None else after + 1
+        hi = None if until is None else until + 1
+        keys = self.finished.irange(lo, hi)
+        return [(key, self.finished_ids[key]) for key, _ in zip(keys, range(limit))]
+
+    def _next_key(self) -> int:
+        # Nanoseconds since the epoch, bumped so keys never repeat
+        key = max(time.time_ns(), self.last_key + 1)
+        self.last_key = key
+        return key
+
+    def _index_keys(self, game_id: UUID) -> list[IndexKey]:
+        status = self.status[game_id]
+        return [
+            (player, filter_status)
+            for player in (None, *self.players[game_id])
+            for filter_status in (None, status)
+        ]
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from mancala.app.core.sorted_index import SortedIndex
+from mancala.app.models.domain.enum import GameStatusEnum, PlayerTypeEnum
+from mancala.app.models.domain.player import Player
+from mancala.app.services.game import AsyncGameService
+
+# (pits, stones); only players asking for the same ruleset are paired
+Ruleset = tuple[int, int]
+DEFAULT_RULESET: Ruleset = (6, 6)
+
+
+@dataclass(eq=False)
+class Ticket:
+    id: UUID
+    name: str
+    rating: int
+    ruleset: Ruleset
+    created_at: float
+    status: GameStatusEnum = GameStatusEnum.WAITING
+    game_id: UUID | None = None
+    player: int | None = None  # 0 or 1 once matched
+    cancelled: bool = False
+
+    # Set once the ticket is matched or cancelled, for push notifications
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class Matchmaker:
+    """Queue of waiting players, paired by ruleset and rating bucket
+
+    Each (ruleset, bucket) has a FIFO queue, and the non-empty buckets of a
+    ruleset are kept in a sorted index, so finding the nearest opponent is a
+    seek either side of the player's bucket plus a popleft. Cancelled tickets are skipped lazily when they reach the front.
+    """
+
+    def __init__(
+        self,
+        games: AsyncGameService,
+        bucket_width: int = 100,
+        max_spread: int = 2,
+        max_matched: int = 100_000,
+    ) -> None:
+        self.games = games
+        self.bucket_width = bucket_width
+        self.max_spread = max_spread  # Furthest bucket distance to pair across
+        self.max_matched = max_matched
+
+        self.queues: dict[Ruleset, dict[int, deque[Ticket]]] = {}
+        self.occupied: dict[Ruleset, SortedIndex] = {}
+        self.waiting: dict[UUID, Ticket] = {}
+        self.matched: OrderedDict[UUID, Ticket] = OrderedDict()
+
+    async def join(
+        self, name: str, rating: int, ruleset: Ruleset = DEFAULT_RULESET
+    ) -> Ticket:
+        """Queue a player, starting a game at once if an opponent is waiting"""
+        ticket = Ticket(
+            id=uuid4(),
+            name=name,
+            rating=rating,
+            ruleset=ruleset,
+            created_at=time.time(),
+        )
+
+        opponent = self._pop_opponent(ticket)
+        if opponent is None:
+            self._enqueue(ticket)
+            return ticket
+
+        # The player who waited longer moves first
+        await self._start_game(opponent, ticket)
+        return ticket
+
+    def get_ticket(self, ticket_id: UUID) -> Ticket:
+        ticket = self.waiting.get(ticket_id) or self.matched.get(ticket_id)
+        if ticket is None:
+            raise ValueError(f"Ticket with ID {ticket_id} not found")
+
+        return ticket
+
+    def cancel(self, ticket_id: UUID) -> Ticket:
+        """Leave the queue; the ticket stays in its bucket until skipped"""
+        ticket = self.waiting.pop(ticket_id, None)
+        if ticket is None:
+            raise ValueError(f"Waiting ticket with ID {ticket_id} not found")
+
+        ticket.cancelled = True
+        ticket.done.set()
+        return ticket
+
+    def queued(self) -> int:
+        return len(self.waiting)
+
+    def _bucket(self, rating: int) -> int:
+        return rating // self.bucket_width
+
+    def _enqueue(self, ticket: Ticket) -> None:
+        queues = self.queues.setdefault(ticket.ruleset, {})
+        bucket = self._bucket(ticket.rating)
+
+        if bucket not in queues:
+            queues[bucket] = deque()
+            self.occupied.setdefault(ticket.ruleset, SortedIndex()).add(bucket)
+
+        queues[bucket].append(ticket)
+        self.waiting[ticket.id] = ticket
+
+    def _pop_opponent(self, ticket: Ticket) -> Ticket | None:
+        """Take the longest-waiting live ticket from the nearest bucket"""
+        queues = self.queues.get(ticket.ruleset)
+        occupied = self.occupied.get(ticket.ruleset)
+        bucket = self._bucket(ticket.rating)
+
+        while occupied:
+            # Nearest occupied bucket on either side, preferring our own
+            candidates = (
+                next(occupied.irange(bucket), None),
+                next(occupied.irange(hi=bucket, reverse=True), None),
+            )
+            nearest = min(
+                (found for found in candidates if found is not None),
+                key=lambda found: abs(found - bucket),
+            )
+            if abs(nearest - bucket) > self.max_spread:
+                return None
+
+            queue = queues[nearest]
+            while queue:
+                opponent = queue.popleft()
+                if not opponent.cancelled:
+                    break
+
+            else:
+                opponent = None
+
+            if not queue:
+                del queues[nearest]
+                occupied.remove(nearest)
+
+            if opponent is not None:
+                del self.waiting[opponent.id]
+                return opponent
+
+        return None
+
+    async def _start_game(self, first: Ticket, second: Ticket) -> None:
+        game_id = await self.games.create(
+            Player(name=first.name, type=PlayerTypeEnum.HUMAN),
+            Player(name=second.name, type=PlayerTypeEnum.HUMAN),
+            pits=first.ruleset[0],
+            stones=first.ruleset[1],
+        )
+
+        for player, ticket in enumerate((first, second)):
+            ticket.status = GameStatusEnum.ACTIVE
+            ticket.game_id = game_id
+            ticket.player = player
+            ticket.done.set()
+            self.matched[ticket.id] = ticket
+
+        # Forget the oldest matches; their clients have long been notified
+        while len(self.matched) > self.max_matched:
+            self.matched.popitem(last=False)
@@ -0,0 +1,112 @@
+from mancala.app.core.sorted_index import SortedIndex
+from mancala.app.models.domain.stats import PlayerStats
+from mancala.app.services.storage import GameRecord, GameStore
+
+# Bits given to each part of a leaderboard key below the win count
+FIELD_BITS = 48
+MARGIN_OFFSET = 1 << (FIELD_BITS - 1)
+LAST_SEQ = (1 << FIELD_BITS) - 1
+
+
+class Leaderboard:
+    """Players ranked by wins, then total margin, then who played first
+
+    Each player holds one int key in a sorted index, so a finished game moves
+    its players with two O(log n) updates, and any page of the ranking is a
+    seek by rank plus a read of that page.
+    """
+
+    def __init__(self) -> None:
+        self.index = SortedIndex()
+        self.keys: dict[str, int] = {}
+        self.names: dict[int, str] = {}
+        self.seqs: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def update(self, stats: PlayerStats) -> None:
+        old = self.keys.get(stats.name)
+        if old is not None:
+            self.index.remove(old)
+            del self.names[old]
+
+        key = self._key(stats)
+        self.index.add(key)
+        self.keys[stats.name] = key
+        self.names[key] = stats.name
+
+    def top(self, limit: int, offset: int = 0) -> list[str]:
+        """Names of the players ranked offset + 1 to offset + limit"""
+        keys = self.index.islice(offset, offset + limit, reverse=True)
+        return [self.names[key] for key in keys]
+
+    def rank(self, name: str) -> int | None:
+        """1-based position of a player, or None if they haven't finished a game"""
+        key = self.keys.get(name)
+        if key is None:
+            return None
+
+        return self.index.count(key + 1) + 1
+
+    def _key(self, stats: PlayerStats) -> int:
+        # Higher keys rank first; earlier players win ties
+        seq = self.seqs.setdefault(stats.name, len(self.seqs))
+        return (
+            stats.wins << 2 * FIELD_BITS
+            | (stats.margin + MARGIN_OFFSET) << FIELD_BITS
+            | LAST_SEQ - seq
+        )
+
+
+class StatsService:
+    """Per-player stats and the leaderboard, updated as each game finishes
+
+    Totals are kept incrementally and written through the game store, so
+    reads never scan finished games and a restart only reloads one row per
+    player.
+    """
+
+    def __init__(self, store: GameStore) -> None:
+        self.store = store
+        self.players: dict[str, PlayerStats] = {}
+        self.leaderboard = Leaderboard()
+
+    async def load(self) -> None:
+        """Rebuild the in-memory view from the stats already in the store"""
+        for stats in await self.store.all_stats():
+            self.players[stats.name] = stats
+            self.leaderboard.update(stats)
+
+    async def record(self, record: GameRecord) -> None:
+        """Add a finished game to both players' totals"""
+        game = record.game
+        names = record.player_names
+        winner = game.get_winner()
+        if winner is None or names[0] == names[1]:
+            return
+
+        cells = game.board.board
+        stores = game.board.topology.store_indices
+        for side in (0, 1):
+            stats = self.players.get(names[side])
+            if stats is None:
+                stats = PlayerStats(names[side])
+                self.players[stats.name] = stats
+
+            result = 0 if winner == -1 else (1 if winner == side else -1)
+            margin = cells[stores[side]] - cells[stores[1 - side]]
+            stats.add(result, margin, record.player_types[1 - side])
+
+            await self.store.put_stats(stats)
+            self.leaderboard.update(stats)
+
+    def get(self, name: str) -> PlayerStats:
+        stats = self.players.get(name)
+        if stats is None:
+            raise ValueError(f"No finished games for player {name!r}")
+
+        return stats
+
+    def top(self, limit: int, offset: int = 0) -> list[PlayerStats]:
+        return [self.players[name] for name in self.leaderboard.top(limit, offset)]
@@ -0,0 +1,226 @@
+from array import array
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from mancala.app.models.domain.board import Board
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.stats import PlayerStats
+from mancala.app.models.domain.topology import get_topology
+
+DEFAULT_NAMES = ("Player 1", "Player 2")
+
+# Player types for each value of a packed row's agent flags
+PLAYER_TYPES = tuple(
+    tuple(
+        PlayerTypeEnum.AGENT if agents >> i & 1 else PlayerTypeEnum.HUMAN
+        for i in (0, 1)
+    )
+    for agents in range(4)
+)
+
+
+@dataclass(slots=True)
+class GameRecord:
+    game: Game
+    player_types: tuple[PlayerTypeEnum, PlayerTypeEnum]
+    moves: list[int] = field(default_factory=list)  # Board indices, in order
+    player_names: tuple[str, str] = DEFAULT_NAMES
+
+
+class GameStore:
+    """Async storage backend for game records"""
+
+    async def get(self, game_id: UUID) -> GameRecord | None:
+        raise NotImplementedError
+
+    async def put(self, game_id: UUID, record: GameRecord) -> None:
+        raise NotImplementedError
+
+    async def delete(self, game_id: UUID) -> None:
+        raise NotImplementedError
+
+    async def count(self) -> int:
+        raise NotImplementedError
+
+    async def get_stats(self, player: str) -> PlayerStats | None:
+        raise NotImplementedError
+
+    async def put_stats(self, stats: PlayerStats) -> None:
+        raise NotImplementedError
+
+    async def all_stats(self) -> list[PlayerStats]:
+        """Every player's stats, read once at startup to rebuild the leaderboard"""
+        raise NotImplementedError
+
+
+class InMemoryGameStore(GameStore):
+    """Process-local store; every call completes without blocking"""
+
+    def __init__(self) -> None:
+        self.records: dict[UUID, GameRecord] = {}
+        self.stats: dict[str, PlayerStats] = {}
+
+    async def get(self, game_id: UUID) -> GameRecord | None:
+        return self.records.get(game_id)
+
+    async def put(self, game_id: UUID, record: GameRecord) -> None:
+        self.records[game_id] = record
+
+    async def delete(self, game_id: UUID) -> None:
+        self.records.pop(game_id, None)
+
+    async def count(self) -> int:
+        return len(self.records)
+
+    async def get_stats(self, player: str) -> PlayerStats | None:
+        return self.stats.get(player)
+
+    async def put_stats(self, stats: PlayerStats) -> None:
+        self.stats[stats.name] = stats
+
+    async def all_stats(self) -> list[PlayerStats]:
+        return list(self.stats.values())
+
+
+class _Slab:
+    """Fixed-width rows for the games of one (pits, stones) ruleset"""
+
+    def __init__(self, pits: int, stones: int) -> None:
+        self.pits = pits
+        self.stones = stones
+
+        # Cells keep the board's own counter width, so no count is truncated
+        self.typecode = Board(pits, stones).board.typecode
+        self.cells = get_topology(pits).size * array(self.typecode).itemsize
+        self.width = self.cells + 2
+        self.data = bytearray()
+        self.free: list[int] = []
+
+    def allocate(self) -> int:
+        """Reuse a freed row, or grow the slab by one"""
+        if self.free:
+            return self.free.pop()
+
+        self.data.extend(bytes(self.width))
+        return len(self.data) // self.width - 1
+
+
+class PackedGameStore(GameStore):
+    """Process-local store packing every game into fixed-width byte rows
+
+    Games of each (pits, stones) ruleset share one slab. A row holds the board
+    cells (a byte each unless the ruleset has too many stones for that), a
+    byte for the side to move, game-over and forfeit flags, and a byte
+    flagging agent players.
+    Records are rebuilt on `get`, so callers must `put` after every change.
+    """
+
+    def __init__(self) -> None:
+        self.slabs: list[_Slab] = []
+        self.slab_ids: dict[tuple[int, int], int] = {}
+        self.slots: dict[UUID, int] = {}  # Row << 8 | slab, a single int each
+        self.moves: dict[UUID, bytes] = {}
+        self.names: dict[UUID, tuple[str, str]] = {}  # Only non-default names
+        self.stats: dict[str, PlayerStats] = {}
+
+    async def get(self, game_id: UUID) -> GameRecord | None:
+        slot = self.slots.get(game_id)
+        if slot is None:
+            return None
+
+        slab = self.slabs[slot & 0xFF]
+        offset = (slot >> 8) * slab.width
+        row = slab.data[offset : offset + slab.width]
+        state, agents = row[slab.cells], row[slab.cells + 1]
+
+        cells = row[: slab.cells]
+        if slab.typecode != "B":
+            cells = array(slab.typecode, bytes(cells))
+
+        game = Game(slab.pits, slab.stones)
+        game.board.load(cells)
+        game.current_player = state & 1
+        game.game_over = bool(state & 2)
+        if state & 4:
+            game.forfeited_by = state >> 3 & 1
+
+        return GameRecord(
+            game,
+            PLAYER_TYPES[agents],
+            list(self.moves.get(game_id, b"")),
+            self.names.get(game_id, DEFAULT_NAMES),
+        )
+
+    async def put(self, game_id: UUID, record: GameRecord) -> None:
+        game = record.game
+        board = game.board
+        ruleset = (board.pits, board.stones)
+        slab_id = self.slab_ids.get(ruleset)
+        if slab_id is None:
+            if len(self.slabs) > 0xFF:
+                raise ValueError("At most 256 rulesets fit in one packed store")
+
+            slab_id = self.slab_ids[ruleset] = len(self.slabs)
+            self.slabs.append(_Slab(*ruleset))
+
+        slab = self.slabs[slab_id]
+
+        if board.board.typecode != slab.typecode:
+            raise ValueError(
+                f"Board cells are {board.board.typecode!r}, "
+                f"expected {slab.typecode!r} for {ruleset[0]}x{ruleset[1]}"
+            )
+
+        slot = self.slots.get(game_id)
+        if slot is None or slot & 0xFF != slab_id:
+            if slot is not None:
+                self.slabs[slot & 0xFF].free.append(slot >> 8)
+
+            slot = self.slots[game_id] = slab.allocate() << 8 | slab_id
+
+        state = game.current_player | (2 if game.game_over else 0)
+        if game.forfeited_by is not None:
+            state |= 4 | game.forfeited_by << 3
+
+        agents = sum(
+            1 << i
+            for i, player_type in enumerate(record.player_types)
+            if player_type == PlayerTypeEnum.AGENT
+        )
+
+        offset = (slot >> 8) * slab.width
+        slab.data[offset : offset + slab.cells] = board.board.tobytes()
+        slab.data[offset + slab.cells] = state
+        slab.data[offset + slab.cells + 1] = agents
+
+        if record.moves:
+            self.moves[game_id] = bytes(record.moves)
+
+        else:
+            self.moves.pop(game_id, None)
+
+        if record.player_names != DEFAULT_NAMES:
+            self.names[game_id] = record.player_names
+
+        else:
+            self.names.pop(game_id, None)
+
+    async def delete(self, game_id: UUID) -> None:
+        slot = self.slots.pop(game_id, None)
+        if slot is not None:
+            self.moves.pop(game_id, None)
+            self.names.pop(game_id, None)
+            self.slabs[slot & 0xFF].free.append(slot >> 8)
+
+    async def count(self) -> int:
+        return len(self.slots)
+
+    async def get_stats(self, player: str) -> PlayerStats | None:
+        return self.stats.get(player)
+
+    async def put_stats(self, stats: PlayerStats) -> None:
+        self.stats[stats.name] = stats
+
+    async def all_stats(self) -> list[PlayerStats]:
+        return list(self.stats.values())
@@ -1,51 +1,29 @@
 import argparse
+import json
 import sys
 import time
-import os
-import platform
-from typing import List, Dict, Optional, Tuple
+from contextlib import ExitStack
+from typing import List, Optional, Tuple
 
+from mancala.app.models.domain.enum import GameStatusEnum, PlayerTypeEnum
 from mancala.app.models.domain.player import Player
-from mancala.app.models.domain.enum import PlayerTypeEnum, GameStatusEnum
+from mancala.app.models.domain.topology import get_topology
+from mancala.app.models.domain.trace import MoveTrace
 from mancala.app.services.game import GameService
-
-
-class Colors:
-    """ANSI color codes for terminal output"""
-
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-
-    @staticmethod
-    def disable():
-        """Disable colors for terminals that don't support ANSI"""
-        Colors.RESET = ""
-        Colors.BOLD = ""
-        Colors.RED = ""
-        Colors.GREEN = ""
-        Colors.YELLOW = ""
-        Colors.BLUE = ""
-        Colors.MAGENTA = ""
-        Colors.CYAN = ""
+from mancala.cli.render import (
+    Colors,
+    TerminalRenderer,
+    board_lines,
+    format_line,
+    player_lines,
+    title_lines,
+)
 
 
 def print_game_title():
     """Print an ASCII art title for the game"""
-    title = r"""
-    __  __                            _
-   |  \/  | __ _ _ __   ___ __ _  ___| | __ _
-   | |\/| |/ _` | '_ \ / __/ _` |/ __| |/ _` |
-   | |  | | (_| | | | | (_| (_| | (__| | (_| |
-   |_|  |_|\__,_|_| |_|\___\__,_|\___|_|\__,_|
-
-    """
-    print(f"{Colors.GREEN}{title}{Colors.RESET}")
+    for line in title_lines():
+        print(format_line(line))
 
 
 def display_rules():
@@ -78,16 +56,9 @@ Press Enter to start the game...
 
 
 def clear_screen():
-    """Clear the terminal screen with a better cross-platform approach"""
-    os_name = platform.system().lower()
-
-    if os_name == "windows":
-        os.system("cls")
-    else:  # For Linux and MacOS
-        os.system("clear")
-
-    # As a fallback, also use ANSI escape sequence
-    print("\033[H\033[J", end="")
+    """Clear the terminal screen with ANSI escapes (no subprocess)"""
+    sys.stdout.write("\033[H\033[J")
+    sys.stdout.flush()
 
 
 def print_header(title):
@@ -113,226 +84,39 @@ def print_message(message, color=Colors.GREEN):
     print(f"{color}{message}{Colors.RESET}")
 
 
-def calculate_pit_indices(board_arr: List[int]) -> Tuple[int, int, Dict[int, int]]:
-    """Calculate pit indices based on board structure."""
-    # Assuming standard mancala structure
-    board_size = len(board_arr)
-    pits = (board_size - 2) // 2
-    p1_store = pits
-    p2_store = 2 * pits + 1
-
-    # Create a mapping for easier access
-    # Key: display position, Value: index in board_arr
-    pit_map = {}
-
-    # Player 1 pits (bottom row)
-    for i in range(pits):
-        pit_map[i + 1] = i  # Player 1's pits are 1-6 in display
+def calculate_pit_indices(board_arr: List[int]) -> Tuple[int, int, int]:
+    """Get the pit count and store indices for a board array"""
+    topology = get_topology((len(board_arr) - 2) // 2)
+    p1_store, p2_store = topology.store_indices
 
-    # Player 2 pits (top row)
-    for i in range(pits):
-        pit_map[pits + i + 1] = pits + 1 + i  # Player 2's pits are 7-12 in display
-
-    return pits, p1_store, p2_store
+    return topology.pits, p1_store, p2_store
 
 
 def print_board(board_arr, pits, current_player: int, last_move: Optional[int] = None):
     """Print a perfect Mancala board with exact spacing requirements"""
-    p1_color = Colors.CYAN
-    p2_color = Colors.YELLOW
-
-    # Highlight current player
-    p1_highlight = Colors.BOLD if current_player == 0 else ""
-    p2_highlight = Colors.BOLD if current_player == 1 else ""
-
-    # Calculate indices
-    p1_store = pits
-    p2_store = 2 * pits + 1
-
-    # Get store stone counts
-    p1_store_stones = board_arr[p1_store]
-    p2_store_stones = board_arr[p2_store]
-
-    # Stone representation
-    stones_symbol = "●"
-    stones_per_row = 3  # Maximum stones per row
-
-    # Calculate how many rows we need for each player's pits
-    p1_stones = [board_arr[i] for i in range(pits)]
-    p2_stones = [board_arr[i] for i in range(pits + 1, 2 * pits + 1)]
-
-    p1_max_stones = max(p1_stones) if p1_stones else 0
-    p2_max_stones = max(p2_stones) if p2_stones else 0
-
-    p1_rows_needed = max(2, (p1_max_stones + stones_per_row - 1) // stones_per_row)
-    p2_rows_needed = max(2, (p2_max_stones + stones_per_row - 1) // stones_per_row)
-
-    print("\n")
-
-    # Pit numbers with proper spacing to align in the center
-    print("       ", end="")  # 7 spaces for proper alignment
-    for i in range(pits, 0, -1):
-        highlight = (
-            Colors.MAGENTA + Colors.BOLD
-            if last_move == i and current_player == 1
-            else p2_highlight
-        )
-        print(
-            f"{highlight}{p2_color}[{i}]{Colors.RESET}", end="     "
-        )  # 5 spaces between pit numbers
-    print("  ")  # 2 spaces at the end for alignment
-
-    # Top border
-    print("    +", end="")
-    for _ in range(pits):
-        print("-------+", end="")
-    print()
-
-    # Player 2 pits with exact spacing
-    for row in range(p2_rows_needed):
-        print("    |", end="")
-        for i in range(2 * pits, pits, -1):
-            stones = board_arr[i]
-            pit_num = 2 * pits + 1 - i
-            highlight = (
-                Colors.MAGENTA + Colors.BOLD
-                if last_move == pit_num and current_player == 1
-                else p2_color
-            )
-
-            # Calculate stones for this row
-            start_idx = row * stones_per_row
-            end_idx = min(start_idx + stones_per_row, stones)
-            stones_in_row = max(0, end_idx - start_idx)
-
-            if stones_in_row > 0:
-                # Exact formatting with proper spacing
-                if stones_in_row == 1:
-                    print(f" {highlight}{stones_symbol}{Colors.RESET}     |", end="")
-                elif stones_in_row == 2:
-                    print(
-                        f" {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET}   |",
-                        end="",
-                    )
-                elif stones_in_row == 3:
-                    print(
-                        f" {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET} |",
-                        end="",
-                    )
-            else:
-                # Empty pit
-                print("       |", end="")
-        print()
-
-    # Middle border
-    print("    +", end="")
-    for _ in range(pits):
-        print("-------+", end="")
-    print()
-
-    # Stores with proper spacing
-    print(f"[S] {p2_color}{p2_store_stones}{Colors.RESET}", end="")
-
-    # Calculated spacing that works for the actual dimensions
-    store_spacing = 47
-    print(" " * store_spacing, end="")
-    print(f"{p1_color}{p1_store_stones}{Colors.RESET} [S]")
-
-    # Middle border
-    print("    +", end="")
-    for _ in range(pits):
-        print("-------+", end="")
-    print()
-
-    # Player 1 pits with exact spacing
-    for row in range(p1_rows_needed):
-        print("    |", end="")
-        for i in range(pits):
-            stones = board_arr[i]
-            pit_num = i + 1
-            highlight = (
-                Colors.MAGENTA + Colors.BOLD
-                if last_move == pit_num and current_player == 0
-                else p1_color
-            )
+    for line in board_lines(board_arr, pits, current_player, last_move):
+        print(format_line(line))
 
-            # Calculate stones for this row
-            start_idx = row * stones_per_row
-            end_idx = min(start_idx + stones_per_row, stones)
-            stones_in_row = max(0, end_idx - start_idx)
-
-            if stones_in_row > 0:
-                # Exact formatting with proper spacing
-                if stones_in_row == 1:
-                    print(f" {highlight}{stones_symbol}{Colors.RESET}     |", end="")
-                elif stones_in_row == 2:
-                    print(
-                        f" {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET}   |",
-                        end="",
-                    )
-                elif stones_in_row == 3:
-                    print(
-                        f" {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET} {highlight}{stones_symbol}{Colors.RESET} |",
-                        end="",
-                    )
-            else:
-                # Empty pit
-                print("       |", end="")
-        print()
-
-    # Bottom border
-    print("    +", end="")
-    for _ in range(pits):
-        print("-------+", end="")
-    print()
-
-    # Pit numbers with proper spacing to align in the center
-    print("       ", end="")  # 7 spaces for proper alignment
-    for i in range(1, pits + 1):
-        highlight = (
-            Colors.MAGENTA + Colors.BOLD
-            if last_move == i and current_player == 0
-            else p1_highlight
-        )
-        print(
-            f"{highlight}{p1_color}[{i}]{Colors.RESET}", end="     "
-        )  # 5 spaces between pit numbers
-    print("  ")  # 2 spaces at the end for alignment
-    print()
 
-
-def display_move_animation(game_service, game_id, pit_selected, current_player, pits):
+def display_move_animation(
+    board_arr,
+    trace: MoveTrace,
+    pits,
+    player_names=None,
+    renderer=None,
+) -> list[int]:
     """
-    Display a simple animation of stones moving during a move
+    Animate a move from its trace and return the board after sowing and capture
     """
-    # Get board state before animation
-    initial_state = game_service.get_state(game_id)
-    initial_board = initial_state.board.copy()
-
-    # Prepare for animation
-    p1_color = Colors.CYAN
-    p2_color = Colors.YELLOW
-    current_color = p1_color if current_player == 0 else p2_color
-
-    # Calculate the path of stones
-    # For Mancala, stones move counterclockwise from the selected pit
-
-    # For player 1 (bottom row), pits are 0-5 in the array, store is at index 'pits'
-    # For player 2 (top row), pits are (pits+1) to (2*pits) in the array, store is at index '2*pits+1'
+    player_names = player_names or ["Player 1", "Player 2"]
+    renderer = renderer or TerminalRenderer()
 
-    # Convert selected pit (1-based) to board array index (0-based)
-    if current_player == 0:  # Player 1
-        start_idx = pit_selected - 1
-    else:  # Player 2
-        start_idx = pits + pit_selected
+    current_player = trace.player_id
+    current_color = Colors.CYAN if current_player == 0 else Colors.YELLOW
+    pit_selected = pit_number(trace.pit_index, pits)
 
-    # Get number of stones in the selected pit
-    num_stones = initial_board[start_idx]
-
-    if num_stones == 0:
-        print_message("No stones to move!", Colors.RED)
-        time.sleep(0.5)
-        return
+    animated_board = list(board_arr)
+    num_stones = len(trace.path)
 
     # Display initial message
     print_message(
@@ -340,58 +124,54 @@ def display_move_animation(game_service, game_id, pit_selected, current_player,
     )
     time.sleep(0.5)
 
-    # Create a simple animation of stones moving
-    # We'll simulate this by updating the board after each stone placement
-    animated_board = initial_board.copy()
-    animated_board[start_idx] = 0  # Remove stones from starting pit
+    animated_board[trace.pit_index] = 0  # Remove stones from starting pit
+    renderer.reset()
 
-    opponent_store = 2 * pits + 1 if current_player == 0 else pits
+    # The title and players stay put, so every frame shares their lines
+    header = title_lines() + player_lines(player_names, current_player)
 
-    # Distribute stones
-    current_idx = (start_idx + 1) % len(animated_board)
-    stones_remaining = num_stones
+    def render_frame(highlight, message):
+        # Redraw only the lines that changed since the previous frame
+        lines = header + board_lines(animated_board, pits, current_player, highlight)
+        lines.append([(current_color, message)])
+        renderer.render(lines)
 
-    while stones_remaining > 0:
-        # Skip opponent's store
-        if current_idx == opponent_store:
-            current_idx = (current_idx + 1) % len(animated_board)
-            continue
-
-        # Add a stone to the current pit
+    for current_idx in trace.path:
         animated_board[current_idx] += 1
-        stones_remaining -= 1
 
-        # Clear screen and show intermediate board state
-        clear_screen()
-        print_game_title()
-
-        # Show player info and turn
-        player_names = [
-            "Player 1",
-            "Player 2",
-        ]  # Placeholder, actual names will be shown in main loop
-        print_player_info(1, player_names[0], Colors.CYAN)
-        print_player_info(2, player_names[1], Colors.YELLOW)
-        print_turn_info(player_names[current_player], current_color)
-
-        # Highlight the current pit where we're dropping a stone
-        print_board(
-            animated_board,
-            pits,
-            current_player,
-            (current_idx % (pits + 1)) + 1 if current_idx < pits else None,
+        # Highlight the pit on the mover's side where we're dropping a stone
+        on_own_side = current_idx in range(
+            current_player * (pits + 1), current_player * (pits + 1) + pits
+        )
+        render_frame(
+            pit_number(current_idx, pits) if on_own_side else None,
+            f"Placing stone in position {current_idx}...",
         )
-
-        print_message(f"Placing stone in position {current_idx}...", current_color)
         time.sleep(0.2)  # Short delay for animation effect
 
-        # Move to next pit
-        current_idx = (current_idx + 1) % len(animated_board)
+    if trace.capture_pit is not None:
+        last_pit = trace.path[-1]
+        store = pits if current_player == 0 else 2 * pits + 1
+        animated_board[store] += trace.captured_stones
+        animated_board[last_pit] = 0
+        animated_board[trace.capture_pit] = 0
+        render_frame(None, f"Captured {trace.captured_stones} stones!")
+        time.sleep(0.3)
 
     # Final message after animation
-    print_message("Move completed!", current_color)
+    if trace.extra_turn:
+        print_message("Extra turn!", current_color)
+    else:
+        print_message("Move completed!", current_color)
     time.sleep(0.3)
 
+    return animated_board
+
+
+def pit_number(pit_index, pits):
+    """Convert a board index to the 1-based pit number on its owner's side"""
+    return pit_index + 1 if pit_index < pits else pit_index - pits
+
 
 def show_help_prompt(pits):
     """Show a help prompt at the bottom of the screen"""
@@ -470,28 +250,112 @@ def display_winner(winner_idx, players, board_arr, pits):
     print(f"Total stones in play: {sum(board_arr)}")
 
 
-def main():
-    # Setup argument parser
-    parser = argparse.ArgumentParser(description="Play Mancala from the command line")
-    parser.add_argument(
-        "--no-color", action="store_true", help="Disable colored output"
-    )
-    parser.add_argument("--stones", type=int, default=6, help="Starting stones per pit")
-    parser.add_argument(
-        "--delay", type=float, default=2.0, help="Delay for Agent moves (seconds)"
-    )
-    parser.add_argument(
-        "--no-animation", action="store_true", help="Disable move animations"
-    )
-    parser.add_argument(
-        "--no-clear", action="store_true", help="Disable screen clearing"
-    )
+def parse_moves(line: str) -> list[int] | None:
+    """Parse a headless input line of 1-based pit numbers (None to skip)
 
-    args = parser.parse_args()
+    Raises ValueError for a token that isn't a number.
+    """
+    tokens = line.replace(",", " ").split()
+    if not tokens or tokens[0].startswith("#"):
+        return None
+
+    for token in tokens:
+        if not token.isdigit():
+            raise ValueError(f"Invalid pit number {token!r}")
+
+    return [int(token) for token in tokens]
+
+
+def play_headless_game(
+    game_service: GameService, players: list[Player], moves: list[int]
+) -> dict:
+    """Play one game from a list of human moves and summarise it"""
+    game_id = game_service.create(players[0], players[1])
+    game = game_service.get(game_id)
+    pits = game.board.pits
+    human_moves = iter(moves)
+    played = []
+    errors = []
+
+    while not game.game_over:
+        player_idx = game.current_player
+
+        if players[player_idx].type == PlayerTypeEnum.AGENT:
+            agent_move = game_service.get_agent_move(game_id)
+            if agent_move is None:
+                break
+
+            # Convert the board index back to a 1-based pit number
+            pit = agent_move + 1 if player_idx == 0 else agent_move - pits
+        else:
+            pit = next(human_moves, None)
+            if pit is None:
+                break  # Ran out of scripted moves
 
-    if args.no_color:
-        Colors.disable()
+        result = game_service.make_move(game_id, pit)
+        if result.success:
+            played.append([player_idx, pit])
+        else:
+            errors.append({"player": player_idx, "pit": pit, "error": result.message})
+
+    state = game_service.get_state(game_id)
+    game_service.delete(game_id)
+
+    return {
+        "status": state.status.value,
+        "winner": state.winner,
+        "scores": [game.board.get_score(0), game.board.get_score(1)],
+        "board": state.board,
+        "current_player": state.current_player,
+        "moves": played,
+        "errors": errors,
+    }
+
+
+def run_headless(args) -> None:
+    """Play scripted games without prompts, sleeps or screen redraws"""
+    game_service = GameService()
+    player_types = {"human": PlayerTypeEnum.HUMAN, "agent": PlayerTypeEnum.AGENT}
+    players = [
+        Player(name="Player 1", type=player_types[args.player1]),
+        Player(name="Player 2", type=player_types[args.player2]),
+    ]
+    out = sys.stdout
+
+    with ExitStack() as stack:
+        # Agent-only games need no input; otherwise each input line is one game
+        if all(player.type == PlayerTypeEnum.AGENT for player in players):
+            lines = ("" for _ in range(args.games))
+            source = None
+        elif args.input:
+            source = lines = stack.enter_context(open(args.input))
+        else:
+            source = lines = sys.stdin
+
+        # Results written so far are flushed even if a game fails
+        stack.callback(out.flush)
+        index = 0
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                moves = [] if source is None else parse_moves(line)
 
+            except ValueError as err:
+                # A bad line costs only its own game, not the rest of the run
+                record = {"error": str(err), "line": line_number}
+
+            else:
+                if moves is None:
+                    continue
+
+                record = play_headless_game(game_service, players, moves)
+
+            record["game"] = index
+            index += 1
+            out.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def play_game(args):
+    """Play a single interactive game"""
     # Initialize game service
     game_service = GameService()
 
@@ -543,6 +407,7 @@ def main():
 
     # Calculate pit information
     pits, _, _ = calculate_pit_indices(game_state.board)
+    renderer = TerminalRenderer(clear=not args.no_clear)
 
     # If AI goes first, execute its move
     if game_state.current_player == 1 and player2_type == PlayerTypeEnum.AGENT:
@@ -598,16 +463,22 @@ def main():
                         continue
 
                     # Make the move
-                    result = game_service.make_move(game_id, pit)
+                    result = game_service.make_move(
+                        game_id, pit, trace=not args.no_animation
+                    )
                     valid_move = result.success
 
                     if valid_move:
                         last_move = pit
 
-                        # Get updated state for animation
-                        if not args.no_animation:
+                        # Animate straight from the move trace
+                        if result.trace is not None:
                             display_move_animation(
-                                game_service, game_id, pit, current_player_idx, pits
+                                board_arr,
+                                result.trace,
+                                pits,
+                                [player.name for player in players],
+                                renderer,
                             )
                     else:
                         print_message(result.message, Colors.RED)
@@ -620,30 +491,24 @@ def main():
             print_message("Agent is thinking...", Colors.YELLOW)
             time.sleep(args.delay)
 
-            # Save the pre-move state for animation if we had access to the move info
-            pre_move_state = game_state
-
-            # Execute the agent's move
-            game_service.execute_agent_moves(game_id)
-
-            # A simple "animation" for the agent's move
-            if not args.no_animation:
-                # Get the new state
-                new_state = game_service.get_state(game_id)
-
-                # Find which pit changed (simplified approach)
-                for i in range(pits):
-                    idx = pits + 1 + i  # Player 2's pits
-                    if (
-                        pre_move_state.board[idx] != new_state.board[idx]
-                        and pre_move_state.board[idx] > 0
-                    ):
-                        # This pit likely was the move
-                        display_move_animation(
-                            game_service, game_id, i + 1, current_player_idx, pits
-                        )
-                        last_move = i + 1
-                        break
+            # Execute the agent's moves, including any extra turns
+            results = game_service.execute_agent_moves(game_id, trace=True)
+
+            # Animate each move in turn from its trace
+            animated_board = board_arr
+            for result in results:
+                if result.trace is None:
+                    continue
+
+                last_move = pit_number(result.trace.pit_index, pits)
+                if not args.no_animation:
+                    animated_board = display_move_animation(
+                        animated_board,
+                        result.trace,
+                        pits,
+                        [player.name for player in players],
+                        renderer,
+                    )
 
         # Update game state
         game_state = game_service.get_state(game_id)
@@ -664,11 +529,67 @@ def main():
     # Display winner and statistics
     display_winner(game_state.winner, players, board_arr, pits)
 
-    # Ask if the user wants to play again
-    if input("\nWould you like to play again? (y/n): ").lower().startswith("y"):
-        main()  # Restart the game
-    else:
-        print("\nThanks for playing Mancala! Goodbye.")
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description="Play Mancala from the command line")
+    parser.add_argument(
+        "--no-color", action="store_true", help="Disable colored output"
+    )
+    parser.add_argument("--stones", type=int, default=6, help="Starting stones per pit")
+    parser.add_argument(
+        "--delay", type=float, default=2.0, help="Delay for Agent moves (seconds)"
+    )
+    parser.add_argument(
+        "--no-animation", action="store_true", help="Disable move animations"
+    )
+    parser.add_argument(
+        "--no-clear", action="store_true", help="Disable screen clearing"
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Read moves from stdin or --input and write JSON lines, one per game",
+    )
+    parser.add_argument(
+        "--input", default=None, help="Headless move file (default: stdin)"
+    )
+    parser.add_argument(
+        "--player1",
+        choices=["human", "agent"],
+        default="human",
+        help="Headless player 1 type",
+    )
+    parser.add_argument(
+        "--player2",
+        choices=["human", "agent"],
+        default="agent",
+        help="Headless player 2 type",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=1,
+        help="Headless games to play when both players are agents",
+    )
+
+    args = parser.parse_args()
+
+    if args.headless:
+        run_headless(args)
+        return
+
+    if args.no_color:
+        Colors.disable()
+
+    # Play games in a loop rather than recursing, so the stack stays flat
+    while True:
+        play_game(args)
+
+        # Ask if the user wants to play again
+        if not input("\nWould you like to play again? (y/n): ").lower().startswith("y"):
+            print("\nThanks for playing Mancala! Goodbye.")
+            break
 
 
 if __name__ == "__main__":
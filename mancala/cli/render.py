@@ -0,0 +1,222 @@
+import sys
+from typing import TextIO
+
+# A styled run of text, and a screen line made of such runs
+Segment = tuple[str, str]
+Line = list[Segment]
+
+TITLE = r"""
+    __  __                            _
+   |  \/  | __ _ _ __   ___ __ _  ___| | __ _
+   | |\/| |/ _` | '_ \ / __/ _` |/ __| |/ _` |
+   | |  | | (_| | | | | (_| (_| | (__| | (_| |
+   |_|  |_|\__,_|_| |_|\___\__,_|\___|_|\__,_|
+
+    """
+
+STONE = "●"
+STONES_PER_ROW = 3
+STORE_SPACING = 47
+
+
+class Colors:
+    """ANSI color codes for terminal output"""
+
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+
+    @staticmethod
+    def disable():
+        """Disable colors for terminals that don't support ANSI"""
+        Colors.RESET = ""
+        Colors.BOLD = ""
+        Colors.RED = ""
+        Colors.GREEN = ""
+        Colors.YELLOW = ""
+        Colors.BLUE = ""
+        Colors.MAGENTA = ""
+        Colors.CYAN = ""
+
+
+def format_line(line: Line) -> str:
+    """Join a line's segments into a printable string"""
+    return "".join(
+        f"{style}{text}{Colors.RESET}" if style else text for style, text in line
+    )
+
+
+def title_lines() -> list[Line]:
+    return [[(Colors.GREEN, text)] for text in TITLE.split("\n")]
+
+
+def player_lines(names: list[str], current_player: int | None) -> list[Line]:
+    """Player names followed by whose turn it is"""
+    colors = [Colors.CYAN, Colors.YELLOW]
+    lines: list[Line] = [
+        [("", f"Player {i + 1}: "), (colors[i], name)] for i, name in enumerate(names)
+    ]
+
+    if current_player is not None and current_player >= 0:
+        lines.append([])
+        lines.append(
+            [
+                (Colors.BOLD, "Current turn: "),
+                (Colors.BOLD + colors[current_player], names[current_player]),
+            ]
+        )
+
+    return lines
+
+
+def _pit_row(stones: int, row: int, style: str) -> Line:
+    """One row of stones inside a pit, including the right-hand wall"""
+    start = row * STONES_PER_ROW
+    stones_in_row = max(0, min(start + STONES_PER_ROW, stones) - start)
+
+    if stones_in_row == 0:
+        return [("", "       |")]
+
+    line: Line = [("", " ")]
+    for i in range(stones_in_row):
+        if i:
+            line.append(("", " "))
+
+        line.append((style, STONE))
+
+    line.append(("", " " * (2 * (STONES_PER_ROW - stones_in_row) + 1) + "|"))
+    return line
+
+
+def board_lines(
+    board_arr: list[int],
+    pits: int,
+    current_player: int,
+    last_move: int | None = None,
+) -> list[Line]:
+    """Lay out the board as styled lines, player 2 on top"""
+    p1_color = Colors.CYAN
+    p2_color = Colors.YELLOW
+    marked = Colors.MAGENTA + Colors.BOLD
+
+    # Highlight current player
+    p1_highlight = Colors.BOLD if current_player == 0 else ""
+    p2_highlight = Colors.BOLD if current_player == 1 else ""
+
+    p1_pits = range(pits)
+    p2_pits = range(2 * pits, pits, -1)  # Displayed right to left
+    p1_rows = max(2, (max(board_arr[i] for i in p1_pits) + 2) // STONES_PER_ROW)
+    p2_rows = max(2, (max(board_arr[i] for i in p2_pits) + 2) // STONES_PER_ROW)
+
+    border: Line = [("", "    +" + "-------+" * pits)]
+    lines: list[Line] = [[], []]
+
+    # Pit numbers for player 2
+    line: Line = [("", "       ")]
+    for i in range(pits, 0, -1):
+        mark = last_move == i and current_player == 1
+        line.append(((marked if mark else p2_highlight) + p2_color, f"[{i}]"))
+        line.append(("", "     "))
+    line.append(("", "  "))
+    lines.append(line)
+    lines.append(border)
+
+    for row in range(p2_rows):
+        line = [("", "    |")]
+        for i in p2_pits:
+            mark = last_move == i - pits and current_player == 1
+            line.extend(_pit_row(board_arr[i], row, marked if mark else p2_color))
+        lines.append(line)
+
+    lines.append(border)
+    lines.append(
+        [
+            ("", "[S] "),
+            (p2_color, str(board_arr[2 * pits + 1])),
+            ("", " " * STORE_SPACING),
+            (p1_color, str(board_arr[pits])),
+            ("", " [S]"),
+        ]
+    )
+    lines.append(border)
+
+    for row in range(p1_rows):
+        line = [("", "    |")]
+        for i in p1_pits:
+            mark = last_move == i + 1 and current_player == 0
+            line.extend(_pit_row(board_arr[i], row, marked if mark else p1_color))
+        lines.append(line)
+
+    lines.append(border)
+
+    # Pit numbers for player 1
+    line = [("", "       ")]
+    for i in range(1, pits + 1):
+        mark = last_move == i and current_player == 0
+        line.append(((marked if mark else p1_highlight) + p1_color, f"[{i}]"))
+        line.append(("", "     "))
+    line.append(("", "  "))
+    lines.append(line)
+    lines.append([])
+
+    return lines
+
+
+class TerminalRenderer:
+    """Redraws only the lines that changed since the previous frame
+
+    A changed line is repainted whole rather than compared cell by cell, so a
+    frame costs less CPU than a full reprint as well as far fewer bytes.
+    With `clear` off, the screen is left alone and frames are printed one
+    after another instead.
+    """
+
+    def __init__(self, stream: TextIO | None = None, clear: bool = True) -> None:
+        self.stream = stream or sys.stdout
+        self.clear = clear
+        self.previous: list[Line] = []
+        self.needs_clear = clear
+
+    def reset(self) -> None:
+        """Forget the last frame so the next render repaints the whole screen"""
+        self.previous = []
+        self.needs_clear = self.clear
+
+    def render(self, lines: list[Line]) -> int:
+        """Write the lines that changed since the previous frame in a single write"""
+        out: list[str] = []
+        if not self.clear:
+            out.extend(format_line(line) + "\n" for line in lines)
+            return self._write(out)
+
+        if self.needs_clear:
+            out.append("\033[H\033[J")
+            self.needs_clear = False
+
+        previous = self.previous
+        for row, line in enumerate(lines):
+            if row < len(previous) and line == previous[row]:
+                continue
+
+            # Repaint the line and erase whatever the old one left beyond it
+            out.append(f"\033[{row + 1};1H{format_line(line)}\033[K")
+
+        # Park the cursor below the frame for any following prompt, erasing
+        # rows a taller previous frame left there
+        out.append(f"\033[{len(lines) + 1};1H")
+        if len(previous) > len(lines):
+            out.append("\033[J")
+
+        self.previous = lines
+        return self._write(out)
+
+    def _write(self, out: list[str]) -> int:
+        data = "".join(out)
+        self.stream.write(data)
+        self.stream.flush()
+        return len(data)
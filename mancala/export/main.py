@@ -0,0 +1,90 @@
+"""Export finished games from a running API as NDJSON or binary records
+
+Pass --cursor-file to export incrementally: each run picks up where the last
+one stopped and records the new cursor once its export is complete.
+"""
+
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+
+import httpx
+
+from mancala.app.models.domain.enum import ExportFormatEnum
+from mancala.app.services.export import CURSOR_HEADER
+
+
+def read_cursor(path: str | None) -> int | None:
+    if not path or not os.path.exists(path):
+        return None
+
+    with open(path) as f:
+        text = f.read().strip()
+
+    return int(text) if text else None
+
+
+def write_cursor(path: str, cursor: str) -> None:
+    # Write atomically so an interrupted run never loses the previous cursor
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(cursor + "\n")
+
+    os.replace(tmp, path)
+
+
+def export(
+    url: str, out, since: int | None = None, fmt: str = "ndjson"
+) -> tuple[int, str | None]:
+    """Stream an export into `out`, returning bytes written and the next cursor"""
+    params: dict[str, str | int] = {"format": fmt}
+    if since is not None:
+        params["since"] = since
+
+    written = 0
+    endpoint = url.rstrip("/") + "/api/v1/export/games"
+    with httpx.stream("GET", endpoint, params=params, timeout=None) as response:
+        response.raise_for_status()
+        for data in response.iter_bytes():
+            out.write(data)
+            written += len(data)
+
+        return written, response.headers.get(CURSOR_HEADER)
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000", help="API server")
+    parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in ExportFormatEnum],
+        default=ExportFormatEnum.NDJSON.value,
+        help="Output format",
+    )
+    parser.add_argument("--since", type=int, default=None, help="Export cursor")
+    parser.add_argument(
+        "--cursor-file", default=None, help="Read the cursor from and save it to"
+    )
+    parser.add_argument("-o", "--output", default=None, help="Output file")
+    args = parser.parse_args()
+
+    since = args.since if args.since is not None else read_cursor(args.cursor_file)
+
+    with ExitStack() as stack:
+        out = (
+            stack.enter_context(open(args.output, "wb"))
+            if args.output
+            else sys.stdout.buffer
+        )
+        written, cursor = export(args.url, out, since, args.format)
+
+    if args.cursor_file and cursor:
+        write_cursor(args.cursor_file, cursor)
+
+    print(f"Exported {written:,} bytes, next cursor {cursor}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
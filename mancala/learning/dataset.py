@@ -0,0 +1,334 @@
+import argparse
+import json
+import math
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.board import Board
+from mancala.learning.selfplay import outcome_for, play_selfplay_game
+
+META_FILE = "meta.json"
+
+# Column name -> dtype; boards are stored row-major with one row per record
+COLUMNS = {
+    "boards": "uint8",
+    "players": "uint8",
+    "outcomes": "int8",
+    "moves": "uint8",
+}
+
+
+def produce_chunk(seed: int, games: int, epsilon: float) -> dict[str, np.ndarray]:
+    """Play a chunk of self-play games and return its records as columns"""
+    rng = random.Random(seed)
+    agent = Agent()
+    boards: list[list[int]] = []
+    players: list[int] = []
+    outcomes: list[int] = []
+    moves: list[int] = []
+
+    for _ in range(games):
+        game_boards, game_players, game_moves, winner = play_selfplay_game(
+            agent, rng, epsilon
+        )
+        boards.extend(game_boards)
+        players.extend(game_players)
+        outcomes.extend(outcome_for(winner, player) for player in game_players)
+        moves.extend(game_moves)
+
+    # Store moves as the pit number on the mover's own side (0-based)
+    pits = (len(boards[0]) - 2) // 2 if boards else 0
+    relative_moves = [
+        move - player * (pits + 1) for move, player in zip(moves, players)
+    ]
+
+    return {
+        "boards": np.asarray(boards, dtype=COLUMNS["boards"]),
+        "players": np.asarray(players, dtype=COLUMNS["players"]),
+        "outcomes": np.asarray(outcomes, dtype=COLUMNS["outcomes"]),
+        "moves": np.asarray(relative_moves, dtype=COLUMNS["moves"]),
+    }
+
+
+def position_keys(boards: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """64-bit polynomial hash of (board, side to move) per record"""
+    width = boards.shape[1]
+    multipliers = np.uint64(1_000_003) ** np.arange(width + 1, dtype=np.uint64)
+    keys = boards.astype(np.uint64) @ multipliers[:width]
+    return keys + players.astype(np.uint64) * multipliers[width]
+
+
+class PositionFilter:
+    """Bloom filter over position keys, so dedup memory stays fixed
+
+    Sized for `capacity` keys at a false-positive rate of `error_rate`; each
+    false positive drops a position that was in fact new. The defaults take
+    18 MB for 10M positions at 0.1%; past capacity the rate climbs, to about
+    6% at twice the capacity, and `false_positive_rate()` reports it.
+    """
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 0.001) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = -(-bits // 8) * 8
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros(self.size // 8, dtype=np.uint8)
+        self.count = 0
+
+    def false_positive_rate(self) -> float:
+        """Chance that a new key is taken for one already added"""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+    def add_new(self, keys: np.ndarray) -> np.ndarray:
+        """Add keys, returning a mask of the ones not seen before
+
+        Only the first of any keys repeated within `keys` counts as new.
+        """
+        unique, first = np.unique(keys, return_index=True)
+        positions = self._positions(unique)
+        cells, masks = positions >> 3, np.uint8(1) << (positions & 7).astype(np.uint8)
+        present = ((self.bits[cells] & masks) != 0).all(axis=0)
+
+        new = ~present
+        np.bitwise_or.at(self.bits, cells[:, new], masks[:, new])
+        self.count += int(new.sum())
+
+        mask = np.zeros(len(keys), dtype=bool)
+        mask[first[new]] = True
+        return mask
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        # Double hashing: bit i of a key is h1 + i * h2, with h2 odd
+        h1 = keys.astype(np.uint64)
+        h2 = (h1 * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(29) | np.uint64(1)
+        steps = np.arange(self.hashes, dtype=np.uint64)[:, None]
+        return (h1 + steps * h2) % np.uint64(self.size)
+
+
+class DatasetWriter:
+    """Appends record chunks to one raw file per column"""
+
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        dedup: bool = True,
+        dedup_capacity: int = 10_000_000,
+    ) -> None:
+        self.path = path
+        self.width = width
+        self.dedup = dedup
+        self.count = 0
+        self.chunks = 0  # Chunks appended over the dataset's lifetime
+        self.duplicates = 0
+        self.seen = PositionFilter(dedup_capacity) if dedup else None
+
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+
+            if meta["width"] != width:
+                raise ValueError("Existing dataset has a different board width")
+
+            self.count = meta["count"]
+            self.chunks = meta.get("chunks", 0)
+
+        # Drop any partial chunk left behind by an interrupted run. Columns
+        # are closed again if anything fails before the writer is ready
+        self.files = {}
+        with ExitStack() as stack:
+            for name in COLUMNS:
+                column_path = os.path.join(path, f"{name}.bin")
+                row_size = np.dtype(COLUMNS[name]).itemsize * (
+                    width if name == "boards" else 1
+                )
+                with open(column_path, "ab") as f:
+                    f.truncate(self.count * row_size)
+
+                self.files[name] = stack.enter_context(open(column_path, "ab"))
+
+            if self.seen is not None and self.count:
+                existing = Dataset(path)
+                block = 1_000_000
+                for start in range(0, self.count, block):
+                    self.seen.add_new(
+                        position_keys(
+                            existing.boards[start : start + block],
+                            existing.players[start : start + block],
+                        )
+                    )
+
+            self.resources = stack.pop_all()
+
+    def append(self, chunk: dict[str, np.ndarray]) -> int:
+        """Write a chunk, skipping positions already in the dataset"""
+        if self.seen is not None and len(chunk["players"]):
+            keep = self.seen.add_new(position_keys(chunk["boards"], chunk["players"]))
+            self.duplicates += len(keep) - int(keep.sum())
+            chunk = {name: column[keep] for name, column in chunk.items()}
+
+        written = len(chunk["players"])
+        for name, column in chunk.items():
+            self.files[name].write(column.tobytes())
+
+        self.count += written
+        self.chunks += 1
+        self._write_meta()
+        return written
+
+    def _write_meta(self) -> None:
+        for f in self.files.values():
+            f.flush()
+
+        meta = {
+            "count": self.count,
+            "chunks": self.chunks,
+            "width": self.width,
+            "columns": COLUMNS,
+        }
+        tmp_path = os.path.join(self.path, f"{META_FILE}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+
+        os.replace(tmp_path, os.path.join(self.path, META_FILE))
+
+    def close(self) -> None:
+        self.resources.close()
+
+
+class Dataset:
+    """Memory-mapped, zero-parse view over a dataset directory"""
+
+    def __init__(self, path: str) -> None:
+        with open(os.path.join(path, META_FILE)) as f:
+            meta = json.load(f)
+
+        self.count: int = meta["count"]
+        self.width: int = meta["width"]
+        columns = {}
+        for name, dtype in meta["columns"].items():
+            shape = (self.count, self.width) if name == "boards" else (self.count,)
+            if self.count == 0:
+                columns[name] = np.empty(shape, dtype=dtype)
+                continue
+
+            columns[name] = np.memmap(
+                os.path.join(path, f"{name}.bin"), dtype=dtype, mode="r", shape=shape
+            )
+
+        self.boards = columns["boards"]
+        self.players = columns["players"]
+        self.outcomes = columns["outcomes"]
+        self.moves = columns["moves"]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def generate(
+    path: str,
+    games: int,
+    chunk_games: int = 200,
+    epsilon: float = 0.2,
+    workers: int | None = None,
+    dedup: bool = True,
+    seed: int = 0,
+    dedup_capacity: int = 10_000_000,
+) -> DatasetWriter:
+    """Stream self-play records to disk with a bounded number of chunks in flight
+
+    Extending an existing dataset continues its chunk seeds rather than
+    replaying the games already in it.
+    """
+    writer = DatasetWriter(
+        path, width=len(Board().board), dedup=dedup, dedup_capacity=dedup_capacity
+    )
+    first_chunk = writer.chunks
+    chunk_sizes = [
+        min(chunk_games, games - start) for start in range(0, games, chunk_games)
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    pending: deque[Future] = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for index, size in enumerate(chunk_sizes):
+                # Keep at most two chunks per worker buffered
+                if len(pending) >= 2 * workers:
+                    writer.append(pending.popleft().result())
+
+                pending.append(
+                    executor.submit(
+                        produce_chunk,
+                        seed * 1_000_003 + first_chunk + index,
+                        size,
+                        epsilon,
+                    )
+                )
+
+            # Results are written in submission order so runs are reproducible
+            while pending:
+                writer.append(pending.popleft().result())
+
+    finally:
+        writer.close()
+
+    return writer
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description="Generate a self-play dataset")
+    parser.add_argument("--output", required=True, help="Dataset directory")
+    parser.add_argument("--games", type=int, default=10_000, help="Games to play")
+    parser.add_argument(
+        "--chunk-games", type=int, default=200, help="Games per producer chunk"
+    )
+    parser.add_argument(
+        "--epsilon", type=float, default=0.2, help="Random move rate in self-play"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Producer processes")
+    parser.add_argument(
+        "--no-dedup", action="store_true", help="Keep repeated positions"
+    )
+    parser.add_argument(
+        "--dedup-capacity",
+        type=int,
+        default=10_000_000,
+        help="Positions the dedup filter is sized for (0.1%% false positives)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    writer = generate(
+        args.output,
+        args.games,
+        chunk_games=args.chunk_games,
+        epsilon=args.epsilon,
+        workers=args.workers,
+        dedup=not args.no_dedup,
+        seed=args.seed,
+        dedup_capacity=args.dedup_capacity,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"Records in dataset: {writer.count}")
+    print(f"Duplicates skipped: {writer.duplicates}")
+    if writer.seen is not None:
+        rate = writer.seen.false_positive_rate()
+        print(f"Dedup false-positive rate: {rate:.3%}")
+    print(f"Elapsed: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import os
+from collections.abc import Sequence
+
+import numpy as np
+
+from mancala.app.core.assets import SharedAsset
+from mancala.app.models.domain.evaluation import Evaluator
+
+
+def encode(boards: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """Rotate boards so the evaluated player's pits come first, then normalise"""
+    width = boards.shape[1]
+    pits = (width - 2) // 2
+
+    # Column order per player: own pits, own store, opponent pits, opponent store
+    order = np.stack([np.arange(width), np.roll(np.arange(width), -(pits + 1))])
+    features = np.take_along_axis(boards, order[players], axis=1).astype(np.float32)
+
+    totals = features.sum(axis=1, keepdims=True)
+    return features / np.maximum(totals, 1.0)
+
+
+class MLPEvaluator(Evaluator):
+    """Two-hidden-layer value network over the pit counts, CPU-only NumPy"""
+
+    name = "mlp"
+
+    # Directory the weights are mapped from, if loaded with load_mapped
+    directory: str | None = None
+
+    def __init__(self, params: dict[str, np.ndarray]) -> None:
+        # asarray leaves float32 arrays alone, so mapped weights stay mapped
+        self.params = {
+            key: np.asarray(value, dtype=np.float32) for key, value in params.items()
+        }
+
+    @classmethod
+    def initialise(
+        cls, width: int = 14, hidden: tuple[int, int] = (64, 32), seed: int = 0
+    ) -> "MLPEvaluator":
+        """Build an untrained model with He-initialised weights"""
+        rng = np.random.default_rng(seed)
+        sizes = [width, *hidden, 1]
+        params = {}
+        for layer, (fan_in, fan_out) in enumerate(zip(sizes, sizes[1:]), start=1):
+            params[f"w{layer}"] = rng.normal(
+                0.0, np.sqrt(2.0 / fan_in), (fan_in, fan_out)
+            )
+            params[f"b{layer}"] = np.zeros(fan_out)
+
+        return cls(params)
+
+    @classmethod
+    def load(cls, path: str) -> "MLPEvaluator":
+        with np.load(path) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def save(self, path: str) -> None:
+        np.savez(path, **self.params)
+
+    @classmethod
+    def load_mapped(cls, directory: str) -> "MLPEvaluator":
+        """Map weights saved by `save_arrays` read-only instead of reading them
+
+        Every process mapping the same files shares one copy in the page cache.
+        """
+        model = cls(
+            {
+                name[:-4]: np.load(os.path.join(directory, name), mmap_mode="r")
+                for name in os.listdir(directory)
+                if name.endswith(".npy")
+            }
+        )
+        model.directory = directory
+        return model
+
+    def __reduce__(self):
+        # Mapped weights travel as their path, so pool workers map the files
+        # rather than receive a copy
+        if self.directory is None:
+            return MLPEvaluator, (self.params,)
+
+        return _load_version, (self.directory,)
+
+    def save_arrays(self, directory: str) -> None:
+        """Save each weight as its own .npy file, the layout `load_mapped` reads"""
+        os.makedirs(directory, exist_ok=True)
+        for key, value in self.params.items():
+            np.save(os.path.join(directory, f"{key}.npy"), value)
+
+    def forward(self, features: np.ndarray) -> np.ndarray:
+        """Run the network on already encoded features"""
+        p = self.params
+        hidden = np.maximum(features @ p["w1"] + p["b1"], 0.0)
+        hidden = np.maximum(hidden @ p["w2"] + p["b2"], 0.0)
+        return np.tanh(hidden @ p["w3"] + p["b3"])[:, 0]
+
+    def predict(self, boards: np.ndarray, players: np.ndarray) -> np.ndarray:
+        """Evaluate a (batch, slots) board array in a single pass"""
+        return self.forward(encode(boards, players))
+
+    def evaluate_batch(
+        self, boards: Sequence[Sequence[int]], players: Sequence[int]
+    ) -> list[float]:
+        values = self.predict(
+            np.asarray(boards, dtype=np.int32), np.asarray(players, dtype=np.intp)
+        )
+        return values.tolist()
+
+
+class SharedMLPEvaluator(Evaluator):
+    """MLP weights published to a shared assets directory, mapped by each worker
+
+    A newly published version is picked up within `check_interval` seconds.
+    Searches pin one `snapshot()` for their whole run, named after its
+    version, and key their cached results with that same snapshot, so results
+    from different weights never share a key.
+    """
+
+    def __init__(
+        self, root: str, asset: str = "evaluator", check_interval: float = 1.0
+    ) -> None:
+        self.root = root
+        self.asset = asset
+        self.check_interval = check_interval
+        self.shared = SharedAsset(root, asset, _load_version, check_interval)
+
+    @property
+    def name(self) -> str:
+        return self.snapshot().name
+
+    def snapshot(self) -> MLPEvaluator:
+        """The live version's weights, named after the version"""
+        return self.shared.get()
+
+    def evaluate_batch(
+        self, boards: Sequence[Sequence[int]], players: Sequence[int]
+    ) -> list[float]:
+        return self.snapshot().evaluate_batch(boards, players)
+
+    def __getstate__(self) -> dict:
+        # Search workers map the files themselves rather than receive a copy
+        return {
+            "root": self.root,
+            "asset": self.asset,
+            "check_interval": self.check_interval,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+
+def _load_version(directory: str) -> MLPEvaluator:
+    """Map one published version of the weights, named after it"""
+    model = MLPEvaluator.load_mapped(directory)
+    model.name = f"mlp@{os.path.basename(directory)}"
+    return model
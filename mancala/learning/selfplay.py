@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.game import Game
+
+
+def play_selfplay_game(
+    agent: Agent, rng: random.Random, epsilon: float
+) -> tuple[list[list[int]], list[int], list[int], int | None]:
+    """Play one epsilon-greedy game and return its positions, sides, moves, winner"""
+    game = Game()
+    boards: list[list[int]] = []
+    players: list[int] = []
+    moves: list[int] = []
+
+    while not game.game_over:
+        if rng.random() < epsilon:
+            move = rng.choice(list(game.board.legal_moves(game.current_player)))
+        else:
+            move = agent.choose_move(game)
+
+        if move is None:
+            break
+
+        boards.append(list(game.board.board))
+        players.append(game.current_player)
+        moves.append(move)
+        game.make_move(move)
+
+    winner = game.board.get_winner() if game.game_over else None
+    return boards, players, moves, winner
+
+
+def outcome_for(winner: int | None, player_id: int) -> int:
+    """Game result from one player's point of view (1 win, 0 draw, -1 loss)"""
+    if winner is None or winner == -1:
+        return 0
+
+    return 1 if winner == player_id else -1
+
+
+def generate_samples(
+    games: int, epsilon: float = 0.2, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collect (boards, side to move, outcome) training arrays from self-play"""
+    rng = random.Random(seed)
+    agent = Agent()
+    all_boards: list[list[int]] = []
+    all_players: list[int] = []
+    all_outcomes: list[int] = []
+
+    for _ in range(games):
+        boards, players, _, winner = play_selfplay_game(agent, rng, epsilon)
+        all_boards.extend(boards)
+        all_players.extend(players)
+        all_outcomes.extend(outcome_for(winner, player) for player in players)
+
+    return (
+        np.asarray(all_boards, dtype=np.int32),
+        np.asarray(all_players, dtype=np.intp),
+        np.asarray(all_outcomes, dtype=np.float32),
+    )
@@ -0,0 +1,142 @@
+import argparse
+import tempfile
+
+import numpy as np
+
+from mancala.app.core.assets import publish
+from mancala.learning.dataset import Dataset
+from mancala.learning.model import MLPEvaluator, encode
+from mancala.learning.selfplay import generate_samples
+
+
+def train(
+    model: MLPEvaluator,
+    boards: np.ndarray,
+    players: np.ndarray,
+    outcomes: np.ndarray,
+    epochs: int = 10,
+    batch_size: int = 256,
+    learning_rate: float = 1e-3,
+    seed: int = 0,
+) -> list[float]:
+    """Fit the model to game outcomes with mean squared error and Adam"""
+    rng = np.random.default_rng(seed)
+    features = encode(boards, players)
+    targets = outcomes.astype(np.float32)
+    params = model.params
+
+    first_moment = {key: np.zeros_like(value) for key, value in params.items()}
+    second_moment = {key: np.zeros_like(value) for key, value in params.items()}
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    step = 0
+    losses = []
+
+    for _ in range(epochs):
+        order = rng.permutation(len(features))
+        epoch_loss = 0.0
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            x, y = features[batch], targets[batch]
+
+            # Forward pass, keeping activations for backprop
+            z1 = x @ params["w1"] + params["b1"]
+            h1 = np.maximum(z1, 0.0)
+            z2 = h1 @ params["w2"] + params["b2"]
+            h2 = np.maximum(z2, 0.0)
+            out = np.tanh(h2 @ params["w3"] + params["b3"])[:, 0]
+
+            error = out - y
+            epoch_loss += float(np.sum(error**2))
+
+            # Backward pass
+            d_out = (2.0 / len(batch)) * error * (1.0 - out**2)
+            d_out = d_out[:, None]
+            d_h2 = (d_out @ params["w3"].T) * (z2 > 0)
+            d_h1 = (d_h2 @ params["w2"].T) * (z1 > 0)
+            grads = {
+                "w3": h2.T @ d_out,
+                "b3": d_out.sum(axis=0),
+                "w2": h1.T @ d_h2,
+                "b2": d_h2.sum(axis=0),
+                "w1": x.T @ d_h1,
+                "b1": d_h1.sum(axis=0),
+            }
+
+            step += 1
+            for key, grad in grads.items():
+                first_moment[key] = beta1 * first_moment[key] + (1 - beta1) * grad
+                second_moment[key] = beta2 * second_moment[key] + (1 - beta2) * grad**2
+                m_hat = first_moment[key] / (1 - beta1**step)
+                v_hat = second_moment[key] / (1 - beta2**step)
+                params[key] -= (learning_rate * m_hat / (np.sqrt(v_hat) + eps)).astype(
+                    np.float32
+                )
+
+        losses.append(epoch_loss / len(features))
+
+    return losses
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description="Train a Mancala value network")
+    parser.add_argument("--games", type=int, default=2000, help="Self-play games")
+    parser.add_argument(
+        "--dataset", default=None, help="Train from a generated dataset directory"
+    )
+    parser.add_argument(
+        "--epsilon", type=float, default=0.2, help="Random move rate in self-play"
+    )
+    parser.add_argument("--epochs", type=int, default=10, help="Training epochs")
+    parser.add_argument("--batch-size", type=int, default=256, help="Minibatch size")
+    parser.add_argument("--lr", type=float, default=1e-3, help="Adam learning rate")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", default="value_model.npz", help="Weights file")
+    parser.add_argument(
+        "--publish",
+        default=None,
+        metavar="ROOT",
+        help="Also publish the weights to running servers' assets directory",
+    )
+
+    args = parser.parse_args()
+
+    if args.dataset:
+        dataset = Dataset(args.dataset)
+        boards, players = dataset.boards, dataset.players.astype(np.intp)
+        outcomes = dataset.outcomes.astype(np.float32)
+    else:
+        print(f"Generating {args.games} self-play games...")
+        boards, players, outcomes = generate_samples(
+            args.games, args.epsilon, args.seed
+        )
+
+    print(f"Training on {len(boards)} positions...")
+
+    model = MLPEvaluator.initialise(width=boards.shape[1], seed=args.seed)
+    losses = train(
+        model,
+        boards,
+        players,
+        outcomes,
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        learning_rate=args.lr,
+        seed=args.seed,
+    )
+    for epoch, loss in enumerate(losses, start=1):
+        print(f"Epoch {epoch:>3}: mse={loss:.4f}")
+
+    model.save(args.output)
+    print(f"Saved weights to {args.output}")
+
+    if args.publish:
+        with tempfile.TemporaryDirectory() as staging:
+            model.save_arrays(staging)
+            version = publish(args.publish, "evaluator", staging)
+        print(f"Published evaluator version {version} to {args.publish}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Replay recorded API traffic against the app and report per-route latency
+
+Record traffic by starting the API with MANCALA_RECORD_TRAFFIC=traffic.jsonl.gz,
+then replay it with: python -m mancala.loadtest.replay traffic.jsonl.gz
+
+Every recorded client replays from this one host, so start the target with
+MANCALA_RATE_LIMIT=off unless the rate limits themselves are under test.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from mancala.app.core.recording import response_ids
+
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+@dataclass(slots=True)
+class Event:
+    offset: float
+    method: str
+    path: str
+    status: int
+    latency_ms: float
+    body: Any = None
+    ids: list[str] = field(default_factory=list)
+
+    @property
+    def route(self) -> str:
+        """Path with IDs templated out, for grouping statistics"""
+        return f"{self.method} {UUID_PATTERN.sub('{id}', self.path)}"
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    recorded: list[float] = field(default_factory=list)
+    errors: int = 0
+    mismatches: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+
+@dataclass
+class ReplayReport:
+    routes: dict[str, RouteStats] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def record(self, event: Event, status: int | None, latency_ms: float) -> None:
+        stats = self.routes.setdefault(event.route, RouteStats())
+        stats.latencies.append(latency_ms)
+        stats.recorded.append(event.latency_ms)
+
+        if status is None or status >= 500:
+            stats.errors += 1
+
+        if status != event.status:
+            stats.mismatches += 1
+
+    def lines(self) -> list[str]:
+        header = (
+            f"{'route':<44} {'count':>7} {'req/s':>8} {'p50':>8} {'p90':>8} "
+            f"{'p99':>8} {'rec p50':>8} {'errors':>7} {'mismatch':>8}"
+        )
+        lines = [header, "-" * len(header)]
+
+        total = 0
+        for route, stats in sorted(self.routes.items()):
+            total += stats.count
+            lines.append(
+                f"{route:<44} {stats.count:>7} "
+                f"{stats.count / self.elapsed:>8.1f} "
+                f"{percentile(stats.latencies, 50):>8.2f} "
+                f"{percentile(stats.latencies, 90):>8.2f} "
+                f"{percentile(stats.latencies, 99):>8.2f} "
+                f"{percentile(stats.recorded, 50):>8.2f} "
+                f"{stats.errors / stats.count:>7.1%} "
+                f"{stats.mismatches / stats.count:>8.1%}"
+            )
+
+        lines.append("-" * len(header))
+        lines.append(
+            f"{total:,} requests in {self.elapsed:.2f}s = "
+            f"{total / self.elapsed:,.1f} req/s (latencies in ms)"
+        )
+        return lines
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def load_recording(path: str) -> list[Event]:
+    """Read a recording written by TrafficRecorder, in time order"""
+    events = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            data = json.loads(line)
+            if "m" not in data:
+                continue  # Header
+
+            events.append(
+                Event(
+                    offset=data["t"],
+                    method=data["m"],
+                    path=data["p"],
+                    status=data["s"],
+                    latency_ms=data["ms"],
+                    body=data.get("b"),
+                    ids=data.get("ids", []),
+                )
+            )
+
+    events.sort(key=lambda event: event.offset)
+    return events
+
+
+def build_sessions(events: list[Event]) -> list[list[Event]]:
+    """Group events that must run in order: everything touching one game
+
+    A game's session starts at the request that created it. Requests that
+    mention no recorded ID run on their own.
+    """
+    sessions: list[list[Event]] = []
+    owner: dict[str, list[Event]] = {}
+
+    for event in events:
+        found = UUID_PATTERN.findall(event.path)
+        session = next((owner[i] for i in found if i in owner), None)
+        if session is None:
+            session = []
+            sessions.append(session)
+
+        session.append(event)
+        for i in [*found, *event.ids]:
+            owner.setdefault(i, session)
+
+    return sessions
+
+
+class Replayer:
+    """Replays sessions concurrently, keeping each session's own order"""
+
+    def __init__(
+        self, client: httpx.AsyncClient, speed: float = 1.0, concurrency: int = 100
+    ) -> None:
+        self.client = client
+        self.speed = speed
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.report = ReplayReport()
+
+    async def run(self, events: list[Event]) -> ReplayReport:
+        if not events:
+            return self.report
+
+        origin = events[0].offset
+        start = time.perf_counter()
+        sessions = build_sessions(events)
+
+        await asyncio.gather(
+            *(self._run_session(session, start, origin) for session in sessions)
+        )
+
+        self.report.elapsed = time.perf_counter() - start
+        return self.report
+
+    async def _run_session(
+        self, session: list[Event], start: float, origin: float
+    ) -> None:
+        ids: dict[str, str] = {}  # Recorded ID -> ID issued during the replay
+
+        for event in session:
+            # Hold to the recorded schedule, scaled; speed 0 means flat out
+            if self.speed > 0:
+                delay = start + (event.offset - origin) / self.speed
+                delay -= time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            path = UUID_PATTERN.sub(lambda m: ids.get(m.group(), m.group()), event.path)
+
+            async with self.semaphore:
+                sent = time.perf_counter()
+                try:
+                    response = await self.client.request(
+                        event.method, path, json=event.body
+                    )
+                    status = response.status_code
+
+                except httpx.HTTPError:
+                    response, status = None, None
+
+                latency_ms = (time.perf_counter() - sent) * 1000
+
+            self.report.record(event, status, latency_ms)
+
+            if response is not None and event.ids and response.is_success:
+                ids.update(zip(event.ids, response_ids(response.json())))
+
+
+async def replay(
+    path: str, url: str | None, speed: float, concurrency: int
+) -> ReplayReport:
+    events = load_recording(path)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    if url:
+        transport = httpx.AsyncHTTPTransport(limits=limits)
+        base_url = url
+
+    else:
+        # Drive the app in-process, so only the app itself is measured
+        from mancala.app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://replay"
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=30.0
+    ) as client:
+        return await Replayer(client, speed, concurrency).run(events)
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="Recording written by the API")
+    parser.add_argument(
+        "--url", default=None, help="Running server to target (default: in-process)"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Multiple of the recorded pace (0 replays as fast as possible)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=100, help="Maximum requests in flight"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(replay(args.recording, args.url, args.speed, args.concurrency))
+    for line in report.lines():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import sqlite3
+from collections.abc import Iterable
+
+from mancala.solver.rules import Position
+
+
+class SolutionDatabase:
+    """Solved positions on disk, keyed by the solver's position bytes
+
+    Each batch of solutions is committed as it arrives, so an interrupted
+    solve loses at most the work in flight and resumes from what is stored.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS solutions (
+                position BLOB PRIMARY KEY,
+                value INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def get(self, position: Position) -> int | None:
+        row = self.conn.execute(
+            "SELECT value FROM solutions WHERE position = ?", (position,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def put_many(self, solutions: Iterable[tuple[Position, int]]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?)", solutions
+            )
+
+    def get_meta(self, name: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def set_meta(self, **values: object) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [(name, str(value)) for name, value in values.items()],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
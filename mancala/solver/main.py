@@ -0,0 +1,169 @@
+"""Solve a small Mancala variant exactly and store the results for the oracle agent
+
+Run with: python -m mancala.solver.main --pits 4 --stones 3 --db kalah-4x3.sqlite
+Starting again with the same database resumes an interrupted run.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+
+from mancala.solver.database import SolutionDatabase
+from mancala.solver.rules import Position, moves, start_position
+from mancala.solver.search import Solver
+
+# Work unit result: (position, value, other solved positions worth keeping,
+# nodes searched)
+UnitResult = tuple[Position, int, list[tuple[Position, int]], int]
+
+_solver: Solver | None = None
+_exported: set[Position] = set()
+
+
+def frontier(start: Position, plies: int) -> list[Position]:
+    """Distinct positions exactly `plies` moves from the start, in a fixed order"""
+    level = {start}
+    for _ in range(plies):
+        level = {
+            child for position in level for _, _, child, _ in moves(position) if child
+        }
+
+    return sorted(level)
+
+
+def _init_worker(max_entries: int) -> None:
+    global _solver
+    _solver = Solver(max_entries)
+    _exported.clear()
+
+
+def _solve_unit(task: tuple[Position, int]) -> UnitResult:
+    """Solve one position, keeping the table for the worker's next unit"""
+    position, oracle_stones = task
+    nodes = _solver.nodes
+    value = _solver.solve(position)
+
+    # Positions with many stones left are worth storing for the oracle
+    exported = [
+        (solved, solved_value)
+        for solved, solved_value in _solver.exact(oracle_stones)
+        if solved not in _exported
+    ]
+    _exported.update(solved for solved, _ in exported)
+    return position, value, exported, _solver.nodes - nodes
+
+
+def solve(
+    pits: int,
+    stones: int,
+    path: str,
+    workers: int = 1,
+    plies: int = 4,
+    max_entries: int = 2_000_000,
+    oracle_stones: int | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[int, dict[int, int]]:
+    """Solve from the start position, returning its value and each move's value"""
+    start = start_position(pits, stones)
+    if oracle_stones is None:
+        oracle_stones = sum(start) * 2 // 3
+
+    db = SolutionDatabase(path)
+    try:
+        solved = (db.get_meta("pits"), db.get_meta("stones"))
+        if solved != (None, None) and solved != (str(pits), str(stones)):
+            raise ValueError(f"{path} holds a {solved[0]}x{solved[1]} solution")
+
+        db.set_meta(pits=pits, stones=stones, oracle_stones=oracle_stones)
+
+        units = frontier(start, plies)
+        pending = [unit for unit in units if db.get(unit) is None]
+        log(f"{len(units):,} work units, {len(units) - len(pending):,} already solved")
+
+        started = logged = time.perf_counter()
+        nodes = 0
+        tasks = [(unit, oracle_stones) for unit in pending]
+        with multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(max_entries,)
+        ) as pool:
+            results = pool.imap_unordered(_solve_unit, tasks)
+            for done, (unit, value, exported, searched) in enumerate(results, 1):
+                # Committed one unit at a time, so a restart loses little
+                db.put_many([(unit, value), *exported])
+                nodes += searched
+
+                now = time.perf_counter()
+                if now - logged >= 5 or done == len(pending):
+                    logged = now
+                    log(
+                        f"{done:,}/{len(pending):,} units  {nodes:,} nodes  "
+                        f"{nodes / (now - started):,.0f} nodes/s"
+                    )
+
+        # Only the plies above the work units are left to search
+        solver = Solver(max_entries, known=db.get)
+        values = solver.best_moves(start)
+        value = max(values.values())
+        db.put_many([(start, value), *solver.exact()])
+
+        # Below this many stones nothing is stored, so lookups aren't worth it
+        lookup_stones = min(oracle_stones, *map(sum, units)) if units else 0
+        db.set_meta(value=value, lookup_stones=lookup_stones)
+
+    finally:
+        db.close()
+
+    return value, values
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pits", type=int, default=4, help="Pits per side")
+    parser.add_argument("--stones", type=int, default=3, help="Starting stones per pit")
+    parser.add_argument("--db", required=True, help="Solution database to write")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes"
+    )
+    parser.add_argument(
+        "--plies", type=int, default=4, help="Depth of the positions handed out"
+    )
+    parser.add_argument(
+        "--table-size",
+        type=int,
+        default=2_000_000,
+        help="Positions each worker keeps in memory",
+    )
+    parser.add_argument(
+        "--oracle-stones",
+        type=int,
+        default=None,
+        help="Store every solved position with this many stones in play "
+        "(default: two thirds of all stones)",
+    )
+    args = parser.parse_args()
+
+    try:
+        value, values = solve(
+            args.pits,
+            args.stones,
+            args.db,
+            args.workers,
+            args.plies,
+            args.table_size,
+            args.oracle_stones,
+        )
+
+    except ValueError as exc:
+        # A database already holding another ruleset's solution
+        parser.error(str(exc))
+
+    print(f"{args.pits}x{args.stones}: {value:+d} for the first player")
+    for pit, move_value in sorted(values.items()):
+        print(f"  pit {pit + 1}: {move_value:+d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from mancala.app.models.domain.game import Game
+from mancala.solver.database import SolutionDatabase
+from mancala.solver.rules import board_index, from_game
+from mancala.solver.search import Solver
+
+
+class OracleAgent:
+    """Perfect play from a solution database written by `mancala.solver.main`
+
+    Positions the database doesn't hold are solved on the spot, reusing every
+    stored value below them, which stays quick for the variants small enough
+    to have been solved.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1_000_000) -> None:
+        self.db = SolutionDatabase(path)
+        pits = self.db.get_meta("pits")
+        if pits is None:
+            raise ValueError(f"{path} holds no solution")
+
+        self.pits = int(pits)
+        self.stones = int(self.db.get_meta("stones"))
+        self.solver = Solver(
+            max_entries,
+            known=self.db.get,
+            known_stones=int(self.db.get_meta("lookup_stones") or 0),
+        )
+
+    @property
+    def config_key(self) -> tuple:
+        return ("oracle", self.pits, self.stones)
+
+    def choose_move(self, game: Game) -> int | None:
+        """The move with the best game-theoretic value, lowest pit on ties"""
+        if game.game_over:
+            return None
+
+        if game.board.pits != self.pits:
+            raise ValueError(
+                f"Solved for {self.pits} pits per side, not {game.board.pits}"
+            )
+
+        values = self.solver.best_moves(from_game(game))
+        if not values:
+            return None
+
+        best = max(values, key=lambda pit: (values[pit], -pit))
+        return board_index(game, best)
@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+
+from mancala.app.models.domain.game import Game
+
+# Pit counts only, seen from the side to move: its pits first, then the
+# opponent's, each in sowing order. Stores are left out, since what is still
+# to be won depends on the pits alone, so positions reached with different
+# scores share one solution.
+Position = bytes
+
+# (pit, stones banked by the mover, following position or None once the game
+# ends, whether the mover plays again)
+Move = tuple[int, int, Position | None, bool]
+
+
+def start_position(pits: int, stones: int) -> Position:
+    return bytes([stones] * (2 * pits))
+
+
+def from_game(game: Game) -> Position:
+    """The solver's view of a game's position"""
+    board = game.board.board
+    first, second = game.board.topology.pit_ranges
+    if game.current_player == 1:
+        first, second = second, first
+
+    return bytes(board[first.start : first.stop].tolist()) + bytes(
+        board[second.start : second.stop].tolist()
+    )
+
+
+def board_index(game: Game, pit: int) -> int:
+    """Convert a solver pit (0-based, on the mover's side) to a board index"""
+    return game.board.topology.pit_ranges[game.current_player][pit]
+
+
+def moves(position: Position) -> Iterator[Move]:
+    """Every legal move with its outcome, following the engine's rules"""
+    pits = len(position) // 2
+    cycle = 2 * pits + 1  # Both sides' pits and the mover's store
+
+    for pit in range(pits):
+        stones = position[pit]
+        if not stones:
+            continue
+
+        cells = list(position)
+        cells[pit] = 0
+
+        # Slot `pits` is the mover's store, opponent pits follow it
+        laps, remainder = divmod(stones, cycle)
+        banked = laps
+        if laps:
+            cells = [count + laps for count in cells]
+
+        slot = pit
+        for _ in range(remainder):
+            slot = (slot + 1) % cycle
+            if slot == pits:
+                banked += 1
+
+            else:
+                cells[slot if slot < pits else slot - 1] += 1
+
+        own = sum(cells[:pits])
+        other = sum(cells[pits:])
+        if not own or not other:
+            # Each side sweeps its own remaining stones
+            yield pit, banked + own - other, None, False
+            continue
+
+        last = (pit + stones) % cycle
+        if last == pits:
+            yield pit, banked, bytes(cells), True
+            continue
+
+        if last < pits and cells[last] == 1:
+            opposite = 2 * pits - 1 - last
+            if cells[opposite]:
+                captured = cells[last] + cells[opposite]
+                cells[last] = cells[opposite] = 0
+                banked += captured
+                own -= 1
+                other -= captured - 1
+
+                if not own or not other:
+                    yield pit, banked + own - other, None, False
+                    continue
+
+        # The opponent moves next, so turn the board around
+        yield pit, banked, bytes(cells[pits:] + cells[:pits]), False
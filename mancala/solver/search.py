@@ -0,0 +1,151 @@
+from collections import Counter
+from collections.abc import Callable
+
+from mancala.solver.rules import Position, moves
+
+# (lower, upper) bounds on a position's value
+Bounds = tuple[int, int]
+
+
+class Solver:
+    """Exact values by MTD(f) over alpha-beta with a bounded transposition table
+
+    A position's value is the most the side to move can finish ahead by,
+    counting only stones still in play. The table holds at most `max_entries`
+    positions and, when full, keeps the half with the most stones in play,
+    which are the most expensive to search again. Positions with at least
+    `known_stones` stones are first looked up with `known`, such as a solution
+    database, so solved subtrees are never searched again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2_000_000,
+        known: Callable[[Position], int | None] | None = None,
+        known_stones: int = 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.known = known
+        self.known_stones = known_stones
+        self.table: dict[Position, Bounds] = {}
+        self.nodes = 0
+        self.shrinks = 0
+
+    def solve(self, position: Position, guess: int = 0) -> int:
+        """The exact value of a position"""
+        lower, upper = -sum(position), sum(position)
+        value = max(lower, min(upper, guess))
+
+        # Null-window probes narrow the bounds until they meet
+        while lower < upper:
+            beta = value + 1 if value == lower else value
+            value = self.alphabeta(position, beta - 1, beta)
+            if value < beta:
+                upper = value
+
+            else:
+                lower = value
+
+        return value
+
+    def best_moves(self, position: Position) -> dict[int, int]:
+        """The exact value of every legal move, by pit on the mover's side"""
+        values = {}
+        for pit, banked, child, again in moves(position):
+            if child is None:
+                values[pit] = banked
+
+            elif again:
+                values[pit] = banked + self.solve(child)
+
+            else:
+                values[pit] = banked - self.solve(child)
+
+        return values
+
+    def exact(self, min_stones: int = 0) -> list[tuple[Position, int]]:
+        """Solved positions in the table holding at least `min_stones` stones"""
+        return [
+            (position, lower)
+            for position, (lower, upper) in self.table.items()
+            if lower == upper and sum(position) >= min_stones
+        ]
+
+    def shrink(self) -> None:
+        """Drop the table's positions with the fewest stones, keeping at most half"""
+        table = self.table
+        counts = Counter(map(sum, table))
+
+        # Smallest stone count whose positions, and all bigger ones, fit in half
+        kept = 0
+        threshold = max(counts) + 1
+        for stones in sorted(counts, reverse=True):
+            if kept + counts[stones] > self.max_entries // 2:
+                break
+
+            kept += counts[stones]
+            threshold = stones
+
+        # In place, as searches further up the stack hold the same dict
+        for position in [position for position in table if sum(position) < threshold]:
+            del table[position]
+
+        self.shrinks += 1
+
+    def alphabeta(self, position: Position, alpha: int, beta: int) -> int:
+        """Fail-soft alpha-beta: exact inside (alpha, beta), a bound outside it"""
+        self.nodes += 1
+        total = sum(position)
+
+        table = self.table
+        lower, upper = table.get(position, (-total, total))
+        if lower >= beta:
+            return lower
+
+        if upper <= alpha:
+            return upper
+
+        if total >= self.known_stones and self.known is not None:
+            value = self.known(position)
+            if value is not None:
+                table[position] = (value, value)
+                return value
+
+        alpha, beta = max(alpha, lower), min(beta, upper)
+        window_alpha = alpha
+
+        # Extra turns and big gains first, as they most often cut off the rest
+        ordered = sorted(moves(position), key=lambda move: (not move[3], -move[1]))
+
+        best = -total
+        for _, banked, child, again in ordered:
+            if child is None:
+                value = banked
+
+            elif again:
+                value = banked + self.alphabeta(child, alpha - banked, beta - banked)
+
+            else:
+                value = banked - self.alphabeta(child, banked - beta, banked - alpha)
+
+            if value > best:
+                best = value
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+
+        if len(table) >= self.max_entries:
+            self.shrink()
+
+        if best <= window_alpha:
+            upper = min(upper, best)
+
+        elif best >= beta:
+            lower = max(lower, best)
+
+        else:
+            lower = upper = best
+
+        table[position] = (lower, upper)
+        return best
@@ -0,0 +1,97 @@
+import argparse
+import sys
+
+from mancala.tournament.pairing import SCHEDULERS
+from mancala.tournament.rating import RATING_SYSTEMS
+from mancala.tournament.registry import AgentRegistry, default_registry
+from mancala.tournament.runner import Tournament, build_scheduler
+
+
+def main():
+    # Setup argument parser
+    parser = argparse.ArgumentParser(description="Run a Mancala agent tournament")
+    parser.add_argument(
+        "--agents",
+        nargs="+",
+        default=None,
+        help="Registered agents to enter (default: all built-in agents)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(SCHEDULERS),
+        default="round-robin",
+        help="Pairing format",
+    )
+    parser.add_argument("--rounds", type=int, default=10, help="Number of rounds")
+    parser.add_argument(
+        "--games-per-pairing",
+        type=int,
+        default=2,
+        help="Games per pairing per round (colours alternate)",
+    )
+    parser.add_argument(
+        "--rating", choices=sorted(RATING_SYSTEMS), default="elo", help="Rating system"
+    )
+    parser.add_argument(
+        "--opening-plies",
+        type=int,
+        default=2,
+        help="Random plies before agents take over",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Tournament seed")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (0 runs in-process)"
+    )
+    parser.add_argument(
+        "--checkpoint", default=None, help="Checkpoint file; resumes if it exists"
+    )
+    parser.add_argument(
+        "--checkpoint-every", type=int, default=10_000, help="Games between checkpoints"
+    )
+
+    args = parser.parse_args()
+
+    available = default_registry()
+    unknown = sorted(set(args.agents or []) - set(available.names()))
+    if unknown:
+        parser.error(
+            f"unknown agents {', '.join(unknown)} "
+            f"(choose from {', '.join(available.names())})"
+        )
+
+    registry = AgentRegistry()
+    for name in args.agents or available.names():
+        spec = available.get(name)
+        registry.register(spec.name, spec.factory, **spec.kwargs)
+
+    try:
+        tournament = Tournament(
+            registry=registry,
+            scheduler=build_scheduler(args.format),
+            ratings=RATING_SYSTEMS[args.rating](),
+            rounds=args.rounds,
+            games_per_pairing=args.games_per_pairing,
+            opening_plies=args.opening_plies,
+            seed=args.seed,
+            checkpoint_path=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            workers=args.workers,
+        )
+
+    except ValueError as exc:
+        # Flags that disagree with the checkpoint being resumed
+        parser.error(str(exc))
+    tournament.run()
+
+    print(f"{'Agent':<20} {'Rating':>8} {'Score':>10} {'Games':>8}")
+    for name, rating, score, games in tournament.standings():
+        print(f"{name:<20} {rating:>8.1f} {score:>10.1f} {games:>8}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+
+    except KeyboardInterrupt:
+        print("\nTournament interrupted; rerun with the same --checkpoint to resume.")
+        sys.exit(1)
@@ -0,0 +1,96 @@
+from typing import Protocol
+
+
+class PairingScheduler(Protocol):
+    def pairings(
+        self,
+        round_index: int,
+        players: list[str],
+        scores: dict[str, float],
+        ratings: dict[str, float],
+        history: set[frozenset[str]],
+        byes: dict[str, int],
+    ) -> list[tuple[str, str]]: ...
+
+
+class RoundRobinScheduler:
+    """Circle-method round robin; every player meets every other once per cycle"""
+
+    name = "round-robin"
+
+    def pairings(
+        self,
+        round_index: int,
+        players: list[str],
+        scores: dict[str, float],
+        ratings: dict[str, float],
+        history: set[frozenset[str]],
+        byes: dict[str, int],
+    ) -> list[tuple[str, str]]:
+        entrants: list[str | None] = list(players)
+        if len(entrants) % 2:
+            entrants.append(None)  # Bye
+
+        size = len(entrants)
+        rotation = round_index % (size - 1)
+
+        # Keep the first entrant fixed and rotate the rest
+        rest = entrants[1:]
+        rest = rest[-rotation:] + rest[:-rotation] if rotation else rest
+        circle = [entrants[0]] + rest
+
+        pairs = []
+        for i in range(size // 2):
+            first, second = circle[i], circle[size - 1 - i]
+            if first is None or second is None:
+                continue
+
+            # Alternate who is listed first so colours even out across cycles
+            pairs.append((first, second) if round_index % 2 == 0 else (second, first))
+
+        return pairs
+
+
+class SwissScheduler:
+    """Pair players with similar scores, avoiding rematches where possible"""
+
+    name = "swiss"
+
+    def pairings(
+        self,
+        round_index: int,
+        players: list[str],
+        scores: dict[str, float],
+        ratings: dict[str, float],
+        history: set[frozenset[str]],
+        byes: dict[str, int],
+    ) -> list[tuple[str, str]]:
+        ranked = sorted(
+            players, key=lambda p: (-scores.get(p, 0.0), -ratings.get(p, 0.0), p)
+        )
+
+        # The bye goes to the lowest ranked player with the fewest byes so far
+        if len(ranked) % 2:
+            fewest = min(byes.get(p, 0) for p in ranked)
+            bye = next(p for p in reversed(ranked) if byes.get(p, 0) == fewest)
+            ranked.remove(bye)
+
+        pairs = []
+        unpaired = ranked
+        while unpaired:
+            player = unpaired[0]
+            candidates = unpaired[1:]
+            opponent = next(
+                (c for c in candidates if frozenset((player, c)) not in history),
+                candidates[0],
+            )
+            pairs.append((player, opponent))
+            unpaired = [p for p in candidates if p != opponent]
+
+        return pairs
+
+
+SCHEDULERS: dict[str, type[RoundRobinScheduler] | type[SwissScheduler]] = {
+    RoundRobinScheduler.name: RoundRobinScheduler,
+    SwissScheduler.name: SwissScheduler,
+}
@@ -0,0 +1,151 @@
+import math
+from typing import Any
+
+
+class RatingSystem:
+    """Base class for incremental, per-game rating updates"""
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.ratings: dict[str, float] = {}
+
+    def add_player(self, player: str) -> None:
+        raise NotImplementedError
+
+    def update(self, player_a: str, player_b: str, score_a: float) -> None:
+        """Apply one game result (1 = A won, 0.5 = draw, 0 = B won)"""
+        raise NotImplementedError
+
+    def to_dict(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RatingSystem":
+        raise NotImplementedError
+
+
+class EloRating(RatingSystem):
+    name = "elo"
+
+    def __init__(self, k_factor: float = 16.0, initial: float = 1500.0) -> None:
+        super().__init__()
+        self.k_factor = k_factor
+        self.initial = initial
+
+    def add_player(self, player: str) -> None:
+        self.ratings.setdefault(player, self.initial)
+
+    def expected(self, rating_a: float, rating_b: float) -> float:
+        """Expected score of A against B"""
+        return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+    def update(self, player_a: str, player_b: str, score_a: float) -> None:
+        rating_a = self.ratings[player_a]
+        rating_b = self.ratings[player_b]
+        delta = self.k_factor * (score_a - self.expected(rating_a, rating_b))
+
+        self.ratings[player_a] = rating_a + delta
+        self.ratings[player_b] = rating_b - delta
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "system": self.name,
+            "k_factor": self.k_factor,
+            "initial": self.initial,
+            "ratings": self.ratings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EloRating":
+        system = cls(k_factor=data["k_factor"], initial=data["initial"])
+        system.ratings = dict(data["ratings"])
+        return system
+
+
+class GlickoRating(RatingSystem):
+    """Glicko-1, treating every game as its own rating period"""
+
+    name = "glicko"
+
+    Q = math.log(10) / 400.0
+
+    def __init__(
+        self,
+        initial: float = 1500.0,
+        initial_deviation: float = 350.0,
+        min_deviation: float = 30.0,
+    ) -> None:
+        super().__init__()
+        self.initial = initial
+        self.initial_deviation = initial_deviation
+        self.min_deviation = min_deviation
+        self.deviations: dict[str, float] = {}
+
+    def add_player(self, player: str) -> None:
+        self.ratings.setdefault(player, self.initial)
+        self.deviations.setdefault(player, self.initial_deviation)
+
+    def _g(self, deviation: float) -> float:
+        return 1.0 / math.sqrt(1.0 + 3.0 * (self.Q * deviation) ** 2 / math.pi**2)
+
+    def _rate(
+        self,
+        rating: float,
+        deviation: float,
+        opp_rating: float,
+        opp_dev: float,
+        score: float,
+    ) -> tuple[float, float]:
+        g = self._g(opp_dev)
+        expected = 1.0 / (1.0 + 10 ** (-g * (rating - opp_rating) / 400.0))
+        d_squared = 1.0 / (self.Q**2 * g**2 * expected * (1.0 - expected))
+        precision = 1.0 / deviation**2 + 1.0 / d_squared
+
+        new_rating = rating + self.Q / precision * g * (score - expected)
+        new_deviation = max(self.min_deviation, math.sqrt(1.0 / precision))
+        return new_rating, new_deviation
+
+    def update(self, player_a: str, player_b: str, score_a: float) -> None:
+        rating_a, dev_a = self.ratings[player_a], self.deviations[player_a]
+        rating_b, dev_b = self.ratings[player_b], self.deviations[player_b]
+
+        # Both sides are rated against the pre-game values of the other
+        self.ratings[player_a], self.deviations[player_a] = self._rate(
+            rating_a, dev_a, rating_b, dev_b, score_a
+        )
+        self.ratings[player_b], self.deviations[player_b] = self._rate(
+            rating_b, dev_b, rating_a, dev_a, 1.0 - score_a
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "system": self.name,
+            "initial": self.initial,
+            "initial_deviation": self.initial_deviation,
+            "min_deviation": self.min_deviation,
+            "ratings": self.ratings,
+            "deviations": self.deviations,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GlickoRating":
+        system = cls(
+            initial=data["initial"],
+            initial_deviation=data["initial_deviation"],
+            min_deviation=data["min_deviation"],
+        )
+        system.ratings = dict(data["ratings"])
+        system.deviations = dict(data["deviations"])
+        return system
+
+
+RATING_SYSTEMS: dict[str, type[RatingSystem]] = {
+    EloRating.name: EloRating,
+    GlickoRating.name: GlickoRating,
+}
+
+
+def load_rating_system(data: dict[str, Any]) -> RatingSystem:
+    """Rebuild a rating system from its checkpointed form"""
+    return RATING_SYSTEMS[data["system"]].from_dict(data)
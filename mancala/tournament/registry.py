@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Protocol
+
+from mancala.app.models.domain.agent import Agent, RandomAgent
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+
+class MoveChooser(Protocol):
+    def choose_move(self, game: Game) -> int | None: ...
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """A picklable recipe for building an agent inside a worker process"""
+
+    name: str
+    factory: Callable[..., MoveChooser]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def build(self) -> MoveChooser:
+        """Instantiate a fresh agent from this spec"""
+        return self.factory(**self.kwargs)
+
+
+class AgentRegistry:
+    def __init__(self) -> None:
+        self.specs: dict[str, AgentSpec] = {}
+
+    def register(
+        self, name: str, factory: Callable[..., MoveChooser], **kwargs: Any
+    ) -> AgentSpec:
+        """Register an agent implementation under a unique name"""
+        if name in self.specs:
+            raise ValueError(f"Agent {name!r} is already registered")
+
+        spec = AgentSpec(name=name, factory=factory, kwargs=kwargs)
+        self.specs[name] = spec
+        return spec
+
+    def get(self, name: str) -> AgentSpec:
+        if name not in self.specs:
+            raise ValueError(f"Agent {name!r} is not registered")
+
+        return self.specs[name]
+
+    def names(self) -> list[str]:
+        return list(self.specs)
+
+
+def default_registry() -> AgentRegistry:
+    """Build a registry holding the built-in agents"""
+    registry = AgentRegistry()
+    registry.register("baseline", Agent)
+    registry.register("random", RandomAgent)
+    registry.register("search", SearchAgent)
+    return registry
@@ -0,0 +1,350 @@
+import json
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from mancala.app.models.domain.game import Game
+from mancala.tournament.pairing import SCHEDULERS, PairingScheduler
+from mancala.tournament.rating import RatingSystem, load_rating_system
+from mancala.tournament.registry import AgentRegistry, AgentSpec, MoveChooser
+
+# Per-process agent instances, built once by the pool initializer
+_worker_specs: dict[str, AgentSpec] = {}
+_worker_agents: dict[str, MoveChooser] = {}
+
+
+@dataclass(frozen=True)
+class MatchTask:
+    white: str
+    black: str
+    seed: int
+    opening_plies: int
+    max_plies: int
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    white: str
+    black: str
+    winner: int | None  # 0 = white, 1 = black, -1 = draw, None = unfinished
+    white_store: int
+    black_store: int
+    plies: int
+
+    @property
+    def white_score(self) -> float:
+        if self.winner == 0:
+            return 1.0
+
+        elif self.winner == 1:
+            return 0.0
+
+        return 0.5
+
+
+def _init_worker(specs: dict[str, AgentSpec]) -> None:
+    _worker_specs.clear()
+    _worker_specs.update(specs)
+    _worker_agents.clear()
+
+
+def _get_agent(name: str) -> MoveChooser:
+    if name not in _worker_agents:
+        _worker_agents[name] = _worker_specs[name].build()
+
+    return _worker_agents[name]
+
+
+def play_match(task: MatchTask) -> MatchResult:
+    """Play a single headless game between two registered agents"""
+    game = Game()
+    agents = (_get_agent(task.white), _get_agent(task.black))
+    rng = random.Random(task.seed)
+    plies = 0
+
+    # Randomised opening plies keep deterministic agents from replaying one game
+    while not game.game_over and plies < task.max_plies:
+        if plies < task.opening_plies:
+            valid_moves = list(game.board.legal_moves(game.current_player))
+            move = rng.choice(valid_moves) if valid_moves else None
+        else:
+            move = agents[game.current_player].choose_move(game)
+
+        if move is None:
+            break
+
+        success, _ = game.make_move(move)
+        if not success:
+            break
+
+        plies += 1
+
+    winner = game.board.get_winner() if game.game_over else None
+    return MatchResult(
+        white=task.white,
+        black=task.black,
+        winner=winner,
+        white_store=game.board.get_stones(game.board.get_store_index(0)),
+        black_store=game.board.get_stones(game.board.get_store_index(1)),
+        plies=plies,
+    )
+
+
+@dataclass
+class TournamentState:
+    round_index: int = 0
+    next_task: int = 0
+    games_played: int = 0
+    pairings: list[tuple[str, str]] = field(default_factory=list)
+    scores: dict[str, float] = field(default_factory=dict)
+    games: dict[str, int] = field(default_factory=dict)
+    history: set[frozenset[str]] = field(default_factory=set)
+    byes: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "round_index": self.round_index,
+            "next_task": self.next_task,
+            "games_played": self.games_played,
+            "pairings": [list(pair) for pair in self.pairings],
+            "scores": self.scores,
+            "games": self.games,
+            "history": [sorted(pair) for pair in self.history],
+            "byes": self.byes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TournamentState":
+        return cls(
+            round_index=data["round_index"],
+            next_task=data["next_task"],
+            games_played=data["games_played"],
+            pairings=[(a, b) for a, b in data["pairings"]],
+            scores=dict(data["scores"]),
+            games=dict(data["games"]),
+            history={frozenset(pair) for pair in data["history"]},
+            byes=dict(data.get("byes", {})),
+        )
+
+
+class Tournament:
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        scheduler: PairingScheduler,
+        ratings: RatingSystem,
+        rounds: int,
+        games_per_pairing: int = 2,
+        opening_plies: int = 2,
+        max_plies: int = 1000,
+        seed: int = 0,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 10_000,
+        workers: int | None = None,
+        chunksize: int = 64,
+    ) -> None:
+        if len(registry.names()) < 2:
+            raise ValueError("A tournament needs at least two registered agents")
+
+        self.registry = registry
+        self.scheduler = scheduler
+        self.ratings = ratings
+        self.rounds = rounds
+        self.games_per_pairing = games_per_pairing
+        self.opening_plies = opening_plies
+        self.max_plies = max_plies
+        self.seed = seed
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.workers = workers
+        self.chunksize = chunksize
+        self.state = TournamentState()
+
+        players = registry.names()
+        for player in players:
+            self.ratings.add_player(player)
+            self.state.scores.setdefault(player, 0.0)
+            self.state.games.setdefault(player, 0)
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self.load_checkpoint(checkpoint_path)
+
+    def load_checkpoint(self, path: str) -> None:
+        """Restore ratings and progress from a checkpoint file"""
+        with open(path) as f:
+            data = json.load(f)
+
+        if data["scheduler"] != getattr(self.scheduler, "name", None):
+            raise ValueError("Checkpoint was written by a different pairing scheduler")
+
+        missing = set(data["state"]["scores"]) ^ set(self.registry.names())
+        if missing:
+            raise ValueError(
+                f"Checkpoint agents do not match registry: {sorted(missing)}"
+            )
+
+        if data["ratings"]["system"] != self.ratings.name:
+            raise ValueError(
+                f"Checkpoint uses {data['ratings']['system']!r} ratings, "
+                f"not {self.ratings.name!r}"
+            )
+
+        # Changing these mid-tournament would replay different games
+        for key, value in data.get("settings", {}).items():
+            if value != self.settings[key]:
+                raise ValueError(
+                    f"Checkpoint was written with {key}={value!r}, "
+                    f"not {self.settings[key]!r}"
+                )
+
+        self.ratings = load_rating_system(data["ratings"])
+        self.state = TournamentState.from_dict(data["state"])
+
+    def save_checkpoint(self) -> None:
+        """Atomically write the current progress to the checkpoint file"""
+        if not self.checkpoint_path:
+            return
+
+        data = {
+            "scheduler": getattr(self.scheduler, "name", None),
+            "settings": self.settings,
+            "ratings": self.ratings.to_dict(),
+            "state": self.state.to_dict(),
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+
+        os.replace(tmp_path, self.checkpoint_path)
+
+    @property
+    def settings(self) -> dict[str, int]:
+        """Settings a resumed tournament must share with its checkpoint"""
+        return {
+            "games_per_pairing": self.games_per_pairing,
+            "opening_plies": self.opening_plies,
+            "max_plies": self.max_plies,
+            "seed": self.seed,
+        }
+
+    def round_tasks(
+        self, round_index: int, pairings: list[tuple[str, str]]
+    ) -> list[MatchTask]:
+        """Expand a round's pairings into games, swapping colours each game"""
+        tasks = []
+        for pair_index, (first, second) in enumerate(pairings):
+            for game_index in range(self.games_per_pairing):
+                white, black = (
+                    (first, second) if game_index % 2 == 0 else (second, first)
+                )
+
+                # Both colour-swapped games of a pair share the same opening
+                seed = random.Random(
+                    f"{self.seed}:{round_index}:{pair_index}:{game_index // 2}"
+                ).getrandbits(63)
+                tasks.append(
+                    MatchTask(
+                        white=white,
+                        black=black,
+                        seed=seed,
+                        opening_plies=self.opening_plies,
+                        max_plies=self.max_plies,
+                    )
+                )
+
+        return tasks
+
+    def record(self, result: MatchResult) -> None:
+        """Fold a single game result into ratings and standings"""
+        score = result.white_score
+        self.ratings.update(result.white, result.black, score)
+
+        self.state.scores[result.white] += score
+        self.state.scores[result.black] += 1.0 - score
+        self.state.games[result.white] += 1
+        self.state.games[result.black] += 1
+        self.state.games_played += 1
+        self.state.next_task += 1
+
+    def _map(
+        self, executor: Executor | None, tasks: Iterable[MatchTask]
+    ) -> Iterator[MatchResult]:
+        if executor is None:
+            return map(play_match, tasks)
+
+        return executor.map(play_match, tasks, chunksize=self.chunksize)
+
+    def run(self) -> dict[str, float]:
+        """Play all remaining rounds and return the final ratings"""
+        specs = {name: self.registry.get(name) for name in self.registry.names()}
+        executor = None
+        if self.workers != 0:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(specs,)
+            )
+        else:
+            _init_worker(specs)
+
+        try:
+            while self.state.round_index < self.rounds:
+                state = self.state
+
+                # Fix pairings at round start so a resumed round replays them
+                if not state.pairings:
+                    state.pairings = self.scheduler.pairings(
+                        state.round_index,
+                        self.registry.names(),
+                        state.scores,
+                        self.ratings.ratings,
+                        state.history,
+                        state.byes,
+                    )
+
+                tasks = self.round_tasks(state.round_index, state.pairings)
+                while state.next_task < len(tasks):
+                    batch = tasks[
+                        state.next_task : state.next_task + self.checkpoint_every
+                    ]
+                    for result in self._map(executor, batch):
+                        self.record(result)
+
+                    self.save_checkpoint()
+
+                state.history.update(frozenset(pair) for pair in state.pairings)
+                paired = {player for pair in state.pairings for player in pair}
+                for player in self.registry.names():
+                    if player not in paired:
+                        state.byes[player] = state.byes.get(player, 0) + 1
+
+                state.round_index += 1
+                state.next_task = 0
+                state.pairings = []
+                self.save_checkpoint()
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return dict(self.ratings.ratings)
+
+    def standings(self) -> list[tuple[str, float, float, int]]:
+        """Return (agent, rating, score, games) rows sorted by rating"""
+        rows = [
+            (
+                name,
+                self.ratings.ratings[name],
+                self.state.scores[name],
+                self.state.games[name],
+            )
+            for name in self.registry.names()
+        ]
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+
+
+def build_scheduler(name: str) -> PairingScheduler:
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown pairing scheduler {name!r}")
+
+    return SCHEDULERS[name]()
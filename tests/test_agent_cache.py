@@ -0,0 +1,123 @@
+import asyncio
+
+from mancala.app.core.cache import LRUCache
+from mancala.app.models.domain.agent import Agent, RandomAgent
+from mancala.app.models.domain.game import Game
+from mancala.app.services.agent_cache import CachedAgent, load_cache, save_cache
+
+
+class CountingAgent(Agent):
+    """The baseline agent, counting how often it is asked to decide"""
+
+    def __init__(self, config_key: tuple = ("baseline",)) -> None:
+        self.key = config_key
+        self.calls = 0
+
+    @property
+    def config_key(self) -> tuple:
+        return self.key
+
+    def choose_move(self, game: Game) -> int | None:
+        self.calls += 1
+        return super().choose_move(game)
+
+
+class AsyncCountingAgent(CountingAgent):
+    async def choose_move_async(self, game: Game) -> int | None:
+        await asyncio.sleep(0)
+        return self.choose_move(game)
+
+
+def positions(count: int = 8) -> list[Game]:
+    game = Game()
+    games = [game.copy()]
+    agent = Agent()
+    while len(games) < count and not game.game_over:
+        game.make_move(agent.choose_move(game))
+        games.append(game.copy())
+
+    return games
+
+
+def test_each_position_is_decided_once():
+    agent = CountingAgent()
+    cached = CachedAgent(agent)
+    games = positions()
+    first = [cached.choose_move(game) for game in games]
+    again = [cached.choose_move(game.copy()) for game in games]
+
+    assert first == again == [Agent().choose_move(game) for game in games]
+    assert agent.calls == len(games)
+    assert (cached.cache.hits, cached.cache.misses) == (len(games), len(games))
+
+
+def test_agent_settings_and_rulesets_are_kept_apart():
+    cache = LRUCache(maxsize=100)
+    shallow = CountingAgent(("search", 2))
+    deep = CountingAgent(("search", 4))
+    CachedAgent(shallow, cache).choose_move(Game())
+    CachedAgent(deep, cache).choose_move(Game())
+    CachedAgent(deep, cache).choose_move(Game(6, 4))
+
+    assert (shallow.calls, deep.calls) == (1, 2)
+    assert len(cache) == 3
+
+
+def test_uncacheable_agents_pass_straight_through():
+    cached = CachedAgent(RandomAgent(seed=1))
+    reference = RandomAgent(seed=1)
+    moves = [cached.choose_move(Game()) for _ in range(20)]
+
+    assert moves == [reference.choose_move(Game()) for _ in range(20)]
+    assert len(set(moves)) > 1
+    assert len(cached.cache) == 0
+    assert cached.lookup(Game()) is None
+
+
+def test_lookup_never_searches_or_counts_misses():
+    agent = CountingAgent()
+    cached = CachedAgent(agent)
+    game = Game()
+
+    assert cached.lookup(game) is None
+    assert agent.calls == cached.cache.misses == 0
+
+    move = cached.choose_move(game)
+    assert cached.lookup(game) == move
+    assert (agent.calls, cached.cache.hits, cached.cache.misses) == (1, 1, 1)
+
+
+def test_async_choices_share_the_cache():
+    async def scenario():
+        agent = AsyncCountingAgent()
+        cached = CachedAgent(agent)
+        games = positions()
+        first = [await cached.choose_move_async(game) for game in games]
+        assert [cached.choose_move(game) for game in games] == first
+        assert agent.calls == len(games)
+
+    asyncio.run(scenario())
+
+
+def test_saved_caches_warm_a_new_worker(tmp_path):
+    path = str(tmp_path / "agent-cache.json")
+    cached = CachedAgent(CountingAgent())
+    games = positions()
+    moves = [cached.choose_move(game) for game in games]
+    assert save_cache(cached.cache, path) == len(games)
+    assert not (tmp_path / "agent-cache.json.tmp").exists()
+
+    agent = CountingAgent()
+    warm = CachedAgent(agent)
+    assert load_cache(warm.cache, path) == len(games)
+    assert [warm.choose_move(game) for game in games] == moves
+    assert agent.calls == 0
+
+    # Choices saved under other settings are never looked up
+    other = CountingAgent(("baseline", "v2"))
+    stale = CachedAgent(other)
+    load_cache(stale.cache, path)
+    stale.choose_move(games[0])
+    assert other.calls == 1
+
+    assert load_cache(LRUCache(maxsize=10), str(tmp_path / "missing.json")) == 0
@@ -0,0 +1,157 @@
+import asyncio
+import random
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_analysis_service, get_game_service
+from mancala.app.core.cache import LRUCache
+from mancala.app.main import app
+from mancala.app.models.domain.enum import AnalysisStatusEnum, PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.player import Player
+from mancala.app.models.domain.search import SearchAgent
+from mancala.app.services.analysis import AnalysisService
+from mancala.app.services.game import AsyncGameService
+
+
+def test_cache_evicts_the_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # Peeking neither counts nor refreshes
+    assert cache.peek("a") == 1
+    cache.put("d", 4)
+    assert "a" not in cache
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def random_moves(pits: int, stones: int, count: int, seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    game = Game(pits, stones)
+    moves = []
+    while len(moves) < count and not game.game_over:
+        moves.append(rng.choice(list(game.board.legal_moves(game.current_player))))
+        game.make_move(moves[-1])
+
+    return moves
+
+
+@pytest.mark.parametrize("pits, stones", [(6, 6), (8, 4), (4, 3)])
+def test_annotates_every_ply_and_reuses_positions(pits, stones):
+    async def scenario():
+        service = AnalysisService(SearchAgent(depth=2))
+        moves = random_moves(pits, stones, 12)
+        first = await service.analyse_moves(moves, pits=pits, stones=stones)
+
+        assert [annotation.ply for annotation in first] == list(range(len(moves)))
+        for annotation in first:
+            assert 1 <= annotation.pit <= pits
+            assert annotation.loss >= 0
+            assert annotation.loss == annotation.best_value - annotation.value
+            if annotation.pit == annotation.best_pit:
+                assert annotation.loss == 0
+
+        again = await service.analyse_moves(moves, pits=pits, stones=stones)
+        assert all(annotation.cached for annotation in again)
+        assert [a.value for a in again] == [a.value for a in first]
+
+    asyncio.run(scenario())
+
+
+def test_rulesets_do_not_share_cached_positions():
+    async def scenario():
+        service = AnalysisService(SearchAgent(depth=2))
+        await service.analyse_moves([0], pits=6, stones=6)
+        other = await service.analyse_moves([0], pits=6, stones=4)
+        assert not other[0].cached
+
+    asyncio.run(scenario())
+
+
+def test_jobs_report_progress_and_illegal_moves():
+    async def scenario():
+        service = AnalysisService(SearchAgent(depth=2))
+        moves = random_moves(6, 6, 6)
+        job = service.submit(uuid4(), moves)
+        bad = service.submit(uuid4(), [0, 0])  # Pit 1 is empty the second time
+        assert service.get_job(job.id) is job
+        await asyncio.gather(*service.tasks)
+
+        assert job.status == AnalysisStatusEnum.DONE
+        assert job.to_response().progress == len(moves)
+        assert bad.status == AnalysisStatusEnum.FAILED
+        assert bad.error == "Illegal move 0 at ply 1"
+        assert len(bad.moves) == 1
+
+        with pytest.raises(ValueError):
+            service.get_job(uuid4())
+
+    asyncio.run(scenario())
+
+
+def test_only_finished_jobs_are_evicted():
+    async def scenario():
+        service = AnalysisService(SearchAgent(depth=1), max_jobs=2)
+        first = service.submit(uuid4(), [0])
+        second = service.submit(uuid4(), [0])
+        # Nothing has finished yet, so the limit is exceeded rather than lose work
+        third = service.submit(uuid4(), [0])
+        assert list(service.jobs) == [first.id, second.id, third.id]
+
+        await asyncio.gather(*service.tasks)
+        fourth = service.submit(uuid4(), [0])
+        assert list(service.jobs) == [third.id, fourth.id]
+        await asyncio.gather(*service.tasks)
+
+    asyncio.run(scenario())
+
+
+def test_analysis_runs_through_the_api():
+    games = AsyncGameService()
+    analysis = AnalysisService(SearchAgent(depth=2))
+    app.dependency_overrides[get_game_service] = lambda: games
+    app.dependency_overrides[get_analysis_service] = lambda: analysis
+
+    async def finish():
+        await asyncio.gather(*analysis.tasks)
+
+    human = Player("alice", PlayerTypeEnum.HUMAN)
+    try:
+        with TestClient(app) as client:
+            game_id = client.portal.call(games.create, human, human)
+            for pit in (3, 1, 2):
+                client.portal.call(games.make_move, game_id, pit)
+
+            response = client.post(f"/api/v1/games/{game_id}/analysis")
+            assert response.status_code == 202
+            job = response.json()
+            assert job["total"] == 3
+
+            client.portal.call(finish)
+            url = f"/api/v1/games/{game_id}/analysis/{job['job_id']}"
+            done = client.get(url).json()
+            assert done["status"] == AnalysisStatusEnum.DONE.value
+            assert done["progress"] == 3
+            assert [move["pit"] for move in done["moves"]] == [3, 1, 2]
+
+            other = f"/api/v1/games/{uuid4()}/analysis/{job['job_id']}"
+            assert client.get(other).status_code == 404
+            missing = client.post(f"/api/v1/games/{uuid4()}/analysis")
+            assert missing.status_code == 404
+
+    finally:
+        app.dependency_overrides.clear()
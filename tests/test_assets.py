@@ -0,0 +1,126 @@
+import os
+import pickle
+
+import pytest
+
+from mancala.app.core.assets import SharedAsset, current_version, publish
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_version(directory, text: str) -> str:
+    directory.mkdir(exist_ok=True)
+    (directory / "value.txt").write_text(text)
+    return str(directory)
+
+
+def read_version(directory: str) -> str:
+    with open(os.path.join(directory, "value.txt")) as f:
+        return f.read()
+
+
+def test_publishing_switches_versions_and_prunes_old_ones(tmp_path):
+    root = str(tmp_path / "assets")
+    assert current_version(root, "evaluator") is None
+
+    versions = [
+        publish(root, "evaluator", write_version(tmp_path / "new", str(i)), keep=2)
+        for i in range(4)
+    ]
+    assert current_version(root, "evaluator") == versions[-1]
+    assert sorted(os.listdir(os.path.join(root, "evaluator"))) == sorted(
+        ["current", *versions[-2:]]
+    )
+    live = os.path.join(root, "evaluator", "current")
+    assert read_version(live) == "3"
+
+
+def test_shared_assets_pick_up_new_versions_once_per_interval(tmp_path):
+    root = str(tmp_path / "assets")
+    clock = FakeClock()
+    builds = []
+
+    def build(directory: str) -> str:
+        builds.append(directory)
+        return read_version(directory)
+
+    asset = SharedAsset(root, "weights", build, check_interval=5.0, clock=clock)
+    with pytest.raises(ValueError):
+        asset.get()
+
+    first = publish(root, "weights", write_version(tmp_path / "v", "one"))
+    assert asset.get() == "one"
+    assert asset.version == first
+
+    # Held values are untouched by a publish, and it is only seen after the
+    # check interval
+    held = asset.get()
+    publish(root, "weights", write_version(tmp_path / "v", "two"))
+    clock.now = 4.9
+    assert asset.get() == held == "one"
+
+    clock.now = 5.0
+    assert asset.get() == "two"
+    assert held == "one"
+    assert asset.get() == "two"
+    assert len(builds) == 2
+
+
+def test_mapped_weights_match_the_saved_ones(tmp_path):
+    np = pytest.importorskip("numpy")
+    from mancala.learning.model import MLPEvaluator
+
+    model = MLPEvaluator.initialise(seed=3)
+    model.save_arrays(str(tmp_path / "weights"))
+    mapped = MLPEvaluator.load_mapped(str(tmp_path / "weights"))
+
+    assert mapped.params.keys() == model.params.keys()
+    for key, value in model.params.items():
+        # Views onto the mapping, not private copies
+        assert isinstance(mapped.params[key].base, np.memmap)
+        np.testing.assert_array_equal(mapped.params[key], value)
+
+    boards = [list(Game().board.board), [0, 1, 2, 3, 4, 5, 9, 6, 5, 4, 3, 2, 1, 7]]
+    values = mapped.evaluate_batch(boards, [0, 1])
+    assert values == model.evaluate_batch(boards, [0, 1])
+
+    # Mapped weights travel as their path, not their contents
+    restored = pickle.loads(pickle.dumps(mapped))
+    assert len(pickle.dumps(mapped)) < 1000
+    assert restored.evaluate_batch(boards, [0, 1]) == values
+
+
+def test_searches_keep_the_version_they_started_with(tmp_path):
+    pytest.importorskip("numpy")
+    from mancala.learning.model import MLPEvaluator, SharedMLPEvaluator
+
+    root = str(tmp_path / "assets")
+    for seed in (1, 2):
+        MLPEvaluator.initialise(seed=seed).save_arrays(str(tmp_path / f"seed{seed}"))
+
+    first = publish(root, "evaluator", str(tmp_path / "seed1"))
+    shared = SharedMLPEvaluator(root, check_interval=0.0)
+    agent = SearchAgent(shared, depth=2)
+    assert agent.config_key == ("search", 2, f"mlp@{first}")
+
+    pinned = agent.pinned()
+    game = Game()
+    before = pinned.analyse(game)
+
+    second = publish(root, "evaluator", str(tmp_path / "seed2"))
+    assert agent.config_key == ("search", 2, f"mlp@{second}")
+    assert pinned.config_key == ("search", 2, f"mlp@{first}")
+    assert pinned.analyse(game) == before
+    assert agent.analyse(game) != before
+
+    # Pool workers map the live weights themselves
+    restored = pickle.loads(pickle.dumps(shared))
+    assert restored.name == f"mlp@{second}"
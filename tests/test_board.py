@@ -0,0 +1,130 @@
+import random
+
+import pytest
+
+from mancala.app.models.domain.board import Board
+from mancala.app.models.domain.game import Game
+
+# Small boards, and ones with enough stones to sow whole laps
+RULESETS = [(2, 3), (4, 4), (6, 4), (6, 6), (6, 13), (8, 20)]
+
+
+def random_positions(pits: int, stones: int, games: int = 20):
+    """Every position of some random games, before each move"""
+    rng = random.Random(pits * 100 + stones)
+    for _ in range(games):
+        game = Game(pits, stones)
+        while not game.game_over:
+            yield game
+            game.make_move(
+                rng.choice(list(game.board.legal_moves(game.current_player)))
+            )
+
+
+def sow_one_by_one(board: Board, pit: int) -> int:
+    """Sow stone by stone, skipping the opponent's store, returning the last slot"""
+    cells = board.board
+    player = board.get_pit_owner(pit)
+    skipped = board.get_store_index(1 - player)
+    stones, cells[pit] = cells[pit], 0
+    slot = pit
+    while stones:
+        slot = (slot + 1) % len(cells)
+        if slot != skipped:
+            cells[slot] += 1
+            stones -= 1
+
+    return slot
+
+
+@pytest.mark.parametrize("pits, stones", RULESETS)
+def test_legal_moves_are_the_non_empty_pits(pits, stones):
+    for game in random_positions(pits, stones):
+        board = game.board
+        for player in (0, 1):
+            pits_with_stones = [
+                p for p in board.get_player_pits(player) if board.board[p]
+            ]
+            assert list(board.legal_moves(player)) == pits_with_stones
+
+
+@pytest.mark.parametrize("pits, stones", RULESETS)
+def test_predictors_match_sowing(pits, stones):
+    for game in random_positions(pits, stones):
+        board = game.board
+        player = game.current_player
+        for pit in board.legal_moves(player):
+            after = board.copy()
+            last = sow_one_by_one(after, pit)
+
+            assert board.get_landing_pit(pit) == last
+            assert board.lands_in_store(pit) == (last == board.get_store_index(player))
+
+            # A last stone alone on the mover's side takes the opposite pit
+            captured = 0
+            opposite = board.get_opposite_pit_index(last)
+            mine = board.get_pit_owner(last) == player
+            if mine and after.board[last] == 1 and after.board[opposite]:
+                captured = 1 + after.board[opposite]
+
+            assert board.captures(pit) == captured
+
+
+def test_opposite_pits_and_owners():
+    board = Board(4, 4)
+    opposite = [board.get_opposite_pit_index(i) for i in range(10)]
+    assert opposite == [8, 7, 6, 5, None, 3, 2, 1, 0, None]
+
+    owners = [board.get_pit_owner(i) for i in range(11)]
+    assert owners == [0, 0, 0, 0, None, 1, 1, 1, 1, None, None]
+    assert not board.lands_in_store(4)
+    assert board.captures(9) == 0
+
+
+@pytest.mark.parametrize("pits, stones", RULESETS)
+def test_side_totals_follow_every_move(pits, stones):
+    for game in random_positions(pits, stones):
+        board = game.board
+        for player in (0, 1):
+            side = board.get_player_pits(player)
+            assert board.pit_totals[player] == sum(board.board[p] for p in side)
+
+        assert sum(board.board) == 2 * pits * stones
+        assert not board.is_game_over()
+
+
+def test_a_finished_game_sweeps_each_side_into_its_store():
+    game = Game(2, 1)
+    game.board.load([0, 1, 0, 3, 0, 0])
+    assert game.make_move(1)[0]
+
+    # Player 1 emptied their side, so player 2 keeps the stones on theirs
+    assert game.game_over
+    assert list(game.board.board) == [0, 0, 1, 0, 0, 3]
+    assert game.board.pit_totals == [0, 0]
+    assert (game.board.get_score(0), game.board.get_score(1)) == (1, 3)
+    assert game.get_winner() == 1
+
+
+def test_a_capture_that_empties_the_other_side_ends_the_game():
+    game = Game(2, 1)
+    game.board.load([1, 0, 0, 2, 0, 0])
+    assert game.make_move(0)[0]
+
+    assert game.game_over
+    assert list(game.board.board) == [0, 0, 3, 0, 0, 0]
+    assert game.get_winner() == 0
+
+
+def test_set_stones_and_load_keep_totals():
+    board = Board(3, 2)
+    board.set_stones(0, 5)
+    board.set_stones(3, 9)  # A store is not part of either side
+    assert board.pit_totals == [9, 6]
+
+    board.load([0, 0, 0, 4, 1, 0, 0, 1])
+    assert board.pit_totals == [0, 1]
+    assert board.is_game_over()
+
+    with pytest.raises(ValueError):
+        board.load([0] * 7)
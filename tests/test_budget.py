@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.game import Game
+from mancala.app.services.agent_cache import CachedAgent
+from mancala.app.services.budget import BudgetScheduler
+
+
+class GatedAgent(Agent):
+    """Decides like the baseline agent once its gate opens, recording each call"""
+
+    def __init__(self, name: str, gate: asyncio.Event | None = None) -> None:
+        self.name = name
+        self.gate = gate
+        self.calls = 0
+
+    @property
+    def config_key(self) -> tuple:
+        return (self.name,)
+
+    def choose_move(self, game: Game) -> int | None:
+        self.calls += 1
+        return super().choose_move(game)
+
+    async def choose_move_async(self, game: Game) -> int | None:
+        if self.gate is not None:
+            await self.gate.wait()
+
+        return self.choose_move(game)
+
+
+def openings(count: int) -> list[Game]:
+    """Distinct positions, one after each first move"""
+    games = []
+    for pit in range(count):
+        game = Game()
+        game.make_move(pit)
+        games.append(game)
+
+    return games
+
+
+def test_depth_drops_as_work_queues_up():
+    async def scenario():
+        gate = asyncio.Event()
+        strong, weak = GatedAgent("strong", gate), GatedAgent("weak", gate)
+        fallback = GatedAgent("fallback")
+        scheduler = BudgetScheduler(
+            [strong, weak], fallback, target_latency=0.25, costs=[0.1, 0.05]
+        )
+
+        games = openings(5)
+        tasks = [asyncio.create_task(scheduler.choose_move_async(g)) for g in games]
+        await asyncio.sleep(0)
+
+        # 0.1 + 0.1 fit, a third strong search would not but a weak one does
+        assert scheduler.decisions == [2, 1]
+        assert scheduler.backlog == pytest.approx(0.25)
+        assert scheduler.pending == 3
+        assert scheduler.fallbacks == fallback.calls == 2
+
+        gate.set()
+        moves = await asyncio.gather(*tasks)
+        assert moves == [Agent().choose_move(game) for game in games]
+        assert (strong.calls, weak.calls) == (2, 1)
+        assert scheduler.backlog == pytest.approx(0.0)
+        assert scheduler.pending == 0
+
+        stats = scheduler.stats()
+        assert [tier["decisions"] for tier in stats["tiers"]] == [2, 1]
+        assert stats["fallbacks"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_cached_moves_skip_the_queue():
+    async def scenario():
+        gate = asyncio.Event()
+        tier = CachedAgent(GatedAgent("search", gate))
+        fallback = GatedAgent("fallback")
+        scheduler = BudgetScheduler([tier], fallback, costs=[0.2])
+        game, other = openings(2)
+
+        gate.set()
+        move = await scheduler.choose_move_async(game)
+        gate.clear()
+
+        # The budget is now spent, but the known position is answered anyway
+        blocked = asyncio.create_task(scheduler.choose_move_async(other))
+        await asyncio.sleep(0)
+        assert await scheduler.choose_move_async(game.copy()) == move
+        assert scheduler.hits == 1
+        assert scheduler.fallbacks == 0
+        assert (tier.cache.hits, tier.cache.misses) == (1, 2)
+
+        gate.set()
+        await blocked
+
+    asyncio.run(scenario())
+
+
+def test_estimates_follow_measured_costs():
+    class SlowAgent(GatedAgent):
+        async def choose_move_async(self, game: Game) -> int | None:
+            await asyncio.sleep(0.02)
+            return self.choose_move(game)
+
+    async def scenario():
+        scheduler = BudgetScheduler(
+            [SlowAgent("slow")], GatedAgent("fallback"), costs=[1.0], smoothing=0.5
+        )
+        assert scheduler.choose_move(Game()) is not None
+        assert scheduler.fallback.calls == 1
+
+        for game in openings(6):
+            await scheduler.choose_move_async(game)
+
+        # An estimate over the target is never admitted
+        assert scheduler.fallbacks == 6
+        assert scheduler.decisions == [0]
+
+        # Once admitted, measurements pull the estimate toward the real cost
+        scheduler.costs = [0.1]
+        for game in openings(6):
+            await scheduler.choose_move_async(game)
+
+        assert scheduler.decisions == [6]
+        assert 0.015 < scheduler.costs[0] < 0.05
+        assert scheduler.choose_move(Game()) is not None
+        assert scheduler.tiers[0].calls == 7
+
+    asyncio.run(scenario())
+
+
+def test_a_tier_is_required():
+    with pytest.raises(ValueError):
+        BudgetScheduler([], Agent())
@@ -0,0 +1,57 @@
+import io
+import json
+import sys
+
+import pytest
+
+from mancala.cli.main import main, parse_moves
+
+
+def run_cli(monkeypatch, capsys, args: list[str], stdin: str = "") -> list[dict]:
+    monkeypatch.setattr(sys, "argv", ["mancala", *args])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    main()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_parse_moves():
+    assert parse_moves("1, 2 3\n") == [1, 2, 3]
+    assert parse_moves("   \n") is None
+    assert parse_moves("# a comment\n") is None
+
+    with pytest.raises(ValueError):
+        parse_moves("1 two 3")
+
+
+def test_headless_plays_one_game_per_line(monkeypatch, capsys, tmp_path):
+    moves = tmp_path / "moves.txt"
+    moves.write_text("# opening tests\n1\n1 x\n\n9 1\n")
+    records = run_cli(monkeypatch, capsys, ["--headless", "--input", str(moves)])
+
+    assert [record["game"] for record in records] == [0, 1, 2]
+    first, bad, invalid = records
+
+    # Pit 1 lands in the store, so player 1 moves again and runs out of moves
+    assert first["moves"] == [[0, 1]]
+    assert first["status"] == "active"
+    assert sum(first["board"]) == 72
+
+    assert bad == {"error": "Invalid pit number 'x'", "line": 3, "game": 1}
+
+    assert invalid["errors"][0]["pit"] == 9
+    assert invalid["moves"] == [[0, 1]]
+
+
+def test_headless_agent_games_read_no_input(monkeypatch, capsys):
+    records = run_cli(
+        monkeypatch,
+        capsys,
+        ["--headless", "--player1", "agent", "--games", "3"],
+        stdin="ignored\n",
+    )
+
+    assert len(records) == 3
+    for record in records:
+        assert record["status"] == "over"
+        assert sum(record["scores"]) == 72
+        assert record["errors"] == []
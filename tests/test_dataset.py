@@ -0,0 +1,86 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from mancala.learning.dataset import (
+    COLUMNS,
+    Dataset,
+    PositionFilter,
+    generate,
+    position_keys,
+    produce_chunk,
+)
+
+
+def test_chunks_hold_one_row_per_position():
+    chunk = produce_chunk(seed=0, games=3, epsilon=0.2)
+    count = len(chunk["players"])
+
+    assert chunk["boards"].shape == (count, 14)
+    assert all(len(column) == count for column in chunk.values())
+    assert {name: str(column.dtype) for name, column in chunk.items()} == COLUMNS
+
+    # Moves are pits on the mover's side, and the stones are all there
+    assert chunk["moves"].max() < 6
+    assert (chunk["boards"].sum(axis=1) == 72).all()
+    assert set(np.unique(chunk["outcomes"])) <= {-1, 0, 1}
+
+
+def test_filter_reports_each_key_new_once():
+    seen = PositionFilter(capacity=1000)
+    first = seen.add_new(np.array([1, 2, 2, 3], dtype=np.uint64))
+    second = seen.add_new(np.array([3, 4], dtype=np.uint64))
+
+    assert first.tolist() == [True, True, False, True]
+    assert second.tolist() == [False, True]
+    assert seen.count == 4
+    assert 0 < seen.false_positive_rate() < 0.001
+
+
+def test_generated_datasets_are_reproducible_and_extendable(tmp_path):
+    one = str(tmp_path / "one")
+    two = str(tmp_path / "two")
+    generate(one, 12, chunk_games=4, workers=2, dedup=False)
+    generate(two, 12, chunk_games=4, workers=1, dedup=False)
+
+    # The worker count doesn't change which games are played
+    first, second = Dataset(one), Dataset(two)
+    assert len(first) == len(first.boards) == len(first.moves)
+    assert np.array_equal(first.boards, second.boards)
+    assert np.array_equal(first.moves, second.moves)
+
+    # Extending continues the chunk seeds rather than replaying them
+    generate(two, 12, chunk_games=4, workers=1, dedup=False)
+    extended = Dataset(two)
+    assert np.array_equal(extended.boards[: len(first)], first.boards)
+    assert not np.array_equal(
+        extended.boards[len(first) : 2 * len(first)], first.boards[: len(first)]
+    )
+
+
+def test_dedup_keeps_each_position_once(tmp_path):
+    path = str(tmp_path / "data")
+    writer = generate(path, 20, chunk_games=5, workers=1)
+    generate(path, 20, chunk_games=5, workers=1)
+
+    dataset = Dataset(path)
+    keys = position_keys(np.asarray(dataset.boards), np.asarray(dataset.players))
+    assert len(np.unique(keys)) == len(dataset)
+    assert writer.duplicates > 0
+
+
+def test_an_interrupted_chunk_is_dropped(tmp_path):
+    path = str(tmp_path / "data")
+    generate(path, 4, chunk_games=2, workers=1, dedup=False)
+    before = np.array(Dataset(path).boards)
+
+    # Half a row left behind by a run that stopped mid-write
+    with open(tmp_path / "data" / "boards.bin", "ab") as f:
+        f.write(b"\x00" * 5)
+
+    generate(path, 2, chunk_games=2, workers=1, dedup=False)
+    dataset = Dataset(path)
+    assert (tmp_path / "data" / "boards.bin").stat().st_size == len(dataset) * 14
+    assert np.array_equal(dataset.boards[: len(before)], before)
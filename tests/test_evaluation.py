@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from mancala.app.models.domain.evaluation import Evaluator, HeuristicEvaluator
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+pytest.importorskip("numpy")
+
+from mancala.learning.model import MLPEvaluator
+from mancala.learning.selfplay import generate_samples
+from mancala.learning.train import train
+
+
+def positions(count: int = 40, seed: int = 0) -> list[Game]:
+    """Positions from random play, none of them finished"""
+    rng = random.Random(seed)
+    games = []
+    while len(games) < count:
+        game = Game()
+        for _ in range(rng.randrange(1, 30)):
+            moves = list(game.board.legal_moves(game.current_player))
+            game.make_move(rng.choice(moves))
+            if game.game_over:
+                break
+
+        if not game.game_over:
+            games.append(game)
+
+    return games
+
+
+def mirrored(cells: list[int]) -> list[int]:
+    """The same position with the two sides swapped"""
+    half = len(cells) // 2
+    return cells[half:] + cells[:half]
+
+
+@pytest.mark.parametrize("evaluator", [HeuristicEvaluator(), MLPEvaluator.initialise()])
+def test_values_depend_only_on_whose_side_is_whose(evaluator):
+    boards = [list(game.board.board) for game in positions()]
+    players = [game.current_player for game in positions()]
+    values = evaluator.evaluate_batch(boards, players)
+
+    swapped = evaluator.evaluate_batch(
+        [mirrored(board) for board in boards], [1 - player for player in players]
+    )
+    assert swapped == pytest.approx(values, abs=1e-6)
+
+    singles = [
+        evaluator.evaluate(game.board, game.current_player) for game in positions()
+    ]
+    assert singles == pytest.approx(values, abs=1e-6)
+    assert all(-1 <= value <= 1 for value in values)
+
+
+def test_heuristic_is_zero_sum():
+    evaluator = HeuristicEvaluator()
+    for game in positions():
+        board = game.board
+        assert evaluator.evaluate(board, 0) == -evaluator.evaluate(board, 1)
+
+
+def test_saved_weights_give_the_same_values(tmp_path):
+    model = MLPEvaluator.initialise(seed=3)
+    path = str(tmp_path / "model.npz")
+    model.save(path)
+
+    boards = [list(game.board.board) for game in positions()]
+    players = [game.current_player for game in positions()]
+    loaded = MLPEvaluator.load(path)
+    assert loaded.evaluate_batch(boards, players) == model.evaluate_batch(
+        boards, players
+    )
+
+
+def minimax(game: Game, depth: int, root_player: int, evaluator: Evaluator) -> float:
+    """Reference search, evaluating one position at a time"""
+    if game.game_over:
+        winner = game.board.get_winner()
+        return 0.0 if winner == -1 else (1.0 if winner == root_player else -1.0)
+
+    if depth == 0:
+        return evaluator.evaluate(game.board, root_player)
+
+    values = []
+    for pit in game.board.legal_moves(game.current_player):
+        child = game.copy()
+        child.make_move(pit)
+        values.append(minimax(child, depth - 1, root_player, evaluator))
+
+    return max(values) if game.current_player == root_player else min(values)
+
+
+@pytest.mark.parametrize("evaluator", [HeuristicEvaluator(), MLPEvaluator.initialise()])
+def test_batched_search_matches_plain_minimax(evaluator):
+    agent = SearchAgent(evaluator, depth=3)
+    for game in positions(10):
+        player = game.current_player
+        move, value, root_values = agent.analyse(game)
+
+        for pit, child_value in root_values.items():
+            child = game.copy()
+            child.make_move(pit)
+            expected = minimax(child, 2, player, evaluator)
+            assert child_value == pytest.approx(expected, abs=1e-5)
+
+        assert value == pytest.approx(max(root_values.values()))
+        assert root_values[move] == value
+
+
+def test_training_reduces_the_loss():
+    boards, players, outcomes = generate_samples(20, seed=1)
+    model = MLPEvaluator.initialise(seed=1)
+
+    losses = train(model, boards, players, outcomes, epochs=5, seed=1)
+    assert losses[-1] < losses[0]
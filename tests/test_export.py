@@ -0,0 +1,114 @@
+import asyncio
+import io
+import json
+import random
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.main import app
+from mancala.app.models.domain.enum import ExportFormatEnum, PlayerTypeEnum
+from mancala.app.models.domain.player import Player
+from mancala.app.services.export import (
+    BINARY_MAGIC,
+    CURSOR_HEADER,
+    encode_binary,
+    encode_ndjson,
+    read_binary,
+)
+from mancala.app.services.game import AsyncGameService
+
+
+async def play_out(service: AsyncGameService, game_id: UUID, seed: int) -> None:
+    """Play random legal moves until the game is over"""
+    rng = random.Random(seed)
+    while True:
+        game = await service.get(game_id)
+        if game.game_over:
+            return
+
+        player = game.current_player
+        first = game.board.topology.pit_ranges[player].start
+        move = rng.choice(list(game.board.legal_moves(player)))
+        result = await service.make_move(game_id, move - first + 1)
+        assert result.success
+
+
+async def new_game(service: AsyncGameService, name: str = "alice") -> UUID:
+    return await service.create(
+        Player(name, PlayerTypeEnum.HUMAN), Player("bob", PlayerTypeEnum.AGENT)
+    )
+
+
+async def finished(service: AsyncGameService, since=None, until=None, size=2):
+    chunks = service.finished_games(since, until, chunk_size=size)
+    return [game_id async for chunk in chunks for _, game_id, _ in chunk]
+
+
+def test_cursors_pick_up_where_the_last_export_stopped():
+    async def scenario():
+        service = AsyncGameService()
+        games = [await new_game(service) for _ in range(5)]
+        for seed, game_id in enumerate([games[3], games[0], games[4]]):
+            await play_out(service, game_id, seed)
+
+        # Oldest finish first, whatever order the games were created in
+        cursor = service.index.last_key
+        assert await finished(service, until=cursor) == [games[3], games[0], games[4]]
+
+        # A game finishing later is left for the next export, and only it
+        await play_out(service, games[1], 7)
+        assert await finished(service, until=cursor) == [games[3], games[0], games[4]]
+        assert await finished(service, since=cursor) == [games[1]]
+
+        last = service.index.last_key
+        assert await finished(service, since=last) == []
+
+    asyncio.run(scenario())
+
+
+def test_binary_and_ndjson_exports_agree():
+    async def scenario():
+        service = AsyncGameService()
+        games = [await new_game(service, name) for name in ("alice", 'quote"d', "é")]
+        for seed, game_id in enumerate(games):
+            await play_out(service, game_id, seed)
+
+        return [entry async for chunk in service.finished_games() for entry in chunk]
+
+    chunk = asyncio.run(scenario())
+    from_json = [json.loads(line) for line in encode_ndjson(chunk).splitlines()]
+    from_binary = list(read_binary(io.BytesIO(BINARY_MAGIC + encode_binary(chunk))))
+
+    assert from_json == from_binary
+    assert [game["players"][0] for game in from_json] == ["alice", 'quote"d', "é"]
+    for game, (_, _, record) in zip(from_json, chunk):
+        assert game["moves"] == record.moves
+        assert game["agents"] == [False, True]
+        assert sum(game["scores"]) == 2 * 6 * 6
+
+
+def test_export_endpoint_returns_the_next_cursor():
+    service = AsyncGameService()
+    app.dependency_overrides[get_game_service] = lambda: service
+    try:
+        with TestClient(app) as client:
+            game_id = client.portal.call(new_game, service)
+            client.portal.call(play_out, service, game_id, 0)
+
+            response = client.get("/api/v1/export/games")
+            assert response.status_code == 200
+            lines = response.text.splitlines()
+            assert [json.loads(line)["id"] for line in lines] == [str(game_id)]
+
+            cursor = response.headers[CURSOR_HEADER]
+            response = client.get(
+                "/api/v1/export/games",
+                params={"since": cursor, "format": ExportFormatEnum.BINARY.value},
+            )
+            assert list(read_binary(io.BytesIO(response.content))) == []
+            assert response.headers[CURSOR_HEADER] == cursor
+
+    finally:
+        app.dependency_overrides.clear()
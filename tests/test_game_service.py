@@ -0,0 +1,119 @@
+import asyncio
+from uuid import UUID, uuid4
+
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.main import app
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.player import Player
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.storage import GameRecord, InMemoryGameStore
+
+HUMAN = Player("alice", PlayerTypeEnum.HUMAN)
+AGENT = Player("bot", PlayerTypeEnum.AGENT)
+
+
+def copy(record: GameRecord) -> GameRecord:
+    return GameRecord(
+        record.game.copy(),
+        record.player_types,
+        list(record.moves),
+        record.player_names,
+    )
+
+
+class RemoteStore(InMemoryGameStore):
+    """Hands out copies and yields to the event loop on every call"""
+
+    async def get(self, game_id: UUID) -> GameRecord | None:
+        await asyncio.sleep(0)
+        record = await super().get(game_id)
+        return None if record is None else copy(record)
+
+    async def put(self, game_id: UUID, record: GameRecord) -> None:
+        await asyncio.sleep(0)
+        await super().put(game_id, copy(record))
+
+
+class AsyncOnlyAgent:
+    """An agent that can only be awaited, counting its calls"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def choose_move_async(self, game: Game) -> int | None:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return Agent().choose_move(game)
+
+
+def test_moves_on_one_game_are_serialised():
+    async def scenario():
+        service = AsyncGameService(store=RemoteStore())
+        game_id = await service.create(HUMAN, HUMAN)
+
+        # Pit 1 lands in the store, so player 1 tries it twice; only one can sow
+        results = await asyncio.gather(
+            service.make_move(game_id, 1), service.make_move(game_id, 1)
+        )
+        assert sorted(result.success for result in results) == [False, True]
+
+        record = await service.get_record(game_id)
+        assert record.moves == [0]
+        assert sum(record.game.board.board) == 72
+
+    asyncio.run(scenario())
+
+
+def test_agents_move_until_it_is_a_humans_turn():
+    async def scenario():
+        agent = AsyncOnlyAgent()
+        service = AsyncGameService(agent=agent)
+        game_id = await service.create(HUMAN, AGENT)
+
+        result = await service.make_move(game_id, 3)
+        assert result.success and not result.extra_turn
+
+        results = await service.execute_agent_moves(game_id)
+        game = await service.get(game_id)
+        assert agent.calls == len(results) >= 1
+        assert game.game_over or game.current_player == 0
+        assert all(r.extra_turn for r in results[:-1])
+
+        # Nothing to do on the human's turn
+        assert await service.execute_agent_moves(game_id) == []
+        assert await service.get_agent_move(game_id) is None
+
+    asyncio.run(scenario())
+
+
+def test_games_run_through_the_api():
+    service = AsyncGameService()
+    app.dependency_overrides[get_game_service] = lambda: service
+    try:
+        with TestClient(app) as client:
+            state = client.post("/api/v1/games/", json={"player1_name": "alice"}).json()
+            game_id = state["id"]
+            assert state["current_player"] == 0
+
+            response = client.post(
+                f"/api/v1/games/{game_id}/moves", json={"pit_index": 3}
+            )
+            move = response.json()
+            assert move["success"]
+            assert move["game_state"]["current_player"] == 0
+            assert move["traces"][0]["player_id"] == 0
+            assert {trace["player_id"] for trace in move["traces"][1:]} == {1}
+
+            assert client.get(f"/api/v1/games/{game_id}").json() == move["game_state"]
+
+            missing = client.get(f"/api/v1/games/{uuid4()}")
+            assert missing.status_code == 404
+            moves = f"/api/v1/games/{game_id}/moves"
+            assert client.post(moves, json={"pit_index": 0}).status_code == 422
+
+    finally:
+        app.dependency_overrides.clear()
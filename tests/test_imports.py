@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["mancala.cli.main", "mancala.app.models.domain.game", "mancala.app.services.game"],
+)
+def test_engine_and_cli_do_not_load_pydantic(module):
+    # A fresh interpreter, since this one has long since imported the API
+    code = (
+        f"import sys, {module}; "
+        "print(sorted({'pydantic', 'fastapi'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_move_timestamps_are_taken_per_instance():
+    from mancala.app.models.domain.move import Move
+
+    fields = Move.__dataclass_fields__
+    assert "timestamp" in fields
+    assert fields["timestamp"].default_factory is not None
@@ -0,0 +1,110 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from mancala.app.core.sorted_index import SortedIndex
+from mancala.app.models.domain.enum import GameStatusEnum
+from mancala.app.services.index import GameIndex
+
+
+def random_index(seed: int, operations: int = 2000) -> tuple[SortedIndex, list[int]]:
+    """An index with small chunks after random adds and removes, and its keys"""
+    rng = random.Random(seed)
+    index = SortedIndex(chunk_size=4)
+    keys: set[int] = set()
+    for _ in range(operations):
+        key = rng.randrange(500)
+        if key in keys and rng.random() < 0.4:
+            index.remove(key)
+            keys.discard(key)
+
+        else:
+            index.add(key)
+            keys.add(key)
+
+    return index, sorted(keys)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_a_sorted_list(seed):
+    index, keys = random_index(seed)
+
+    assert len(index) == len(keys)
+    assert list(index.irange()) == keys
+    assert list(index.irange(reverse=True)) == keys[::-1]
+    assert all(key in index for key in keys)
+    assert not any(key in index for key in set(range(500)) - set(keys))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ranges_and_counts(seed):
+    index, keys = random_index(seed)
+    rng = random.Random(seed)
+    for _ in range(200):
+        lo, hi = sorted(rng.randrange(-10, 510) for _ in range(2))
+        expected = [key for key in keys if lo <= key < hi]
+
+        assert list(index.irange(lo, hi)) == expected
+        assert list(index.irange(lo, hi, reverse=True)) == expected[::-1]
+        assert index.count(lo, hi) == len(expected)
+
+    assert index.count() == len(keys)
+    assert list(index.irange(lo=250)) == [key for key in keys if key >= 250]
+    assert list(index.irange(hi=250, reverse=True)) == [
+        key for key in reversed(keys) if key < 250
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_slices_by_rank(seed):
+    index, keys = random_index(seed)
+    rng = random.Random(seed)
+    for _ in range(200):
+        start, stop = sorted(rng.randrange(len(keys) + 5) for _ in range(2))
+
+        assert list(index.islice(start, stop)) == keys[start:stop]
+        assert list(index.islice(start, stop, reverse=True)) == keys[::-1][start:stop]
+
+
+def test_duplicates_and_missing_keys():
+    index = SortedIndex()
+    index.add(3)
+    index.add(3)
+    assert len(index) == 1
+
+    index.discard(4)
+    with pytest.raises(KeyError):
+        index.remove(4)
+
+    index.remove(3)
+    assert len(index) == 0
+    assert list(index.irange()) == []
+    assert list(index.islice(0)) == []
+
+
+def test_game_index_filters_newest_first():
+    index = GameIndex()
+    games = [uuid4() for _ in range(4)]
+    index.add(games[0], ("alice", "bob"), GameStatusEnum.ACTIVE)
+    index.add(games[1], ("bob", "Agent"), GameStatusEnum.ACTIVE)
+    index.add(games[2], ("alice", "Agent"), GameStatusEnum.ACTIVE)
+    index.add(games[3], ("carol", "carol"), GameStatusEnum.ACTIVE)
+    index.update_status(games[0], GameStatusEnum.OVER)
+
+    def ids(player=None, status=None, before=None):
+        pairs, total = index.query(player, status, before=before)
+        return [game_id for _, game_id in pairs], total
+
+    assert ids() == (games[::-1], 4)
+    assert ids("alice") == ([games[2], games[0]], 2)
+    assert ids("bob", GameStatusEnum.ACTIVE) == ([games[1]], 1)
+    assert ids(status=GameStatusEnum.OVER) == ([games[0]], 1)
+    assert ids("carol") == ([games[3]], 1)
+    assert ids("nobody") == ([], 0)
+
+    # Paging on from the second game's key skips it and everything newer
+    assert ids(before=index.keys[games[1]])[0] == [games[0]]
+
+    index.remove(games[2])
+    assert ids("alice") == ([games[0]], 1)
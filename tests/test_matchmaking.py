@@ -0,0 +1,146 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_game_service, get_matchmaker
+from mancala.app.main import app
+from mancala.app.models.domain.enum import GameStatusEnum
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.matchmaking import Matchmaker
+
+
+def test_players_are_paired_with_the_nearest_rating_in_range():
+    async def scenario():
+        matchmaker = Matchmaker(AsyncGameService(), bucket_width=100, max_spread=2)
+        low = await matchmaker.join("low", 1000)
+        high = await matchmaker.join("high", 1600)
+
+        # Three buckets from either, so out of range of both
+        middle = await matchmaker.join("middle", 1300)
+        assert low.status == high.status == middle.status == GameStatusEnum.WAITING
+
+        # One bucket from middle and two from high: the nearer one is taken
+        near = await matchmaker.join("near", 1450)
+        assert (near.game_id, near.player) == (middle.game_id, 1)
+        assert middle.player == 0 and middle.done.is_set()
+        assert high.game_id is None
+        assert matchmaker.queued() == 2
+
+        top = await matchmaker.join("top", 1899)
+        assert top.game_id == high.game_id
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_tickets_are_skipped():
+    async def scenario():
+        matchmaker = Matchmaker(AsyncGameService())
+        waiting = await matchmaker.join("waiting", 1510)
+        cancelled = await matchmaker.join("cancelled", 1200)
+        matchmaker.cancel(cancelled.id)
+        assert cancelled.cancelled and cancelled.done.is_set()
+
+        # The cancelled ticket's bucket is nearer, but only its neighbour is live
+        joined = await matchmaker.join("joined", 1300)
+        assert joined.game_id == waiting.game_id is not None
+        assert (waiting.player, joined.player) == (0, 1)
+        assert cancelled.game_id is None
+        assert matchmaker.queued() == 0
+        assert not matchmaker.queues[(6, 6)]
+
+        with pytest.raises(ValueError):
+            matchmaker.cancel(cancelled.id)
+
+    asyncio.run(scenario())
+
+
+def test_rulesets_are_never_mixed():
+    async def scenario():
+        matchmaker = Matchmaker(AsyncGameService())
+        standard = await matchmaker.join("standard", 1500)
+        small = await matchmaker.join("small", 1500, (8, 4))
+        assert small.status == GameStatusEnum.WAITING
+
+        other = await matchmaker.join("other", 1500, (8, 4))
+        assert other.game_id == small.game_id
+        assert standard.status == GameStatusEnum.WAITING
+
+        game = await matchmaker.games.get(small.game_id)
+        assert (game.board.pits, game.board.stones) == (8, 4)
+
+    asyncio.run(scenario())
+
+
+def test_only_the_latest_matches_are_remembered():
+    async def scenario():
+        matchmaker = Matchmaker(AsyncGameService(), max_matched=4)
+        tickets = [await matchmaker.join(f"p{i}", 1500) for i in range(6)]
+        assert list(matchmaker.matched) == [ticket.id for ticket in tickets[2:]]
+
+        with pytest.raises(ValueError):
+            matchmaker.get_ticket(tickets[0].id)
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def client():
+    games = AsyncGameService()
+    matchmaker = Matchmaker(games)
+    app.dependency_overrides[get_game_service] = lambda: games
+    app.dependency_overrides[get_matchmaker] = lambda: matchmaker
+    try:
+        with TestClient(app) as client:
+            yield client
+
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_matches_are_pushed_to_waiting_clients(client):
+    waiting = client.post("/api/v1/matchmaking/", json={"name": "alice"}).json()
+    ticket_url = f"/api/v1/matchmaking/{waiting['ticket_id']}"
+    assert waiting["status"] == GameStatusEnum.WAITING.value
+
+    with client.websocket_connect(f"{ticket_url}/ws") as websocket:
+        joined = client.post("/api/v1/matchmaking/", json={"name": "bob"}).json()
+        pushed = websocket.receive_json()
+
+    assert pushed["game_id"] == joined["game_id"] is not None
+    assert (pushed["player"], joined["player"]) == (0, 1)
+    assert client.get(ticket_url).json() == pushed
+    assert client.get(f"/api/v1/matchmaking/{uuid4()}").status_code == 404
+
+
+def test_disconnecting_leaves_the_queue(client):
+    waiting = client.post("/api/v1/matchmaking/", json={"name": "alice"}).json()
+    ticket_url = f"/api/v1/matchmaking/{waiting['ticket_id']}"
+
+    with client.websocket_connect(f"{ticket_url}/ws"):
+        pass
+
+    for _ in range(100):
+        if client.get(ticket_url).status_code == 404:
+            break
+
+        client.portal.call(asyncio.sleep, 0.01)
+
+    assert client.get(ticket_url).status_code == 404
+    alone = client.post("/api/v1/matchmaking/", json={"name": "bob"}).json()
+    assert alone["status"] == GameStatusEnum.WAITING.value
+
+
+def test_matched_games_accept_every_pit_of_their_ruleset(client):
+    request = {"name": "alice", "pits": 8, "stones": 4}
+    client.post("/api/v1/matchmaking/", json=request)
+    game_id = client.post("/api/v1/matchmaking/", json=request).json()["game_id"]
+    moves = f"/api/v1/games/{game_id}/moves"
+
+    assert client.post(moves, json={"pit_index": 7}).json()["success"]
+    assert client.post(moves, json={"pit_index": 8}).json()["success"]
+
+    rejected = client.post(moves, json={"pit_index": 9}).json()
+    assert not rejected["success"]
+    assert rejected["message"] == "Pit must be between 1 and 8."
@@ -0,0 +1,52 @@
+import asyncio
+import random
+
+import pytest
+
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.search import SearchAgent
+
+
+def positions(pits: int, stones: int, count: int = 6, seed: int = 0) -> list[Game]:
+    """Positions from the opening to the endgame of one random game"""
+    rng = random.Random(seed)
+    game = Game(pits, stones)
+    played = []
+    while not game.game_over:
+        played.append(game.copy())
+        game.make_move(rng.choice(list(game.board.legal_moves(game.current_player))))
+
+    step = max(1, len(played) // count)
+    return [*played[::step], played[-1]]
+
+
+@pytest.mark.parametrize("pits, stones", [(6, 4), (8, 3)])
+def test_pool_search_matches_one_process(pits, stones):
+    single = SearchAgent(depth=4)
+    pooled = SearchAgent(depth=4, workers=2)
+
+    for game in positions(pits, stones):
+        assert pooled._splits(game)
+        assert pooled.analyse(game) == single.analyse(game)
+
+
+def test_async_pool_search_matches_one_process():
+    async def scenario():
+        single = SearchAgent(depth=3)
+        pooled = SearchAgent(depth=3, workers=2)
+        for game in positions(6, 6, count=4, seed=1):
+            assert await pooled.analyse_async(game) == single.analyse(game)
+
+    asyncio.run(scenario())
+
+
+def test_shallow_and_finished_searches_stay_in_process():
+    pooled = SearchAgent(depth=2, workers=4)
+    game = Game()
+    assert not pooled._splits(game)
+    assert pooled.analyse(game) == SearchAgent(depth=2).analyse(game)
+
+    finished = positions(6, 4)[-1]
+    finished.make_move(next(iter(finished.board.legal_moves(finished.current_player))))
+    assert finished.game_over
+    assert not SearchAgent(depth=4, workers=2)._splits(finished)
@@ -0,0 +1,87 @@
+import pytest
+
+from mancala.app.core.admission import AdmissionControl
+from mancala.app.core.rate_limit import LocalBucketStore, RateLimit, take
+
+LIMIT = RateLimit(rate=2, burst=3)
+
+
+def test_allows_a_burst_then_refills_at_the_rate():
+    state: dict[str, float] = {}
+    assert [take(state, [("a", LIMIT)], 0.0) for _ in range(3)] == [0.0] * 3
+
+    assert take(state, [("a", LIMIT)], 0.0) == pytest.approx(0.5)
+    assert take(state, [("a", LIMIT)], 0.25) == pytest.approx(0.25)
+
+    # One token back every half second
+    assert take(state, [("a", LIMIT)], 0.5) == 0.0
+    assert take(state, [("a", LIMIT)], 0.5) > 0
+
+
+def test_buckets_are_independent():
+    state: dict[str, float] = {}
+    for _ in range(3):
+        take(state, [("a", LIMIT)], 0.0)
+
+    assert take(state, [("a", LIMIT)], 0.0) > 0
+    assert take(state, [("b", LIMIT)], 0.0) == 0.0
+
+
+def test_idle_buckets_refill_only_to_the_burst():
+    state: dict[str, float] = {}
+    take(state, [("a", LIMIT)], 0.0)
+
+    allowed = [take(state, [("a", LIMIT)], 100.0) for _ in range(4)]
+    assert allowed[:3] == [0.0] * 3
+    assert allowed[3] > 0
+
+
+def test_a_rejected_request_charges_no_bucket():
+    state: dict[str, float] = {}
+    tight = RateLimit(rate=1, burst=1)
+    take(state, [("tight", tight)], 0.0)
+
+    assert take(state, [("loose", LIMIT), ("tight", tight)], 0.0) == 1.0
+    assert "loose" not in state
+
+    # The longest wait of all the buckets is reported
+    assert take(state, [("tight", tight), ("loose", LIMIT)], 0.5) == 0.5
+
+
+def test_local_store_prunes_refilled_buckets_first():
+    now = [0.0]
+    store = LocalBucketStore(max_keys=4, clock=lambda: now[0])
+    for key in "abc":
+        store.take([(key, LIMIT)])
+
+    now[0] = 0.4
+    store.take([("d", LIMIT)])
+    now[0] = 0.6
+    assert store.prune() == 3
+    assert list(store.state) == ["d"]
+
+
+def scope(path: str, method: str = "POST", client: str = "1.2.3.4") -> dict:
+    return {"type": "http", "method": method, "path": path, "client": (client, 0)}
+
+
+def test_admission_charges_clients_and_games_separately():
+    control = AdmissionControl(app=None, client_limit=RateLimit(100, 100))
+    moves = "/api/v1/games/{}/moves"
+
+    # The moves bucket is per game, shared by everyone playing it
+    waits = [control.check(scope(moves.format("g1"))) for _ in range(21)]
+    assert waits[:20] == [0.0] * 20
+    assert waits[20] > 0
+    assert control.check(scope(moves.format("g1"), client="5.6.7.8")) > 0
+    assert control.check(scope(moves.format("g2"))) == 0.0
+
+    # Creating a game is limited per client however it is created
+    creates = ["/api/v1/games", "/api/v1/matchmaking"] * 11
+    waits = [control.check(scope(path)) for path in creates]
+    assert waits[:20] == [0.0] * 20
+    assert waits[20] > 0
+    assert control.check(scope("/api/v1/games", client="5.6.7.8")) == 0.0
+
+    # Reads fall only under the client limit
+    assert control.check(scope("/api/v1/games", method="GET")) == 0.0
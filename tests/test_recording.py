@@ -0,0 +1,114 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.core.recording import TrafficRecorder, response_ids
+from mancala.app.main import app
+from mancala.app.services.game import AsyncGameService
+from mancala.loadtest.replay import (
+    Event,
+    Replayer,
+    build_sessions,
+    load_recording,
+    percentile,
+)
+
+
+@pytest.fixture
+def games():
+    service = AsyncGameService()
+    app.dependency_overrides[get_game_service] = lambda: service
+    try:
+        yield service
+
+    finally:
+        app.dependency_overrides.clear()
+
+
+def record(path: str) -> list[str]:
+    """Play two interleaved games through the recorder, returning their IDs"""
+    with TestClient(TrafficRecorder(app, path)) as client:
+        first = client.post("/api/v1/games/", json={"player1_name": "alice"})
+        second = client.post("/api/v1/games/", json={"player1_name": "bob"})
+        ids = [first.json()["id"], second.json()["id"]]
+
+        for pit in (3, 1):
+            for game_id in ids:
+                client.post(f"/api/v1/games/{game_id}/moves", json={"pit_index": pit})
+
+        client.get(f"/api/v1/games/{ids[0]}")
+        client.get("/api/v1/games/not-a-uuid")
+
+    return ids
+
+
+def test_recordings_keep_requests_and_issued_ids(tmp_path, games):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    ids = record(path)
+
+    with gzip.open(path, "rt") as f:
+        header = json.loads(f.readline())
+    assert header["version"] == 1
+
+    events = load_recording(path)
+    assert len(events) == 8
+    assert [event.offset for event in events] == sorted(e.offset for e in events)
+    assert [event.ids for event in events[:2]] == [[ids[0]], [ids[1]]]
+    assert events[0].body == {"player1_name": "alice"}
+    assert events[2].path == f"/api/v1/games/{ids[0]}/moves"
+    assert events[2].route == "POST /api/v1/games/{id}/moves"
+    assert events[-1].status == 422
+    assert all(event.latency_ms >= 0 for event in events)
+
+
+def test_sessions_group_requests_by_game(tmp_path, games):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    ids = record(path)
+    sessions = build_sessions(load_recording(path))
+
+    assert [len(session) for session in sessions] == [4, 3, 1]
+    for game_id, session in zip(ids, sessions):
+        assert session[0].ids == [game_id]
+        assert all(game_id in event.path for event in session[1:])
+
+
+def test_replays_map_recorded_games_onto_new_ones(tmp_path, games):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    record(path)
+    events = load_recording(path)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://replay"
+        ) as client:
+            return await Replayer(client, speed=0, concurrency=2).run(events)
+
+    # Fresh games get fresh IDs, so the moves only succeed if they are mapped
+    replayed = AsyncGameService()
+    app.dependency_overrides[get_game_service] = lambda: replayed
+    report = asyncio.run(scenario())
+
+    assert sum(stats.count for stats in report.routes.values()) == len(events)
+    assert all(stats.mismatches == 0 for stats in report.routes.values())
+    assert all(stats.errors == 0 for stats in report.routes.values())
+    assert len(replayed.store.records) == 2
+    assert report.lines()[-1].startswith("8 requests")
+
+
+def test_percentiles_and_response_ids():
+    assert percentile([], 50) == 0.0
+    values = [float(i) for i in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 99)) == (50.0, 99.0)
+    assert percentile([3.0, 1.0, 2.0], 100) == 3.0
+
+    assert response_ids({"job_id": "b", "id": "a", "other": "c"}) == ["a", "b"]
+    assert response_ids([{"id": "a"}]) == []
+
+    event = Event(0.0, "GET", "/api/v1/games/", 200, 1.0)
+    assert event.route == "GET /api/v1/games/"
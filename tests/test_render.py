@@ -0,0 +1,120 @@
+import io
+import random
+import re
+
+from mancala.app.models.domain.game import Game
+from mancala.cli.render import TerminalRenderer, board_lines, player_lines
+
+ESCAPE = re.compile(r"\033\[([0-9;]*)([A-Za-z])")
+
+
+class Screen:
+    """Just enough of a terminal to replay what the renderer writes"""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, str] = {}
+        self.row = self.column = 0
+
+    def feed(self, data: str) -> None:
+        position = 0
+        for match in ESCAPE.finditer(data):
+            self.text(data[position : match.start()])
+            position = match.end()
+            args, command = match.groups()
+            if command == "H":
+                row, _ = (args or "1;1").split(";")
+                self.row, self.column = int(row) - 1, 0
+
+            elif command == "J":
+                for row in list(self.rows):
+                    if row > self.row:
+                        del self.rows[row]
+
+                self.rows[self.row] = self.rows.get(self.row, "")[: self.column]
+
+            elif command == "K":
+                self.rows[self.row] = self.rows.get(self.row, "")[: self.column]
+
+        self.text(data[position:])
+
+    def text(self, text: str) -> None:
+        for char in text:
+            if char == "\n":
+                self.row, self.column = self.row + 1, 0
+                continue
+
+            line = self.rows.get(self.row, "").ljust(self.column)
+            self.rows[self.row] = line[: self.column] + char + line[self.column + 1 :]
+            self.column += 1
+
+    def lines(self) -> list[str]:
+        last = max((row for row, line in self.rows.items() if line), default=-1)
+        return [self.rows.get(row, "") for row in range(last + 1)]
+
+
+def plain(lines) -> list[str]:
+    text = ["".join(segment for _, segment in line) for line in lines]
+    while text and not text[-1]:
+        text.pop()
+
+    return text
+
+
+def frames(count: int, seed: int = 0):
+    """Screens of a random game, growing and shrinking as stones pile up"""
+    rng = random.Random(seed)
+    game = Game(6, 12)
+    for _ in range(count):
+        if game.game_over:
+            game = Game(6, 12)
+
+        move = rng.choice(list(game.board.legal_moves(game.current_player)))
+        game.make_move(move)
+        header = player_lines(["alice", "bob"], game.current_player)
+        yield header + board_lines(list(game.board.board), 6, game.current_player, 1)
+
+
+def test_the_screen_always_shows_the_latest_frame():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream)
+    screen = Screen()
+    heights = set()
+
+    for index, lines in enumerate(frames(300)):
+        if index == 150:
+            renderer.reset()
+
+        start = stream.tell()
+        renderer.render(lines)
+        screen.feed(stream.getvalue()[start:])
+
+        assert screen.lines() == plain(lines)
+        heights.add(len(lines))
+
+    assert len(heights) > 1
+
+
+def test_unchanged_lines_are_not_rewritten():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream)
+    first, second = list(frames(2))
+
+    full = renderer.render(first)
+    again = renderer.render(first)
+    changed = renderer.render(second)
+
+    assert again < 20
+    assert again < changed < full
+
+
+def test_without_clearing_frames_follow_one_another():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream, clear=False)
+    first, second = list(frames(2))
+    renderer.render(first)
+    renderer.reset()
+    renderer.render(second)
+
+    assert "\033[H" not in stream.getvalue()
+    assert "\033[J" not in stream.getvalue()
+    assert stream.getvalue().count("\n") == len(first) + len(second)
@@ -0,0 +1,102 @@
+import random
+from functools import cache
+
+import pytest
+
+from mancala.app.models.domain.game import Game
+from mancala.solver.rules import Position, board_index, from_game, moves, start_position
+from mancala.solver.search import Solver
+
+
+def stores(game: Game, player: int) -> tuple[int, int]:
+    """A player's store and their opponent's"""
+    cells = game.board.board
+    indices = game.board.topology.store_indices
+    return cells[indices[player]], cells[indices[1 - player]]
+
+
+# Small boards, and ones with enough stones to sow whole laps
+@pytest.mark.parametrize("pits, stones", [(2, 3), (3, 4), (4, 9), (6, 4), (6, 13)])
+def test_moves_follow_the_engine(pits, stones):
+    rng = random.Random(pits * 100 + stones)
+    for _ in range(30):
+        game = Game(pits, stones)
+        while not game.game_over:
+            position = from_game(game)
+            player = game.current_player
+            solver_moves = {pit: rest for pit, *rest in moves(position)}
+            legal = [board_index(game, pit) for pit in solver_moves]
+            assert legal == list(game.board.legal_moves(player))
+
+            pit = rng.choice(list(solver_moves))
+            banked, child, again = solver_moves[pit]
+            own, other = stores(game, player)
+            assert game.make_move(board_index(game, pit))[0]
+
+            # Gains count net of whatever the opponent sweeps at the end
+            own_after, other_after = stores(game, player)
+            assert banked == (own_after - own) - (other_after - other)
+            if child is None:
+                assert game.game_over
+
+            else:
+                assert not game.game_over
+                assert again == (game.current_player == player)
+                assert child == from_game(game)
+
+
+@cache
+def negamax(position: Position) -> int:
+    """Reference values by exhaustive search"""
+    best = None
+    for _, banked, child, again in moves(position):
+        if child is None:
+            value = banked
+
+        elif again:
+            value = banked + negamax(child)
+
+        else:
+            value = banked - negamax(child)
+
+        best = value if best is None else max(best, value)
+
+    return best
+
+
+@pytest.mark.parametrize("pits, stones", [(2, 2), (2, 4), (3, 2), (3, 3), (4, 2)])
+def test_solver_matches_exhaustive_search(pits, stones):
+    position = start_position(pits, stones)
+    solver = Solver()
+
+    assert solver.solve(position) == negamax(position)
+
+    expected = {}
+    for pit, banked, child, again in moves(position):
+        if child is None:
+            expected[pit] = banked
+
+        else:
+            expected[pit] = banked + (negamax(child) if again else -negamax(child))
+
+    assert solver.best_moves(position) == expected
+
+
+def test_solver_stays_exact_as_its_table_shrinks():
+    position = start_position(3, 3)
+    solver = Solver(max_entries=50)
+
+    assert solver.solve(position) == negamax(position)
+    assert solver.shrinks > 0
+    assert len(solver.table) <= 50
+
+
+def test_known_values_are_reused():
+    position = start_position(3, 3)
+    first = Solver()
+    first.solve(position)
+    known = dict(first.exact(min_stones=6))
+
+    second = Solver(known=known.get, known_stones=6)
+    assert second.solve(position) == negamax(position)
+    assert second.nodes < first.nodes
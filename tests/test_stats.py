@@ -0,0 +1,109 @@
+import asyncio
+import random
+
+from fastapi.testclient import TestClient
+
+from mancala.app.api.dependencies import get_game_service
+from mancala.app.main import app
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.stats import PlayerStats
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.stats import Leaderboard, StatsService
+from mancala.app.services.storage import GameRecord, InMemoryGameStore
+
+HUMAN, AGENT = PlayerTypeEnum.HUMAN, PlayerTypeEnum.AGENT
+
+
+def finished(names, scores, forfeited_by=None, types=(HUMAN, HUMAN)) -> GameRecord:
+    """A finished game with the given store counts"""
+    game = Game()
+    cells = [0] * len(game.board.board)
+    store1, store2 = game.board.topology.store_indices
+    cells[store1], cells[store2] = scores
+    game.board.load(cells)
+    game.game_over = True
+    game.forfeited_by = forfeited_by
+    return GameRecord(game, types, player_names=names)
+
+
+def test_ranks_by_wins_then_margin_then_first_seen():
+    rng = random.Random(0)
+    board = Leaderboard()
+    players = {}
+    for _ in range(2000):
+        name = f"p{rng.randrange(60)}"
+        stats = players.setdefault(name, PlayerStats(name))
+        stats.wins += rng.random() < 0.3
+        stats.margin += rng.randrange(-20, 21)
+        board.update(stats)
+
+    first_seen = {name: i for i, name in enumerate(players)}
+    expected = sorted(
+        players,
+        key=lambda name: (-players[name].wins, -players[name].margin, first_seen[name]),
+    )
+
+    assert board.top(len(players)) == expected
+    assert board.top(10, offset=25) == expected[25:35]
+    assert [board.rank(name) for name in expected] == list(range(1, 61))
+    assert board.rank("nobody") is None
+
+
+def test_records_both_players_once_per_game():
+    async def scenario():
+        store = InMemoryGameStore()
+        stats = StatsService(store)
+        await stats.record(finished(("alice", "bob"), (30, 20)))
+        await stats.record(finished(("bob", "Agent"), (10, 30), 1, (HUMAN, AGENT)))
+        await stats.record(finished(("carol", "alice"), (24, 24)))
+        await stats.record(finished(("carol", "carol"), (40, 8)))  # Self-play
+
+        alice, bob = stats.get("alice"), stats.get("bob")
+        assert (alice.games, alice.wins, alice.draws, alice.margin) == (2, 1, 1, 10)
+        assert (bob.games, bob.wins, bob.losses, bob.margin) == (2, 1, 1, -30)
+        assert (bob.vs_agent.wins, bob.vs_human.losses) == (1, 1)
+        assert stats.get("carol").games == 1
+        assert [p.name for p in stats.top(10)] == ["alice", "bob", "Agent", "carol"]
+
+        # A restart rebuilds the same ranking from the stored totals
+        reloaded = StatsService(store)
+        await reloaded.load()
+        assert [p.name for p in reloaded.top(10)] == [p.name for p in stats.top(10)]
+
+    asyncio.run(scenario())
+
+
+def test_leaderboard_and_player_endpoints():
+    service = AsyncGameService()
+    app.dependency_overrides[get_game_service] = lambda: service
+    try:
+        with TestClient(app) as client:
+            for names, scores in [
+                (("leaderboard", "bob"), (30, 20)),
+                (("bob", "carol"), (40, 10)),
+                (("carol", "leaderboard"), (12, 10)),
+            ]:
+                client.portal.call(service.stats.record, finished(names, scores))
+
+            response = client.get("/api/v1/leaderboard/", params={"size": 2})
+            assert response.status_code == 200
+            page = response.json()
+            assert [item["name"] for item in page["items"]] == ["bob", "leaderboard"]
+            assert [item["rank"] for item in page["items"]] == [1, 2]
+            assert (page["total"], page["pages"]) == (3, 2)
+
+            page = client.get("/api/v1/leaderboard/", params={"page": 2, "size": 2})
+            assert [item["rank"] for item in page.json()["items"]] == [3]
+
+            # A player may be called "leaderboard" without hiding the ranking
+            player = client.get("/api/v1/players/leaderboard").json()
+            assert (player["name"], player["rank"], player["wins"]) == (
+                "leaderboard",
+                2,
+                1,
+            )
+            assert client.get("/api/v1/players/nobody").status_code == 404
+
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,101 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.services.storage import GameRecord, PackedGameStore
+
+HUMAN, AGENT = PlayerTypeEnum.HUMAN, PlayerTypeEnum.AGENT
+
+
+def play(game: Game, moves: list[int]) -> list[int]:
+    for move in moves:
+        assert game.make_move(move)[0]
+
+    return moves
+
+
+def round_trip(store: PackedGameStore, record: GameRecord) -> GameRecord:
+    game_id = uuid4()
+    asyncio.run(store.put(game_id, record))
+    loaded = asyncio.run(store.get(game_id))
+    assert loaded is not None
+    return loaded
+
+
+def assert_same(loaded: GameRecord, record: GameRecord) -> None:
+    assert loaded.game.board.board == record.game.board.board
+    assert (loaded.game.board.pits, loaded.game.board.stones) == (
+        record.game.board.pits,
+        record.game.board.stones,
+    )
+    assert loaded.game.current_player == record.game.current_player
+    assert loaded.game.game_over == record.game.game_over
+    assert loaded.game.forfeited_by == record.game.forfeited_by
+    assert loaded.player_types == record.player_types
+    assert loaded.moves == record.moves
+    assert loaded.player_names == record.player_names
+
+
+def test_round_trips_a_game_in_progress():
+    game = Game()
+    moves = play(game, [2, 8, 3])
+    record = GameRecord(game, (HUMAN, AGENT), moves, ("alice", "Player 2"))
+
+    assert_same(round_trip(PackedGameStore(), record), record)
+
+
+def test_round_trips_a_forfeited_game():
+    game = Game()
+    play(game, [0])
+    game.forfeit(1)
+    record = GameRecord(game, (AGENT, AGENT), [0])
+
+    loaded = round_trip(PackedGameStore(), record)
+    assert_same(loaded, record)
+    assert loaded.game.get_winner() == 0
+
+
+@pytest.mark.parametrize("pits, stones", [(4, 3), (8, 4), (6, 30)])
+def test_round_trips_other_rulesets(pits, stones):
+    game = Game(pits, stones)
+    record = GameRecord(game, (HUMAN, HUMAN), play(game, [1]))
+
+    assert_same(round_trip(PackedGameStore(), record), record)
+
+
+def test_rulesets_share_a_store():
+    store = PackedGameStore()
+    records = [GameRecord(Game(pits, 4), (HUMAN, AGENT)) for pits in (4, 6, 8)]
+    loaded = [round_trip(store, record) for record in records]
+
+    for record, copy in zip(records, loaded):
+        assert_same(copy, record)
+    assert len(store.slabs) == 3
+
+
+def test_put_stores_a_copy_of_the_game():
+    store = PackedGameStore()
+    game_id = uuid4()
+    game = Game()
+    asyncio.run(store.put(game_id, GameRecord(game, (HUMAN, HUMAN))))
+    play(game, [0])
+
+    loaded = asyncio.run(store.get(game_id))
+    assert loaded.game.board.board == Game().board.board
+    assert loaded.moves == []
+
+
+def test_delete_frees_the_row_for_reuse():
+    store = PackedGameStore()
+    first, second = uuid4(), uuid4()
+    asyncio.run(store.put(first, GameRecord(Game(), (HUMAN, HUMAN))))
+    asyncio.run(store.delete(first))
+
+    assert asyncio.run(store.get(first)) is None
+    assert asyncio.run(store.count()) == 0
+
+    asyncio.run(store.put(second, GameRecord(Game(), (HUMAN, HUMAN))))
+    assert len(store.slabs[0].data) == store.slabs[0].width
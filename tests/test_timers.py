@@ -0,0 +1,189 @@
+import asyncio
+import random
+from uuid import UUID, uuid4
+
+import pytest
+
+from mancala.app.core.timers import TimerWheel
+from mancala.app.models.domain.enum import PlayerTypeEnum
+from mancala.app.models.domain.game import Game
+from mancala.app.models.domain.player import Player
+from mancala.app.services.clock import GameTimers, TimeControl
+from mancala.app.services.game import AsyncGameService
+from mancala.app.services.storage import GameRecord, InMemoryGameStore
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fires_each_timer_once_on_its_tick(seed):
+    # Four levels of four slots: deadlines up to 255 ticks away use every level
+    rng = random.Random(seed)
+    wheel = TimerWheel(resolution=1.0, slots=4, levels=4)
+    now = 0
+    due: dict[int, int] = {}
+    fired: dict[int, tuple[int, int]] = {}  # Payload -> (from, to) of its advance
+    cancelled = set()
+    timers = {}
+
+    def advance(to: int) -> None:
+        for expired in wheel.advance(to):
+            assert expired not in fired
+            fired[expired] = (now, to)
+
+    for payload in range(300):
+        if rng.random() < 0.5:
+            step = now + rng.randrange(1, 20)
+            advance(step)
+            now = step
+
+        due[payload] = now + rng.randrange(1, 250)
+        timers[payload] = wheel.schedule(due[payload], payload)
+
+        if rng.random() < 0.1:
+            victim = rng.choice(list(timers))
+            if victim not in fired:
+                wheel.cancel(timers[victim])
+                cancelled.add(victim)
+
+    advance(now + 256)
+
+    assert len(wheel) == 0
+    assert set(fired) == set(due) - cancelled
+    for payload, (start, end) in fired.items():
+        # Fired by the first advance that reached its deadline
+        assert start < due[payload] <= end
+
+
+def test_fires_on_the_first_advance_past_the_deadline():
+    wheel = TimerWheel(resolution=0.5)
+    wheel.schedule(2.2, "a")
+    wheel.schedule(2.5, "b")
+    wheel.schedule(100.0, "c")
+
+    assert wheel.advance(2.0) == []
+    assert sorted(wheel.advance(2.5)) == ["a", "b"]
+    assert wheel.advance(99.9) == []
+    assert wheel.advance(100.0) == ["c"]
+
+
+def test_past_deadlines_fire_on_the_next_tick():
+    wheel = TimerWheel(resolution=1.0, now=10.0)
+    wheel.schedule(3.0, "late")
+
+    assert wheel.advance(10.0) == []
+    assert wheel.advance(11.0) == ["late"]
+
+
+def test_cancel_and_range():
+    wheel = TimerWheel(resolution=1.0, slots=4, levels=2)
+    timer = wheel.schedule(5.0, "x")
+    assert timer.active and len(wheel) == 1
+
+    wheel.cancel(timer)
+    wheel.cancel(timer)
+    assert not timer.active and len(wheel) == 0
+    assert wheel.advance(20.0) == []
+
+    with pytest.raises(ValueError):
+        wheel.schedule(36.0, "too far")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_clock_flags_the_player_to_move():
+    clock = FakeClock()
+    timers = GameTimers(clock=clock, resolution=1.0)
+    game_id = uuid4()
+    game = Game()
+    timers.start(game_id, TimeControl(initial=10.0, increment=2.0))
+
+    clock.now = 4.0
+    game.make_move(0)  # Lands in the store, so player 1 moves again
+    timers.moved(game_id, 0, game)
+    game.make_move(1)
+    timers.moved(game_id, 0, game)
+    assert game.current_player == 1
+    assert timers.remaining(game_id, game) == [10.0, 10.0]
+
+    clock.now = 13.0
+    assert timers.expired() == []
+    assert not timers.flagged(game_id, 1)
+
+    clock.now = 14.0
+    assert timers.expired() == [("clock", game_id)]
+    assert timers.flagged(game_id, 1)
+
+
+def test_idle_deadline_moves_with_activity():
+    clock = FakeClock()
+    timers = GameTimers(idle_timeout=30.0, clock=clock, resolution=1.0)
+    game_id = uuid4()
+    timers.start(game_id)
+
+    clock.now = 20.0
+    timers.touch(game_id)
+    clock.now = 40.0
+    assert timers.expired() == []
+    assert not timers.is_idle(game_id)
+
+    clock.now = 50.0
+    assert timers.expired() == [("idle", game_id)]
+    assert timers.is_idle(game_id)
+
+    timers.stop(game_id)
+    assert not timers.is_idle(game_id)
+    assert len(timers.wheel) == 0
+
+
+class FlakyArchive(InMemoryGameStore):
+    """An archive whose first put fails"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 1
+
+    async def put(self, game_id: UUID, record: GameRecord) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("archive unavailable")
+
+        await super().put(game_id, record)
+
+
+def test_idle_games_are_forfeited_then_archived():
+    async def scenario():
+        clock = FakeClock()
+        archive = FlakyArchive()
+        service = AsyncGameService(idle_timeout=10.0, archive=archive)
+        service.timers = GameTimers(10.0, resolution=1.0, clock=clock)
+        first = await service.create(Player("alice", PlayerTypeEnum.HUMAN))
+        second = await service.create(Player("bob", PlayerTypeEnum.HUMAN))
+
+        # Both players stopped moving, so both lose
+        clock.now = 10.0
+        assert await service.expire() == 2
+        for game_id in (first, second):
+            record = await service.store.get(game_id)
+            assert record.game.forfeited_by == 0
+
+        # The failed archive put leaves its game live and the other archived
+        clock.now = 20.0
+        assert await service.expire() == 2
+        live = [
+            game_id for game_id in (first, second) if game_id in service.store.records
+        ]
+        assert len(live) == 1
+        assert len(archive.records) == 1
+
+        # and is retried after another idle period
+        clock.now = 30.0
+        assert await service.expire() == 1
+        assert set(archive.records) == {first, second}
+        assert await service.store.count() == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,54 @@
+import pytest
+
+from mancala.app.models.domain.board import Board
+from mancala.app.models.domain.topology import get_topology
+from mancala.cli.main import calculate_pit_indices
+
+
+@pytest.mark.parametrize("pits", [1, 4, 6, 8, 12])
+def test_tables_describe_the_board_layout(pits):
+    topology = get_topology(pits)
+    size = 2 * pits + 2
+    assert topology.size == size
+    assert topology.store_indices == (pits, size - 1)
+
+    for player in (0, 1):
+        assert topology.owners[topology.store_indices[player]] is None
+        for index in topology.pit_ranges[player]:
+            assert topology.owners[index] == player
+            opposite = topology.opposite[index]
+            assert topology.owners[opposite] == 1 - player
+            assert topology.opposite[opposite] == index
+
+    assert sum(len(pit_range) for pit_range in topology.pit_ranges) == 2 * pits
+
+
+@pytest.mark.parametrize("pits", [1, 3, 6, 9])
+def test_sowing_follows_next_slot_and_skips_the_opposing_store(pits):
+    topology = get_topology(pits)
+    for player in (0, 1):
+        cycle = topology.sowing_cycles[player]
+        positions = topology.sowing_positions[player]
+        skipped = topology.store_indices[1 - player]
+
+        assert topology.pit_ranges[player][0] == cycle[0]
+        assert sorted(cycle) == [i for i in range(topology.size) if i != skipped]
+        assert positions[skipped] == -1
+        for position, index in enumerate(cycle):
+            assert positions[index] == position
+            following = cycle[(position + 1) % len(cycle)]
+            assert topology.next_slot[player][index] == following
+
+
+def test_boards_share_one_topology_per_pit_count():
+    assert get_topology(6) is get_topology(6)
+    assert Board(6, 4).topology is Board(6, 6).topology is get_topology(6)
+    assert Board(8, 4).topology is not get_topology(6)
+
+    with pytest.raises(ValueError):
+        get_topology(0)
+
+
+def test_cli_reads_the_layout_from_the_topology():
+    assert calculate_pit_indices([0] * 14) == (6, 6, 13)
+    assert calculate_pit_indices([0] * 18) == (8, 8, 17)
@@ -0,0 +1,145 @@
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from mancala.app.models.domain.agent import Agent
+from mancala.app.models.domain.game import Game
+from mancala.tournament.pairing import RoundRobinScheduler, SwissScheduler
+from mancala.tournament.rating import EloRating, GlickoRating, load_rating_system
+from mancala.tournament.registry import AgentRegistry
+from mancala.tournament.runner import Tournament
+
+PLAYERS = ["a", "b", "c", "d", "e"]
+
+
+class LowestPit:
+    def choose_move(self, game: Game) -> int | None:
+        return min(game.board.legal_moves(game.current_player), default=None)
+
+
+class HighestPit:
+    def choose_move(self, game: Game) -> int | None:
+        return max(game.board.legal_moves(game.current_player), default=None)
+
+
+def registry() -> AgentRegistry:
+    registry = AgentRegistry()
+    registry.register("baseline", Agent)
+    registry.register("lowest", LowestPit)
+    registry.register("highest", HighestPit)
+    return registry
+
+
+def test_round_robin_meets_everyone_once_per_cycle():
+    scheduler = RoundRobinScheduler()
+    meetings = Counter()
+    byes = Counter()
+    for round_index in range(len(PLAYERS)):
+        pairs = scheduler.pairings(round_index, PLAYERS, {}, {}, set(), {})
+        paired = [player for pair in pairs for player in pair]
+        assert len(paired) == len(set(paired)) == len(PLAYERS) - 1
+
+        meetings.update(frozenset(pair) for pair in pairs)
+        byes.update(set(PLAYERS) - set(paired))
+
+    assert meetings == Counter(frozenset(pair) for pair in combinations(PLAYERS, 2))
+    assert byes == Counter(PLAYERS)
+
+
+def test_swiss_pairs_by_score_and_avoids_rematches():
+    scheduler = SwissScheduler()
+    scores = {"a": 3, "b": 2, "c": 2, "d": 1, "e": 0}
+
+    assert scheduler.pairings(0, PLAYERS, scores, {}, set(), {}) == [
+        ("a", "b"),
+        ("c", "d"),
+    ]
+
+    history = {frozenset(("a", "b"))}
+    assert scheduler.pairings(0, PLAYERS, scores, {}, history, {}) == [
+        ("a", "c"),
+        ("b", "d"),
+    ]
+
+    # The bye moves up to the lowest ranked player without one yet
+    pairs = scheduler.pairings(0, PLAYERS, scores, {}, set(), {"e": 1})
+    assert "d" not in {player for pair in pairs for player in pair}
+
+
+@pytest.mark.parametrize("system", [EloRating(), GlickoRating()])
+def test_ratings_move_towards_results(system):
+    for player in ("a", "b"):
+        system.add_player(player)
+
+    for _ in range(5):
+        system.update("a", "b", 1.0)
+
+    assert system.ratings["a"] > 1500 > system.ratings["b"]
+
+    restored = load_rating_system(system.to_dict())
+    assert type(restored) is type(system)
+    assert restored.ratings == system.ratings
+
+
+def test_elo_is_zero_sum_and_glicko_gains_confidence():
+    elo = EloRating()
+    glicko = GlickoRating()
+    for system in (elo, glicko):
+        for player in ("a", "b", "c"):
+            system.add_player(player)
+
+        system.update("a", "b", 1.0)
+        system.update("b", "c", 0.5)
+        system.update("c", "a", 0.0)
+
+    assert sum(elo.ratings.values()) == pytest.approx(3 * 1500)
+    assert all(deviation < 350 for deviation in glicko.deviations.values())
+
+
+@pytest.mark.parametrize("scheduler", [RoundRobinScheduler, SwissScheduler])
+def test_resuming_from_a_checkpoint_replays_the_same_tournament(tmp_path, scheduler):
+    def tournament(rounds: int, checkpoint: str | None = None) -> Tournament:
+        return Tournament(
+            registry(),
+            scheduler(),
+            EloRating(),
+            rounds=rounds,
+            checkpoint_path=checkpoint,
+            checkpoint_every=1,
+            workers=0,
+        )
+
+    straight = tournament(6)
+    expected = straight.run()
+
+    checkpoint = str(tmp_path / "checkpoint.json")
+    tournament(3, checkpoint).run()
+    resumed = tournament(6, checkpoint)
+    assert resumed.state.round_index == 3
+
+    assert resumed.run() == expected
+    assert resumed.state.scores == straight.state.scores
+    assert sum(resumed.state.games.values()) == 2 * resumed.state.games_played
+
+
+def test_rejects_a_checkpoint_with_other_settings(tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    Tournament(
+        registry(),
+        SwissScheduler(),
+        EloRating(),
+        1,
+        checkpoint_path=checkpoint,
+        workers=0,
+    ).run()
+
+    with pytest.raises(ValueError, match="seed"):
+        Tournament(
+            registry(),
+            SwissScheduler(),
+            EloRating(),
+            2,
+            seed=1,
+            checkpoint_path=checkpoint,
+        )
@@ -0,0 +1,68 @@
+import io
+import random
+
+import pytest
+
+from mancala.app.models.domain.game import Game
+from mancala.cli import main as cli
+from mancala.cli.render import TerminalRenderer
+
+
+def traced_moves(pits: int, stones: int, games: int = 20):
+    """(board before, trace, game after) for every move of some random games"""
+    rng = random.Random(pits * 100 + stones)
+    for _ in range(games):
+        game = Game(pits, stones)
+        while not game.game_over:
+            before = list(game.board.board)
+            pit = rng.choice(list(game.board.legal_moves(game.current_player)))
+            success, _, trace = game.make_move(pit, trace=True)
+            assert success
+            yield before, trace, game
+
+
+def replay(board: list[int], trace, pits: int) -> list[int]:
+    board = list(board)
+    board[trace.pit_index] = 0
+    for index in trace.path:
+        board[index] += 1
+
+    if trace.capture_pit is not None:
+        store = pits if trace.player_id == 0 else 2 * pits + 1
+        board[store] += trace.captured_stones
+        board[trace.path[-1]] = board[trace.capture_pit] = 0
+
+    return board
+
+
+@pytest.mark.parametrize("pits, stones", [(6, 4), (6, 6), (4, 13)])
+def test_replaying_a_trace_reproduces_the_move(pits, stones):
+    for before, trace, game in traced_moves(pits, stones):
+        assert len(trace.path) == before[trace.pit_index]
+        assert trace.game_over == game.game_over
+        if game.game_over:
+            # The final sweep is not part of the sowing
+            continue
+
+        assert replay(before, trace, pits) == list(game.board.board)
+        assert trace.extra_turn == (game.current_player == trace.player_id)
+
+
+def test_rejected_moves_have_no_trace():
+    game = Game()
+    assert game.make_move(8, trace=True) == (False, "Invalid pit selected.", None)
+    assert game.make_move(0) == (True, "You get another turn!")
+
+
+def test_the_animation_ends_on_the_played_board(monkeypatch, capsys):
+    monkeypatch.setattr(cli.time, "sleep", lambda seconds: None)
+    renderer = TerminalRenderer(io.StringIO())
+
+    for before, trace, game in traced_moves(6, 6, games=3):
+        if game.game_over:
+            continue
+
+        board = cli.display_move_animation(before, trace, 6, renderer=renderer)
+        assert board == list(game.board.board)
+
+    capsys.readouterr()